@@ -0,0 +1,61 @@
+"""Micro-benchmark: four MeTTa queries vs. EducationRAG.topic_profile.
+
+Run from the Agent directory:  python benchmarks/bench_education_rag.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hyperon import MeTTa  # noqa: E402
+from metta import EducationRAG, initialize_education_knowledge  # noqa: E402
+
+TOPICS = ["data structures and algorithms", "frontend development", "backend development", "system design"]
+LEVELS = ["beginner", "intermediate", "advanced"]
+ROUNDS = 20
+
+
+def four_query_path(rag: EducationRAG, topic: str, level: str):
+    subtopics = rag._query("subtopic", topic) + rag._query("subtopic_" + level, topic)
+    resources = rag._query("resource", topic) + rag._query("resource_" + level, topic)
+    return list(dict.fromkeys(subtopics)), list(dict.fromkeys(resources))
+
+
+def main():
+    metta = MeTTa()
+    initialize_education_knowledge(metta)
+    rag = EducationRAG(metta)
+
+    for topic in TOPICS:
+        for level in LEVELS:
+            profile = rag.topic_profile(topic, level)
+            assert (profile["subtopics"], profile["resources"]) == four_query_path(rag, topic, level), (topic, level)
+
+    calls = ROUNDS * len(TOPICS) * len(LEVELS)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for topic in TOPICS:
+            for level in LEVELS:
+                four_query_path(rag, topic, level)
+    legacy = time.perf_counter() - start
+
+    cold_rag = EducationRAG(metta)
+    start = time.perf_counter()
+    cold_rag.topic_profile(TOPICS[0], LEVELS[0])
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for topic in TOPICS:
+            for level in LEVELS:
+                cold_rag.topic_profile(topic, level)
+    warm = time.perf_counter() - start
+
+    print(f"four-query path : {legacy / calls * 1e6:10.1f} us/call ({calls} calls)")
+    print(f"index build     : {cold * 1e6:10.1f} us (once)")
+    print(f"topic_profile   : {warm / calls * 1e6:10.1f} us/call ({calls} calls)")
+
+
+if __name__ == "__main__":
+    main()
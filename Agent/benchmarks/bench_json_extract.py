@@ -0,0 +1,77 @@
+"""Micro-benchmark: character-loop brace balancing vs. llm.extract_json.
+
+Correctness is covered by tests/test_json_extract.py.
+
+Run from the Agent directory:  python benchmarks/bench_json_extract.py
+"""
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm import extract_json  # noqa: E402
+
+ROUNDS = 20
+
+
+def loop_extract(payload: str):
+    """The previous interviewer extractor: fenced regex, then a per-character brace walk."""
+    m = re.search(r"```json\n([\s\S]*?)\n```", payload)
+    if m:
+        return json.loads(m.group(1))
+    s = payload.find("{")
+    if s == -1:
+        return json.loads(payload.strip())
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(s, len(payload)):
+        ch = payload[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return json.loads(payload[s:i + 1])
+    raise ValueError("unmatched braces")
+
+
+def bench(name: str, payload: str):
+    expected = loop_extract(payload)
+    assert extract_json(payload, dict) == expected
+    timings = {}
+    for label, fn in (("char loop", loop_extract), ("extract_json", lambda p: extract_json(p, dict))):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            fn(payload)
+        timings[label] = (time.perf_counter() - start) / ROUNDS * 1000
+    print(
+        f"{name:<28} {len(payload) / 1024:8.0f} KB   char loop {timings['char loop']:8.2f} ms   "
+        f"extract_json {timings['extract_json']:7.2f} ms   x{timings['char loop'] / timings['extract_json']:.1f}"
+    )
+
+
+def main():
+    big = {"questions": [{"q": f"Explain {{topic}} #{i}?", "tags": ["a", "b"], "score": i} for i in range(20000)]}
+    text = json.dumps(big)
+    bench("inline object in prose", f"Here is the payload: {text} -- end")
+    bench("object after long prose", "lorem ipsum " * 50000 + text)
+    bench("pretty-printed object", "Result:\n" + json.dumps(big, indent=2))
+
+
+if __name__ == "__main__":
+    main()
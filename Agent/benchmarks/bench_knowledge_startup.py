@@ -0,0 +1,75 @@
+"""Startup time and peak RSS: per-agent MeTTa spaces vs. the shared knowledge service.
+
+Run from the Agent directory:  python benchmarks/bench_knowledge_startup.py
+Each measurement is a fresh interpreter that builds a RAG and answers one query,
+mirroring what every agent does at import time.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+PORT = 5069
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+from metta import create_resume_rag, create_education_rag
+if sys.argv[1] == "resume":
+    create_resume_rag().normalize_country("Senior engineer based in Bengaluru")
+else:
+    create_education_rag().topic_profile("backend development", "beginner")
+print(json.dumps({"seconds": time.perf_counter() - start,
+                  "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+def measure(kind: str, env: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, kind], cwd=AGENT_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def total(results):
+    return sum(r["seconds"] for r in results), sum(r["rss_mb"] for r in results)
+
+
+def main():
+    # Four agents: two resume (generator, analyzer) and two education (roadmap, interviewer)
+    kinds = ["resume", "resume", "education", "education"]
+    env = {k: v for k, v in os.environ.items() if k != "KNOWLEDGE_SERVICE_URL"}
+    seconds, rss = total([measure(k, env) for k in kinds])
+    print(f"per-agent spaces : {seconds:6.2f} s total startup, {rss:7.1f} MB summed peak RSS")
+
+    service_env = {**env, "KNOWLEDGE_SERVICE_PORT": str(PORT)}
+    start = time.perf_counter()
+    service = subprocess.Popen(
+        [sys.executable, "-m", "metta.service"], cwd=AGENT_DIR, env=service_env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{PORT}/health", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.05)
+        service_seconds = time.perf_counter() - start
+        with open(f"/proc/{service.pid}/status") as status:
+            service_rss = next(int(line.split()[1]) for line in status if line.startswith("VmRSS")) / 1024
+        client_env = {**env, "KNOWLEDGE_SERVICE_URL": f"http://127.0.0.1:{PORT}"}
+        seconds, rss = total([measure(k, client_env) for k in kinds])
+        print(f"shared service   : {service_seconds:6.2f} s service startup, {service_rss:7.1f} MB service RSS")
+        print(f"  + four clients : {seconds:6.2f} s total startup, {rss:7.1f} MB summed peak RSS")
+    finally:
+        service.terminate()
+        service.wait()
+
+
+if __name__ == "__main__":
+    main()
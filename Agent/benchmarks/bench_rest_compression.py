@@ -0,0 +1,105 @@
+"""Benchmark: payload size and serialization time of large REST responses.
+
+Compares what uAgents sends by default (json.dumps with padded separators)
+with rest.encode_body (compact JSON, then gzip or brotli when installed),
+and with a cache_response() hit, which reuses the encoded bytes.
+
+The payloads mirror real responses: a 52-week roadmap, a resume analysis
+with 25 job recommendations carrying full descriptions, and a generated
+resume. Text is sampled from a vocabulary rather than repeated so that
+compression ratios are not flattered.
+
+Run from the Agent directory:  python benchmarks/bench_rest_compression.py
+"""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rest import IdentityMemo, dump_json, encode_body  # noqa: E402
+from rest.compression import brotli  # noqa: E402
+from roadmaps import build_skeleton  # noqa: E402
+
+ROUNDS = 50
+VOCABULARY = (
+    "python data pipeline design scalable services cloud team deliver testing api users performance "
+    "requirements experience engineer build maintain production monitoring review security docker "
+    "kubernetes react typescript sql analytics stakeholders ownership mentoring agile roadmap quality "
+    "latency throughput migration architecture customers growth reliable automation metrics on-call"
+).split()
+
+
+def text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words)).capitalize() + "."
+
+
+def roadmap_payload(rng: random.Random) -> dict:
+    subtopics = [f"{rng.choice(VOCABULARY)} {rng.choice(VOCABULARY)}" for _ in range(12)]
+    roadmap = build_skeleton("machine learning", "intermediate", text(rng, 12), "1year", subtopics, subtopics[:8])
+    for milestone in roadmap["milestones"]:
+        milestone["description"] = text(rng, 25)
+        milestone["tasks"] = [text(rng, 14) for _ in range(5)]
+    return {"roadmap": roadmap, "roadmapId": "0123456789abcdef"}
+
+
+def analysis_payload(rng: random.Random) -> dict:
+    return {"analysis": {
+        "atsScore": 78,
+        "skills": [rng.choice(VOCABULARY) for _ in range(30)],
+        "improvementSuggestions": [
+            {"title": text(rng, 4), "description": text(rng, 30), "section": "Experience", "priority": "medium"}
+            for _ in range(8)
+        ],
+        "jobRecommendations": [
+            {
+                "title": text(rng, 3), "company": text(rng, 2), "location": "Remote",
+                "description": " ".join(text(rng, 20) for _ in range(20)),
+                "url": f"https://jobs.example.com/{rng.randrange(10 ** 9)}", "matchScore": rng.randrange(100),
+            }
+            for _ in range(25)
+        ],
+    }}
+
+
+def resume_payload(rng: random.Random) -> dict:
+    sections = ["SUMMARY", "EXPERIENCE", "SKILLS", "CONTACT", "CERTIFICATIONS"]
+    return {"resume": "\n\n".join(f"{s}\n" + "\n".join(f"- {text(rng, 18)}" for _ in range(12)) for s in sections)}
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def bench(name: str, body: dict):
+    default = json.dumps(body).encode()
+    rows = [("uagents default", len(default), timed(lambda: json.dumps(body).encode()))]
+    rows.append(("compact json", len(dump_json(body)), timed(lambda: encode_body(body, None))))
+    for encoding in ("gzip", "br") if brotli is not None else ("gzip",):
+        data, applied = encode_body(body, encoding)
+        assert applied == encoding
+        rows.append((f"compact + {encoding}", len(data), timed(lambda e=encoding: encode_body(body, e))))
+    memo = IdentityMemo()
+    memo.put(body, encode_body(body, "gzip"), "/endpoint", "gzip")
+    rows.append(("cached hit (gzip)", rows[2][1], timed(lambda: memo.get(body, "/endpoint", "gzip"))))
+    print(name)
+    for label, size, ms in rows:
+        print(f"  {label:<18} {size / 1024:8.1f} KB  ({size / len(default):6.1%})  {ms:8.3f} ms")
+
+
+def main():
+    rng = random.Random(7)
+    if brotli is None:
+        print("brotli not installed; gzip only\n")
+    bench("52-week roadmap", roadmap_payload(rng))
+    bench("analysis with 25 jobs", analysis_payload(rng))
+    bench("generated resume", resume_payload(rng))
+
+
+if __name__ == "__main__":
+    main()
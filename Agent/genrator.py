@@ -2,12 +2,15 @@
 
 from uagents import Agent, Context, Model, Protocol
 import aiohttp
+import base64
 import json
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Literal, Optional, Tuple
 import logging
 import os
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from uuid import uuid4
 from uagents.setup import fund_agent_if_low
@@ -19,8 +22,9 @@ from uagents_core.contrib.protocols.chat import (
     TextContent,
     chat_protocol_spec,
 )
-from hyperon import MeTTa
-from metta import ResumeRAG, initialize_resume_knowledge
+from metta import AsyncRAG, create_resume_rag
+from resumes import MEDIA_TYPES, ExportPool, plan_delta, reorder_skills, swap_bullets
+from rest import add_health_endpoint, cache_response, enable_compression
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -35,29 +39,43 @@ MAX_RETRIES = 3
 RETRY_DELAY = 1000
 resume_cache = {}
 
+# Section mode: each section is its own smaller completion, run concurrently and assembled in this order
+RESUME_SECTIONS = [
+    ("Professional Summary", "A 3-4 sentence summary positioning the candidate for the target role."),
+    ("Experience", "2-3 relevant roles, newest first, each with title, company, dates and 4-6 bullet points quantifying impact."),
+    ("Skills", "Skills grouped by category (e.g. Languages, Frameworks, Tools), the JD's key skills first."),
+    ("Contact Information", "Placeholder name, email, phone, LinkedIn and a city in the location context, one per line."),
+    ("Certifications", "2-4 certifications relevant to the role and its skills, with issuer and year."),
+]
+SECTION_MAX_TOKENS = 2000
+SECTION_RETRIES = 2  # extra attempts for a section on its own (the only retry layer for section calls)
+MAX_PARALLEL_SECTIONS = 5
+# Sections already written for a resume whose other sections failed: cache key -> (stored at, {section: text})
+resume_sections: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+SECTION_CACHE_ENTRIES = 200
+SECTION_CACHE_TTL = 3600  # seconds a partial resume is kept for a retry
+# Tailored mode: profile id -> base resume sections and the role, years and JD skills they were written for
+resume_bases: Dict[str, Dict[str, Any]] = {}
+# Delta rewrites (sections and bullets) kept per profile, keyed by what the delta depends on
+TAILORED_REWRITES = 32
+
+# PDF / DOCX rendering runs in worker processes; rendered files are cached by content hash
+EXPORT_WORKERS = int(os.environ.get("RESUME_EXPORT_WORKERS", 2))
+export_pool = ExportPool(workers=EXPORT_WORKERS)
+
 # Initialize MeTTa RAG for resume tailoring
-metta = MeTTa()
-initialize_resume_knowledge(metta)
-resume_rag = ResumeRAG(metta)
+resume_rag = create_resume_rag()
+rag_worker = AsyncRAG(resume_rag, "resume")
 
 
 def infer_role_location_experience(job_text: str) -> Dict[str, Any]:
     text = (job_text or "").lower()
-    # Primary skill detection (simple keyword scan)
-    skill_keywords: List[str] = [
-        "react", "javascript", "typescript", "node.js", "node", "python", "java", "aws", "sql", "rest api"
-    ]
-    primary_skill = None
-    for kw in skill_keywords:
-        if kw in text:
-            primary_skill = kw
-            break
-    # Map skill to role via RAG
-    mapped_roles = resume_rag.map_skill_to_role(primary_skill) if primary_skill else []
-    role = mapped_roles[0] if mapped_roles else "software engineer"
+    # Weighted role votes from every skill in the JD (word-boundary matched via RAG)
+    ranked_roles = resume_rag.infer_roles(job_text or "")
+    role = ranked_roles[0].role if ranked_roles else "software engineer"
 
     # Location via RAG country normalization
-    location_hint = resume_rag.normalize_country(text) or ""
+    location_hint = resume_rag.normalize_country(job_text or "") or ""
 
     # Years of experience extraction
     years = None
@@ -75,14 +93,26 @@ def infer_role_location_experience(job_text: str) -> Dict[str, Any]:
             years = 3
         elif "senior" in text:
             years = 6
-    return {"role": role, "location": location_hint, "years": years}
+    return {
+        "role": role,
+        "roles": [{"role": r.role, "confidence": round(r.confidence, 2)} for r in ranked_roles[:3]],
+        "skills": list(dict.fromkeys(skill for r in ranked_roles for skill in r.skills)),
+        "location": location_hint,
+        "years": years,
+    }
 
 class ResumeParams(Model):
     jobDescription: str
+    # "sections" writes the sections concurrently; "full" asks for the whole resume in one completion;
+    # "tailored" adapts the profile's base resume to this JD, rewriting only what the JD changes
+    mode: Literal["full", "sections", "tailored"] = "full"
+    profileId: Optional[str] = None
 
     def to_dict(self):
         return {
-            "jobDescription": self.jobDescription
+            "jobDescription": self.jobDescription,
+            "mode": self.mode,
+            "profileId": self.profileId
         }
 
 class ResumeRequest(Model):
@@ -91,6 +121,17 @@ class ResumeRequest(Model):
 class ResumeResponse(Model):
     resume: str
 
+class ResumeExportRequest(Model):
+    resume: str
+    format: Literal["pdf", "docx"] = "pdf"
+
+class ResumeExportResponse(Model):
+    file: Optional[str] = None  # base64
+    mediaType: Optional[str] = None
+    filename: Optional[str] = None
+    digest: Optional[str] = None
+    error: Optional[str] = None
+
 resume_agent = Agent(
     name="resume-agent---",
     port=5052,
@@ -99,6 +140,8 @@ resume_agent = Agent(
     readme_path="README.md",
     seed = "resume-agent-seed-0001"
 )
+enable_compression(resume_agent)
+add_health_endpoint(resume_agent)
 
 # Initialize the chat protocol with the standard chat spec
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -172,6 +215,10 @@ resume_agent.include(chat_proto, publish_manifest=True)
 async def startup_handler(ctx: Context):
     logger.info(f"Starting uAgent with address: {ctx.agent.address}")
 
+@resume_agent.on_event("shutdown")
+async def shutdown_handler(ctx: Context):
+    export_pool.shutdown()
+
 @resume_agent.on_message(model=ResumeRequest, replies=ResumeResponse)
 async def handle_resume_request(ctx: Context, sender: str, msg: ResumeRequest):
     await process_resume_request(ctx, sender, msg.params)
@@ -181,11 +228,263 @@ async def handle_rest_resume_request(ctx: Context, req: ResumeParams) -> Dict[st
     logger.info(f"Received REST POST request with params: {req}")
     try:
         resume = await generate_resume(req)
+        cache_response(resume)
         return {"resume": resume}
     except Exception as e:
         logger.error(f"Error generating resume: {str(e)}", exc_info=True)
         return {"error": f"Failed to generate resume: {str(e)}"}
 
+@resume_agent.on_rest_post("/resume/export", ResumeExportRequest, ResumeExportResponse)
+async def handle_rest_resume_export(ctx: Context, req: ResumeExportRequest) -> Dict[str, Any]:
+    logger.info(f"Received REST export request: {req.format}, {len(req.resume)} chars")
+    try:
+        data, digest = await export_pool.render(req.resume, req.format)
+        return {
+            "file": base64.b64encode(data).decode("ascii"),
+            "mediaType": MEDIA_TYPES[req.format],
+            "filename": f"custom_resume.{req.format}",
+            "digest": digest,
+        }
+    except Exception as e:
+        logger.error(f"Error exporting resume: {str(e)}", exc_info=True)
+        return {"error": f"Failed to export resume: {str(e)}"}
+
+async def send_asi1_request(prompt: str, retries: int = MAX_RETRIES, max_tokens: int = 100000) -> str:
+    logger.info(f"Sending ASI1 Mini request (retries left: {retries})")
+    async with aiohttp.ClientSession() as session:
+        request = {
+            "model": "asi1-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional resume writer who creates tailored resumes in plain text format suitable for PDF export. Ensure clear headings and bullet points."
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens,
+            "stream": False
+        }
+        try:
+            logger.debug(f"ASI1 request payload: {json.dumps(request)[:1000]}")
+            async with session.post(
+                API_URL,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {ASI1_MINI_API_KEY}"
+                },
+                json=request,
+            ) as response:
+                body_text = await response.text()
+                logger.debug(f"ASI1 response status={response.status} body={body_text[:1000]}")
+                if not response.ok:
+                    logger.error(f"ASI1 API error: {response.status} - {body_text}")
+                    if response.status in (429, 500, 503) and retries > 0:
+                        await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
+                        return await send_asi1_request(prompt, retries - 1, max_tokens)
+                    raise Exception(f"ASI1 API error: {response.status} - {body_text}")
+                data = json.loads(body_text)
+                if not data.get("choices") or not data["choices"][0].get("message") or not data["choices"][0]["message"].get("content"):
+                    raise Exception("Invalid response format from ASI1 API")
+                return data["choices"][0]["message"]["content"]
+        except Exception as e:
+            logger.error(f"ASI1 request failed: {str(e)}")
+            if retries > 0:
+                await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
+                return await send_asi1_request(prompt, retries - 1, max_tokens)
+            raise e
+
+
+def hint_values(hints: Dict[str, Any]):
+    """Role, location, years and skills hints as prompt text."""
+    return (
+        hints.get("role"),
+        hints.get("location"),
+        hints.get("years"),
+        ", ".join(hints.get("skills") or []),
+    )
+
+
+def clean_section(name: str, text: str) -> str:
+    """Section body without a heading the LLM may have repeated or markdown fences."""
+    lines = text.strip().strip("`").strip().split("\n")
+    if lines and re.sub(r"[^a-z ]", "", lines[0].lower()).strip() == name.lower():
+        lines = lines[1:]
+    return "\n".join(lines).strip()
+
+
+async def generate_section(params: ResumeParams, hints: Dict[str, Any], name: str, instructions: str, limit: asyncio.Semaphore) -> str:
+    """One resume section from its own completion; retried on its own."""
+    role_hint, loc_hint, years_hint, skills_hint = hint_values(hints)
+    prompt = f"""
+    Write only the {name} section of an ATS-optimized resume tailored to the job description below.
+    {instructions}
+
+    Tailoring hints (shared by every section, keep them consistent):
+    - Target role: {role_hint}
+    - Years of experience to emphasize: {years_hint if years_hint is not None else "match JD"}
+    - Location context: {loc_hint if loc_hint else "general"}
+    - Key skills from the JD: {skills_hint if skills_hint else "as listed in JD"}
+
+    Plain text only: no heading, no tables, no markdown; use "- " for bullet points.
+
+    Job Description:
+    {params.jobDescription}
+    """
+    last_error = None
+    for attempt in range(SECTION_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_DELAY * attempt / 1000)
+        try:
+            async with limit:
+                text = clean_section(name, await send_asi1_request(prompt, retries=0, max_tokens=SECTION_MAX_TOKENS))
+            if not text:
+                raise Exception("Empty section")
+            return text
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Resume section {name} attempt {attempt + 1} failed: {str(e)}")
+    raise Exception(f"Resume section {name} failed after {SECTION_RETRIES + 1} attempts: {str(last_error)}")
+
+
+def partial_sections(cache_key: str) -> Dict[str, str]:
+    """Sections kept from an earlier, partly failed attempt at this resume (a new dict if none).
+
+    Entries expire after SECTION_CACHE_TTL; the oldest go first past SECTION_CACHE_ENTRIES.
+    """
+    now = time.time()
+    entry = resume_sections.pop(cache_key, None)
+    done = entry[1] if entry is not None and now - entry[0] <= SECTION_CACHE_TTL else {}
+    resume_sections[cache_key] = (now, done)
+    while resume_sections and (
+        len(resume_sections) > SECTION_CACHE_ENTRIES or now - next(iter(resume_sections.values()))[0] > SECTION_CACHE_TTL
+    ):
+        resume_sections.popitem(last=False)
+    return done
+
+
+async def generate_sections(params: ResumeParams, hints: Dict[str, Any], cache_key: str, names: Optional[List[str]] = None) -> Dict[str, str]:
+    """Sections (all, or just ``names``) written concurrently, keyed by section name.
+
+    Sections that succeed are kept even when another one fails, so asking
+    again only rewrites the failed ones.
+    """
+    done = partial_sections(cache_key)
+    limit = asyncio.Semaphore(MAX_PARALLEL_SECTIONS)
+    pending = [(name, instructions) for name, instructions in RESUME_SECTIONS if name not in done and (names is None or name in names)]
+    logger.info(f"Generating {len(pending)} resume sections concurrently via ASI1 Mini")
+    results = await asyncio.gather(
+        *(generate_section(params, hints, name, instructions, limit) for name, instructions in pending),
+        return_exceptions=True,
+    )
+    failed = []
+    for (name, _), result in zip(pending, results):
+        if isinstance(result, BaseException):
+            failed.append(name)
+        else:
+            done[name] = result
+    if failed:
+        raise Exception(f"Resume sections failed: {', '.join(failed)}")
+    resume_sections.pop(cache_key, None)
+    return done
+
+
+def assemble_sections(sections: Dict[str, str]) -> str:
+    return "\n\n".join(f"{name.upper()}\n{sections[name]}" for name, _ in RESUME_SECTIONS)
+
+
+async def write_bullets(params: ResumeParams, hints: Dict[str, Any], skills: List[str], experience: str) -> List[str]:
+    """One new experience bullet per skill, consistent with the roles already written."""
+    role_hint = hints.get("role")
+    prompt = f"""
+    The resume below targets a {role_hint} role. The new job description also asks for: {", ".join(skills)}.
+    Write exactly {len(skills)} new experience bullet points, one per skill in that order, that fit the existing roles and quantify impact.
+    Output only the bullets, one per line, each starting with "- ".
+
+    Existing experience:
+    {experience}
+
+    Job Description:
+    {params.jobDescription}
+    """
+    last_error = None
+    for attempt in range(SECTION_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_DELAY * attempt / 1000)
+        try:
+            text = await send_asi1_request(prompt, retries=0, max_tokens=SECTION_MAX_TOKENS)
+            bullets = [line.strip() for line in text.split("\n") if re.match(r"\s*[-*•]\s+", line)]
+            if not bullets:
+                raise Exception("No bullets returned")
+            return bullets[:len(skills)]
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Resume bullets attempt {attempt + 1} failed: {str(e)}")
+    raise Exception(f"Resume bullets failed after {SECTION_RETRIES + 1} attempts: {str(last_error)}")
+
+
+async def tailor_resume(params: ResumeParams, hints: Dict[str, Any], cache_key: str) -> str:
+    """Adapt the profile's base resume to a JD, asking the LLM only for what the JD changes.
+
+    The first JD of a profile writes its base resume section by section. For
+    later ones, plan_delta compares the JD's role, years and skills with the
+    base: the summary, skills or certifications are rewritten only when they
+    no longer fit, new skills get one experience bullet each in place of the
+    least relevant bullets, and the skills and bullets are reordered locally
+    to lead with the JD's skills. The base itself is not changed.
+    """
+    if not params.profileId:
+        raise Exception("profileId is required for tailored resumes")
+    skills = await rag_worker.run(resume_rag.detect_skills, params.jobDescription)
+    base = resume_bases.get(params.profileId)
+    if base is None:
+        sections = await generate_sections(params, hints, cache_key)
+        resume_bases[params.profileId] = {
+            "sections": sections,
+            "role": hints.get("role"),
+            "years": hints.get("years"),
+            "skills": skills,
+            "rewrites": OrderedDict(),
+        }
+        logger.info(f"Base resume written for profile {params.profileId}")
+        return assemble_sections(sections)
+
+    delta = plan_delta(base, hints.get("role"), hints.get("years"), skills)
+    names = [name for name, key in (
+        ("Professional Summary", "summary"), ("Skills", "skills"), ("Certifications", "certifications"),
+    ) if delta[key]]
+    logger.info(
+        f"Tailoring base resume of profile {params.profileId}: rewriting {names or 'no sections'}, "
+        f"{len(delta['bullets'])} new bullets for {delta['added']}"
+    )
+    experience = base["sections"]["Experience"]
+    # Postings that differ from the base in the same way share one set of rewrites
+    rewrite_key = json.dumps([
+        hints.get("role") if delta["summary"] or delta["certifications"] else None,
+        hints.get("years") if delta["summary"] else None,
+        sorted(s.lower() for s in delta["added"]),
+        names,
+    ])
+    cached = base["rewrites"].get(rewrite_key)
+    if cached is not None:
+        base["rewrites"].move_to_end(rewrite_key)
+        logger.info(f"Reusing delta rewrites of profile {params.profileId} for {delta['added']}")
+        rewritten, bullets = cached
+    else:
+        rewritten, bullets = await asyncio.gather(
+            generate_sections(params, hints, cache_key, names) if names else asyncio.sleep(0, {}),
+            write_bullets(params, hints, delta["bullets"], experience) if delta["bullets"] else asyncio.sleep(0, []),
+        )
+        base["rewrites"][rewrite_key] = (rewritten, bullets)
+        if len(base["rewrites"]) > TAILORED_REWRITES:
+            base["rewrites"].popitem(last=False)
+    sections = {**base["sections"], **rewritten}
+    sections["Skills"] = reorder_skills(sections["Skills"], skills)
+    sections["Experience"] = swap_bullets(experience, bullets, skills)
+    return assemble_sections(sections)
+
+
 async def generate_resume(params: ResumeParams) -> str:
     logger.info(f"Generating resume for params: {params}")
     try:
@@ -194,10 +493,18 @@ async def generate_resume(params: ResumeParams) -> str:
             logger.info("Returning cached resume")
             return resume_cache[cache_key]
 
-        hints = infer_role_location_experience(params.jobDescription)
-        role_hint = hints.get("role")
-        loc_hint = hints.get("location")
-        years_hint = hints.get("years")
+        hints = await rag_worker.run(infer_role_location_experience, params.jobDescription)
+        if params.mode == "sections":
+            resume_text = assemble_sections(await generate_sections(params, hints, cache_key))
+            resume_cache[cache_key] = resume_text
+            logger.info("Resume generated section by section and cached")
+            return resume_text
+        if params.mode == "tailored":
+            resume_text = await tailor_resume(params, hints, cache_key)
+            resume_cache[cache_key] = resume_text
+            logger.info("Tailored resume generated and cached")
+            return resume_text
+        role_hint, loc_hint, years_hint, skills_hint = hint_values(hints)
 
         prompt = f"""
         You are a professional resume writer who creates tailored resumes from job descriptions.
@@ -212,6 +519,7 @@ async def generate_resume(params: ResumeParams) -> str:
         - Target role: {role_hint}
         - Years of experience to emphasize: {years_hint if years_hint is not None else "match JD"}
         - Location context: {loc_hint if loc_hint else "general"}
+        - Key skills from the JD: {skills_hint if skills_hint else "as listed in JD"}
 
         Formatting requirements:
         - Use clear headings and concise bullet points
@@ -222,52 +530,6 @@ async def generate_resume(params: ResumeParams) -> str:
         {params.jobDescription}
         """
 
-        async def send_asi1_request(prompt: str, retries: int = MAX_RETRIES) -> str:
-            logger.info(f"Sending ASI1 Mini request (retries left: {retries})")
-            async with aiohttp.ClientSession() as session:
-                request = {
-                    "model": "asi1-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a professional resume writer who creates tailored resumes in plain text format suitable for PDF export. Ensure clear headings and bullet points."
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 100000,
-                    "stream": False
-                }
-                try:
-                    logger.debug(f"ASI1 request payload: {json.dumps(request)[:1000]}")
-                    async with session.post(
-                        API_URL,
-                        headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "Authorization": f"Bearer {ASI1_MINI_API_KEY}"
-                        },
-                        json=request,
-                    ) as response:
-                        body_text = await response.text()
-                        logger.debug(f"ASI1 response status={response.status} body={body_text[:1000]}")
-                        if not response.ok:
-                            logger.error(f"ASI1 API error: {response.status} - {body_text}")
-                            if response.status in (429, 500, 503) and retries > 0:
-                                await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
-                                return await send_asi1_request(prompt, retries - 1)
-                            raise Exception(f"ASI1 API error: {response.status} - {body_text}")
-                        data = json.loads(body_text)
-                        if not data.get("choices") or not data["choices"][0].get("message") or not data["choices"][0]["message"].get("content"):
-                            raise Exception("Invalid response format from ASI1 API")
-                        return data["choices"][0]["message"]["content"]
-                except Exception as e:
-                    logger.error(f"ASI1 request failed: {str(e)}")
-                    if retries > 0:
-                        await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
-                        return await send_asi1_request(prompt, retries - 1)
-                    raise e
-
         # Call ASI1 Mini API
         logger.info("Calling ASI1 Mini API")
         resume_text = await send_asi1_request(prompt)
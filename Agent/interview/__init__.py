@@ -0,0 +1,17 @@
+from .bank import QuestionBank
+from .followups import answer_band, choose_followup
+from .sessions import SCORE_MAX, InterviewSession, SessionStore
+from .streaming import QuestionLineParser, QuestionStream, QuestionStreams, sse_delta
+
+__all__ = [
+    "SCORE_MAX",
+    "QuestionBank",
+    "InterviewSession",
+    "SessionStore",
+    "QuestionLineParser",
+    "QuestionStream",
+    "QuestionStreams",
+    "sse_delta",
+    "answer_band",
+    "choose_followup",
+]
@@ -0,0 +1,115 @@
+import random
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    bucket TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE(bucket, norm)
+);
+CREATE TABLE IF NOT EXISTS served (
+    user TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    served_at REAL NOT NULL,
+    PRIMARY KEY(user, question_id)
+);
+"""
+
+
+def _normalize(question: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", question.lower()).strip()
+
+
+class QuestionBank:
+    """Persistent, deduplicated interview questions per profile bucket.
+
+    A bucket is (target role, difficulty level, interview type). Questions are
+    deduplicated on their normalised text and every question handed to a user
+    is recorded, so sampling never repeats a question for the same user.
+    ``unseen`` tells the caller when a bucket is running low for a user and
+    should be topped up.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def bucket(profile: Dict[str, Any]) -> str:
+        role = re.sub(r"\s+", " ", str(profile.get("targetRole") or "software engineer").strip().lower())
+        level = str(profile.get("difficultyLevel") or "intermediate").strip().lower()
+        kind = str(profile.get("interviewType") or "technical").strip().lower()
+        return f"{role}|{level}|{kind}"
+
+    def add(self, bucket: str, questions: Iterable[str]) -> int:
+        """Store new questions; returns how many were not already in the bucket."""
+        now = time.time()
+        added = 0
+        with self._lock, self._conn:
+            for question in questions:
+                norm = _normalize(question)
+                if not norm:
+                    continue
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO questions(bucket, norm, text, created_at) VALUES (?, ?, ?, ?)",
+                    (bucket, norm, question.strip(), now),
+                )
+                added += cur.rowcount
+        return added
+
+    def _unseen_rows(self, bucket: str, user: str) -> List[Tuple[int, str]]:
+        return self._conn.execute(
+            "SELECT id, text FROM questions WHERE bucket = ? AND id NOT IN "
+            "(SELECT question_id FROM served WHERE user = ?)",
+            (bucket, user),
+        ).fetchall()
+
+    def unseen(self, bucket: str, user: str) -> int:
+        with self._lock:
+            return len(self._unseen_rows(bucket, user))
+
+    def sample(self, bucket: str, user: str, count: int) -> List[str]:
+        """Up to ``count`` random questions this user has not been given yet, marked as served.
+
+        An empty ``user`` samples without recording anything.
+        """
+        with self._lock, self._conn:
+            rows = self._unseen_rows(bucket, user)
+            picked = random.sample(rows, k=min(count, len(rows)))
+            if not user:
+                return [text for _, text in picked]
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO served(user, question_id, served_at) VALUES (?, ?, ?)",
+                [(user, qid, now) for qid, _ in picked],
+            )
+        return [text for _, text in picked]
+
+    def claim(self, bucket: str, user: str, question: str) -> bool:
+        """Mark a banked question as served to ``user``; False if they already had it."""
+        if not user:
+            return True
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM questions WHERE bucket = ? AND norm = ?", (bucket, _normalize(question))
+            ).fetchone()
+            if row is None:
+                return False
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO served(user, question_id, served_at) VALUES (?, ?, ?)",
+                (user, row[0], time.time()),
+            )
+            return cur.rowcount == 1
+
+    def size(self, bucket: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM questions WHERE bucket = ?", (bucket,)).fetchone()[0]
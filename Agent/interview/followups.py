@@ -0,0 +1,51 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from .sessions import SCORE_KEYS, SCORE_MAX, score_value
+
+# Answer bands a speculative follow-up is written for
+BANDS = ("weak", "partial", "strong")
+# Average score at or above which an answer counts as partial / strong
+PARTIAL_AT = SCORE_MAX * 0.5
+STRONG_AT = SCORE_MAX * 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def answer_band(analysis: Dict[str, Any]) -> str:
+    """Bucket an analysis into weak / partial / strong by its average metric score."""
+    scores = [s for s in (score_value(analysis.get(k)) for k in SCORE_KEYS) if s is not None]
+    if not scores:
+        return "partial"
+    average = sum(scores) / len(scores)
+    if average >= STRONG_AT:
+        return "strong"
+    return "partial" if average >= PARTIAL_AT else "weak"
+
+
+def _words(text: str) -> set:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 3}
+
+
+def choose_followup(
+    candidates: List[Dict[str, Any]], analysis: Dict[str, Any], response: str
+) -> Optional[Dict[str, Any]]:
+    """Pick the pre-generated follow-up that best fits how the answer went.
+
+    Candidates of the answer's band are preferred (then neighbouring bands);
+    within a band, the one whose keywords overlap most with the answer and
+    the analysis' weaknesses wins.
+    """
+    if not candidates:
+        return None
+    band = answer_band(analysis)
+    weaknesses = analysis.get("weaknesses") or []
+    context = _words(f"{response} {' '.join(map(str, weaknesses)) if isinstance(weaknesses, list) else weaknesses}")
+    rank = {b: abs(BANDS.index(b) - BANDS.index(band)) for b in BANDS}
+
+    def fit(candidate: Dict[str, Any]):
+        keywords = _words(" ".join(map(str, candidate.get("keywords") or [])) + " " + candidate.get("question", ""))
+        return (rank.get(candidate.get("band"), len(BANDS)), -len(keywords & context))
+
+    best = min(candidates, key=fit)
+    return {"question": best["question"], "band": band}
@@ -0,0 +1,162 @@
+import re
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Score keys an answer analysis may carry; other numeric keys are ignored
+SCORE_KEYS = ("clarity", "confidence", "relevance", "completeness", "technicalAccuracy")
+# Every metric in an analysis, from the LLM or the prescore, is an integer 0..SCORE_MAX
+SCORE_MAX = 100
+# How many strengths / weaknesses / weakest answers the feedback summary keeps
+SUMMARY_TOP = 5
+QUESTION_PREVIEW = 120
+
+
+def score_value(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        m = re.match(r"\s*(\d+(?:\.\d+)?)", value)
+        if m:
+            return float(m.group(1))
+    if isinstance(value, dict):
+        return score_value(value.get("score"))
+    return None
+
+
+def _points(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [str(v).strip() for v in value if str(v).strip()]
+
+
+def _point_key(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+class InterviewSession:
+    """Running aggregates for one interview.
+
+    Each analysed answer is folded in as it arrives: score sums per metric,
+    strength and weakness counts (near-identical phrasings merge), and one
+    compact line per answer. Full responses and analyses are not retained,
+    so the state and the feedback summary stay small however long the
+    interview runs.
+    """
+
+    def __init__(self, session_id: str, profile: Dict[str, Any]):
+        self.id = session_id
+        self.profile = dict(profile or {})
+        self.created = time.time()
+        self.updated = self.created
+        self.questions: List[str] = []
+        self.answered = 0
+        self._score_sums: Dict[str, float] = {}
+        self._score_counts: Dict[str, int] = {}
+        self._strengths: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._weaknesses: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._suggestions: List[str] = []
+        self._answers: List[Dict[str, Any]] = []
+        # Question text -> task speculatively generating its follow-ups (agent-managed)
+        self.speculative: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _count(self, into: "OrderedDict[str, List[Any]]", points: List[str]):
+        for point in points:
+            key = _point_key(point)
+            if not key:
+                continue
+            if key in into:
+                into[key][1] += 1
+            else:
+                into[key] = [point, 1]
+
+    def record(self, question: str, response: str, analysis: Dict[str, Any]):
+        """Fold one analysed answer into the aggregates."""
+        self.updated = time.time()
+        self.answered += 1
+        scores = {}
+        for key in SCORE_KEYS:
+            value = score_value(analysis.get(key))
+            if value is None:
+                continue
+            scores[key] = value
+            self._score_sums[key] = self._score_sums.get(key, 0.0) + value
+            self._score_counts[key] = self._score_counts.get(key, 0) + 1
+        self._count(self._strengths, _points(analysis.get("strengths")))
+        self._count(self._weaknesses, _points(analysis.get("weaknesses")))
+        suggestion = analysis.get("suggestions")
+        if suggestion:
+            self._suggestions = (self._suggestions + _points(suggestion))[-SUMMARY_TOP:]
+        self._answers.append({
+            "question": question[:QUESTION_PREVIEW],
+            "responseWords": len((response or "").split()),
+            "score": round(sum(scores.values()) / len(scores), 1) if scores else None,
+        })
+
+    def averages(self) -> Dict[str, float]:
+        return {k: round(self._score_sums[k] / self._score_counts[k], 1) for k in self._score_sums}
+
+    @staticmethod
+    def _top(points: "OrderedDict[str, List[Any]]") -> List[str]:
+        ranked = sorted(points.values(), key=lambda item: -item[1])
+        return [f"{text} (x{n})" if n > 1 else text for text, n in ranked[:SUMMARY_TOP]]
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact, bounded view of the interview for the feedback prompt."""
+        scored = [a for a in self._answers if a["score"] is not None]
+        weakest = sorted(scored, key=lambda a: a["score"])[:SUMMARY_TOP]
+        return {
+            "answered": self.answered,
+            "averageScores": self.averages(),
+            "topStrengths": self._top(self._strengths),
+            "topWeaknesses": self._top(self._weaknesses),
+            "weakestAnswers": [{"question": a["question"], "score": a["score"]} for a in weakest],
+            "recentSuggestions": list(self._suggestions),
+        }
+
+
+class SessionStore:
+    """In-memory interview sessions, expired after ``ttl`` seconds idle and capped at ``max_sessions``."""
+
+    def __init__(self, ttl: float = 6 * 3600, max_sessions: int = 1000):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, InterviewSession]" = OrderedDict()
+
+    def _expire(self):
+        now = time.time()
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest.updated <= self.ttl and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+
+    def create(self, profile: Dict[str, Any]) -> InterviewSession:
+        session = InterviewSession(uuid.uuid4().hex, profile)
+        self._sessions[session.id] = session
+        self._expire()
+        return session
+
+    def get(self, session_id: Optional[str]) -> Optional[InterviewSession]:
+        if not session_id:
+            return None
+        session = self._sessions.get(session_id)
+        if session is None or time.time() - session.updated > self.ttl:
+            self._sessions.pop(session_id, None)
+            return None
+        session.updated = time.time()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def get_or_create(self, session_id: Optional[str], profile: Dict[str, Any]) -> InterviewSession:
+        session = self.get(session_id)
+        if session is None:
+            session = self.create(profile)
+        elif profile:
+            session.profile.update(profile)
+        return session
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import re
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+_NUMBERING = re.compile(r"^\s*(?:[-*•]|\d+[.)]|q\d+[:.)])\s*", re.I)
+
+
+def sse_delta(line: str) -> Optional[str]:
+    """Text delta carried by one server-sent-events line of a streamed chat completion.
+
+    Returns None for keep-alives, comments, ``[DONE]`` and events without content.
+    """
+    line = line.strip()
+    if not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if not data or data == "[DONE]":
+        return None
+    try:
+        event = json.loads(data)
+    except ValueError:
+        return None
+    choice = (event.get("choices") or [{}])[0]
+    delta = choice.get("delta") or choice.get("message") or {}
+    return delta.get("content") or None
+
+
+class QuestionLineParser:
+    """Cuts complete questions out of a token stream.
+
+    Text is buffered until a newline; each finished line ending in '?' is a
+    question (list markers and numbering stripped). ``close`` flushes a final
+    question that arrived without a trailing newline.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+
+    def _line(self, line: str) -> Optional[str]:
+        line = _NUMBERING.sub("", line.strip()).strip()
+        return line if line.endswith("?") else None
+
+    def feed(self, text: str) -> Iterator[str]:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            question = self._line(line)
+            if question:
+                yield question
+
+    def close(self) -> Iterator[str]:
+        question = self._line(self._buffer)
+        self._buffer = ""
+        if question:
+            yield question
+
+
+class QuestionStream:
+    """Questions of one interview as they become available, for REST long-polling."""
+
+    def __init__(self, stream_id: str, count: int):
+        self.id = stream_id
+        self.count = count
+        self.questions: List[str] = []
+        self.done = False
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None  # producer feeding this stream
+        self.updated = time.time()
+        self._changed = asyncio.Event()
+
+    def push(self, question: str):
+        self.questions.append(question)
+        self._notify()
+
+    def finish(self, error: Optional[str] = None):
+        self.done = True
+        self.error = error
+        self._notify()
+
+    def _notify(self):
+        self.updated = time.time()
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self, offset: int, timeout: float) -> List[str]:
+        """Questions from ``offset`` on, waiting up to ``timeout`` seconds for at least one."""
+        if len(self.questions) <= offset and not self.done:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.questions[offset:]
+
+    def to_dict(self, offset: int = 0) -> Dict[str, Any]:
+        return {"questions": self.questions[offset:], "streamId": self.id, "done": self.done, "error": self.error}
+
+
+class QuestionStreams:
+    """Live question streams by id, dropped ``ttl`` seconds after their last update."""
+
+    def __init__(self, ttl: float = 600):
+        self.ttl = ttl
+        self._streams: "OrderedDict[str, QuestionStream]" = OrderedDict()
+
+    def create(self, count: int) -> QuestionStream:
+        now = time.time()
+        for stream_id in [s.id for s in self._streams.values() if now - s.updated > self.ttl]:
+            del self._streams[stream_id]
+        stream = QuestionStream(uuid.uuid4().hex, count)
+        self._streams[stream.id] = stream
+        return stream
+
+    def get(self, stream_id: str) -> Optional[QuestionStream]:
+        return self._streams.get(stream_id)
@@ -3,7 +3,7 @@ import aiohttp
 import json
 import asyncio
 import re
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 import logging
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -14,8 +14,19 @@ from uagents_core.contrib.protocols.chat import (
     TextContent,
     chat_protocol_spec,
 )
-from hyperon import MeTTa
-from metta import EducationRAG, initialize_education_knowledge
+from metta import AsyncRAG, create_education_rag
+from interview import (
+    SCORE_MAX,
+    InterviewSession,
+    QuestionBank,
+    QuestionLineParser,
+    QuestionStreams,
+    SessionStore,
+    choose_followup,
+    sse_delta,
+)
+from llm import extract_json
+from rest import add_health_endpoint, enable_compression
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -27,6 +38,26 @@ class Config:
     API_URL = "https://api.asi1.ai/v1/chat/completions"
     MAX_RETRIES = 3
     RETRY_DELAY = 1000
+    # Interview sessions kept server-side so /feedback works from running aggregates
+    SESSION_TTL = 6 * 3600  # seconds idle
+    MAX_SESSIONS = 1000
+    # Answers analysed at once by /analyze-batch
+    ANALYZE_BATCH_CONCURRENCY = 4
+    # Question bank per (role, level, type): interviews sample from it, the LLM only tops it up
+    QUESTION_BANK_PATH = "question_bank.sqlite3"
+    QUESTION_BANK_BATCH = 15  # questions generated per top-up
+    QUESTION_BANK_LOW_WATER = 10  # unseen questions per user below which a top-up starts
+    # Answers whose local pre-score is below this (0-1) get a deterministic analysis instead of an LLM call
+    PRESCORE_THRESHOLD = 0.2
+    # Follow-up questions generated per asked question, ahead of the answer
+    MAX_SPECULATIVE_PER_SESSION = 4
+    # Streamed /questions: longest a poll waits for the next question (seconds)
+    QUESTION_POLL_WAIT = 15
+    QUESTION_BANK_WARM = [
+        {"targetRole": "Software Engineer", "difficultyLevel": "intermediate", "interviewType": "technical"},
+        {"targetRole": "Frontend Developer", "difficultyLevel": "intermediate", "interviewType": "technical"},
+        {"targetRole": "Backend Developer", "difficultyLevel": "intermediate", "interviewType": "technical"},
+    ]
 
 
 interviewer_agent = Agent(
@@ -36,6 +67,8 @@ interviewer_agent = Agent(
     publish_agent_details=True,
     seed = "interviewer-agent-seed-0001"
 )
+enable_compression(interviewer_agent)
+add_health_endpoint(interviewer_agent)
 
 
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -53,9 +86,15 @@ def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
 
 
 # Initialize RAG for education topics
-metta = MeTTa()
-initialize_education_knowledge(metta)
-edu_rag = EducationRAG(metta)
+edu_rag = create_education_rag()
+rag_worker = AsyncRAG(edu_rag, "education")
+sessions = SessionStore(ttl=Config.SESSION_TTL, max_sessions=Config.MAX_SESSIONS)
+question_bank = QuestionBank(Config.QUESTION_BANK_PATH)
+# In-flight top-up per bucket and the queues of callers streaming its questions
+bank_refills: Dict[str, Tuple[asyncio.Task, List[asyncio.Queue]]] = {}
+question_streams = QuestionStreams()
+# Answer analyses served by the local pre-scorer vs. sent to the LLM
+prescore_stats = {"skipped": 0, "llm": 0}
 
 
 async def send_asi(prompt: str, temperature: float = 0.5, max_tokens: int = 1500, web_search: bool = False, retries: int = Config.MAX_RETRIES) -> str:
@@ -100,75 +139,83 @@ async def send_asi(prompt: str, temperature: float = 0.5, max_tokens: int = 1500
             raise
 
 
+async def stream_asi(prompt: str, temperature: float = 0.5, max_tokens: int = 1500, web_search: bool = False, retries: int = Config.MAX_RETRIES) -> AsyncIterator[str]:
+    """Like send_asi, but yields content deltas as the completion streams in.
+
+    Retries only cover failures before the first token; a broken stream raises.
+    """
+    request = {
+        "model": "asi1-mini",
+        "messages": [
+            {"role": "system", "content": "Be precise and concise."},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": temperature,
+        "top_p": 0.9,
+        "max_tokens": max_tokens,
+        "presence_penalty": 0,
+        "frequency_penalty": 0,
+        "stream": True,
+        "extra_body": {"web_search": web_search},
+    }
+    for attempt in range(retries + 1):
+        started = False
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    Config.API_URL,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Accept": "text/event-stream",
+                        "Authorization": f"Bearer {Config.ASI1_MINI_API_KEY}",
+                    },
+                    json=request,
+                ) as response:
+                    if not response.ok:
+                        text = await response.text()
+                        raise Exception(f"ASI error: {response.status} - {text}")
+                    if "text/event-stream" not in response.headers.get("Content-Type", ""):
+                        # Server answered without streaming; hand over the whole completion
+                        data = json.loads(await response.text())
+                        started = True
+                        yield data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                        return
+                    async for raw in response.content:
+                        delta = sse_delta(raw.decode("utf-8", errors="ignore"))
+                        if delta:
+                            started = True
+                            yield delta
+                    return
+        except Exception:
+            if started or attempt == retries:
+                raise
+            await asyncio.sleep(Config.RETRY_DELAY * (attempt + 1) / 1000)
+
+
 def build_rag_hints(target_role: str, level: str) -> Dict[str, Any]:
     role = (target_role or "").lower()
     topic = "frontend development" if "front" in role else ("data structures and algorithms" if "dsa" in role or "algo" in role else ("backend development" if "back" in role else "system design"))
-    subtopics = edu_rag.subtopics_for(topic, level)
-    resources = edu_rag.resources_for(topic, level)
-    return {"topic": topic, "subtopics": subtopics[:8], "resources": resources[:8]}
+    profile = edu_rag.topic_profile(topic, level)
+    return {"topic": topic, "subtopics": profile["subtopics"][:8], "resources": profile["resources"][:8]}
 
 
 def extract_json_from_payload(payload: str) -> Dict[str, Any]:
-    """Extract a single JSON object after a command. Handles fenced blocks and balanced braces."""
-    # fenced block first
-    m = re.search(r"```json\n([\s\S]*?)\n```", payload)
-    if m:
-        try:
-            return json.loads(m.group(1))
-        except Exception as e:
-            raise ValueError(f"Invalid JSON payload: {str(e)}")
+    """Extract a single JSON object after a command (fenced or inline)."""
+    try:
+        return extract_json(payload, dict)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON payload: {str(e)}")
 
-    # Find first opening brace and balance until matching closing brace
-    s = payload.find('{')
-    if s == -1:
-        # try whole payload
-        try:
-            return json.loads(payload.strip())
-        except Exception as e:
-            raise ValueError(f"Invalid JSON payload: {str(e)}")
-
-    depth = 0
-    in_string = False
-    escape = False
-    for i in range(s, len(payload)):
-        ch = payload[i]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == '\\':
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-        else:
-            if ch == '"':
-                in_string = True
-                continue
-            if ch == '{':
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0:
-                    json_text = payload[s:i+1]
-                    try:
-                        return json.loads(json_text)
-                    except Exception as e:
-                        raise ValueError(f"Invalid JSON payload: {str(e)}")
-
-    # If we exit loop without closing
-    raise ValueError("Invalid JSON payload: unmatched braces")
-
-
-async def generate_questions(profile: Dict[str, Any], count: int = 5) -> str:
+
+async def stream_question_batch(profile: Dict[str, Any], count: int) -> AsyncIterator[str]:
+    """Ask the LLM for ``count`` questions for a profile bucket, yielding each once it is complete."""
     level = profile.get("difficultyLevel", "intermediate")
-    rag = build_rag_hints(profile.get("targetRole", ""), level)
+    rag = await rag_worker.run(build_rag_hints, profile.get("targetRole", ""), level)
     prompt = f"""
-You are an expert interviewer for {profile.get('targetRole')} in {profile.get('industry')}.
-Generate {count} challenging interview questions.
+You are an expert interviewer for {profile.get('targetRole')}{' in ' + profile['industry'] if profile.get('industry') else ''}.
+Generate {count} challenging, distinct interview questions.
 Profile:
-- Job title: {profile.get('jobTitle')}
-- Experience: {profile.get('yearsOfExperience')} years
-- Skills: {', '.join(profile.get('skills', []))}
+- Difficulty level: {level}
 - Interview type: {profile.get('interviewType')}
 
 Focus areas (RAG): {json.dumps(rag)}
@@ -178,13 +225,157 @@ Guidelines:
 - Include system design when appropriate
 - Questions only; no numbering; each on a new line; end with '?'
 """
-    content = await send_asi(prompt, temperature=0.6, max_tokens=1200, web_search=False)
-    # Extract questions lines
-    lines = [l.strip() for l in content.split("\n") if l.strip().endswith("?")]
-    return "\n".join(lines[:count]) if lines else content.strip()
+    parser = QuestionLineParser()
+    async for delta in stream_asi(prompt, temperature=0.8, max_tokens=1800, web_search=False):
+        for question in parser.feed(delta):
+            yield question
+    for question in parser.close():
+        yield question
+
+
+async def refill_bank(bucket: str, profile: Dict[str, Any], listeners: List[asyncio.Queue]) -> int:
+    added = 0
+    try:
+        async for question in stream_question_batch(profile, Config.QUESTION_BANK_BATCH):
+            added += await asyncio.to_thread(question_bank.add, bucket, [question])
+            for listener in listeners:
+                listener.put_nowait(question)
+        total = await asyncio.to_thread(question_bank.size, bucket)
+        logger.info(f"Question bank '{bucket}': {added} new questions ({total} total)")
+    except Exception as e:
+        logger.warning(f"Question bank top-up for '{bucket}' failed: {str(e)}")
+    finally:
+        for listener in listeners:
+            listener.put_nowait(None)
+    return added
+
+
+def schedule_refill(bucket: str, profile: Dict[str, Any], listener: Optional[asyncio.Queue] = None) -> asyncio.Task:
+    """One top-up per bucket at a time; concurrent callers share it.
+
+    A ``listener`` queue receives each question as it is generated, then None.
+    """
+    entry = bank_refills.get(bucket)
+    if entry is None or entry[0].done():
+        bucket_profile = {k: profile[k] for k in ("targetRole", "industry", "difficultyLevel", "interviewType") if profile.get(k)}
+        listeners: List[asyncio.Queue] = []
+        entry = (asyncio.create_task(refill_bank(bucket, bucket_profile, listeners)), listeners)
+        bank_refills[bucket] = entry
+    if listener is not None:
+        entry[1].append(listener)
+    return entry[0]
+
+
+async def iter_questions(profile: Dict[str, Any], count: int = 5, user: str = "") -> AsyncIterator[str]:
+    """Interview questions one at a time: banked ones immediately, then fresh ones as the LLM finishes each."""
+    bucket = QuestionBank.bucket(profile)
+    user = user or str(profile.get("id") or "")
+    # SQLite calls go to a thread, as for the job index, so bank lookups never block the loop
+    questions = await asyncio.to_thread(question_bank.sample, bucket, user, count)
+    for question in questions:
+        yield question
+    if len(questions) < count:
+        # Cold bucket, or this user has seen all of it: take questions from a top-up as they stream in
+        seen = {q.lower() for q in questions}
+        queue: asyncio.Queue = asyncio.Queue()
+        schedule_refill(bucket, profile, queue)
+        while len(questions) < count:
+            question = await queue.get()
+            if question is None:
+                break
+            if question.lower() not in seen and await asyncio.to_thread(question_bank.claim, bucket, user, question):
+                seen.add(question.lower())
+                questions.append(question)
+                yield question
+        for question in await asyncio.to_thread(question_bank.sample, bucket, user, count - len(questions)):
+            questions.append(question)
+            yield question
+    if await asyncio.to_thread(question_bank.unseen, bucket, user) < Config.QUESTION_BANK_LOW_WATER:
+        schedule_refill(bucket, profile)
+
+
+async def generate_questions(profile: Dict[str, Any], count: int = 5, user: str = "") -> Optional[str]:
+    """Questions one per line, or None when neither the bank nor the LLM produced any."""
+    questions = [q async for q in iter_questions(profile, count, user)]
+    return "\n".join(questions) if questions else None
+
+
+async def pump_question_stream(stream, profile: Dict[str, Any], count: int, user: str = ""):
+    try:
+        async for question in iter_questions(profile, count, user):
+            stream.push(question)
+        stream.finish()
+    except Exception as e:
+        logger.error(f"Question stream {stream.id} failed: {str(e)}", exc_info=True)
+        stream.finish(error=str(e))
+
+
+_WORD_RE = re.compile(r"[a-z0-9+#']+")
+_FILLERS = {"um", "uh", "erm", "hmm", "like", "basically", "actually", "literally", "so", "well", "yeah", "ok", "okay"}
+# A whole answer (fillers dropped) that declines the question; "not sure, but I think X" is not one
+_NON_ANSWER_RE = re.compile(
+    r"(?:sorry\s+)?(?:i\s+(?:do\s*n[o']?t|dont)\s+know|no\s+idea|(?:i'?m\s+)?not\s+sure|idk|pass|skip|no\s+clue)(?:\s+sorry)?"
+)
+_STOPWORDS = {
+    "what", "when", "where", "which", "while", "with", "would", "could", "should", "about", "your", "have",
+    "does", "this", "that", "there", "their", "them", "they", "from", "into", "explain", "describe", "how",
+    "why", "tell", "give", "example", "between", "difference", "using", "used", "some", "will", "been",
+}
+
+
+def _keywords(text: str) -> set:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 3 and w not in _STOPWORDS}
+
+
+def prescore_answer(question: str, response: str, subtopics: List[str], technical: bool = False) -> Optional[Dict[str, Any]]:
+    """Cheap deterministic check run before the LLM.
+
+    Scores length, coverage of the question's keywords (and the RAG subtopics)
+    and filler ratio into 0-1. Below Config.PRESCORE_THRESHOLD, or for an
+    outright non-answer, returns an analysis in the LLM's shape with metrics
+    on the same 0..SCORE_MAX scale; otherwise None.
+    """
+    words = _WORD_RE.findall((response or "").lower())
+    wanted = _keywords(question)
+    topical = _keywords(" ".join(subtopics))
+    said = set(words)
+    coverage = len(wanted & said) / len(wanted) if wanted else 0.0
+    if topical & said:
+        coverage = min(1.0, coverage + 0.25)
+    filler = sum(1 for w in words if w in _FILLERS) / len(words) if words else 1.0
+    length = min(len(words) / 40, 1.0)
+    quality = 0.4 * length + 0.4 * coverage + 0.2 * (1 - filler)
+    non_answer = bool(_NON_ANSWER_RE.fullmatch(" ".join(w for w in words if w not in _FILLERS)))
+    if not (non_answer or quality < Config.PRESCORE_THRESHOLD):
+        return None
+
+    score = round(SCORE_MAX * quality * (0.5 if non_answer else 1))
+    analysis = {
+        "clarity": round(SCORE_MAX * (1 - filler) * length),
+        "confidence": round(SCORE_MAX * 0.1) if non_answer else score,
+        "relevance": round(SCORE_MAX * coverage),
+        "completeness": round(SCORE_MAX * length * coverage),
+        "strengths": [],
+        "weaknesses": [
+            "The answer does not attempt the question" if non_answer else "The answer is too brief to assess",
+        ] + (["Key terms from the question are not addressed"] if coverage < 0.3 else []),
+        "suggestions": "Walk through your reasoning step by step, name the concepts involved and support them with a concrete example from your experience.",
+        "prescored": True,
+    }
+    if technical:
+        analysis["technicalAccuracy"] = score
+    return analysis
 
 
 async def analyze_response(question: str, response: str, profile: Dict[str, Any]) -> str:
+    technical = str(profile.get("interviewType")).lower() == "technical"
+    hints = await rag_worker.run(build_rag_hints, profile.get("targetRole", ""), profile.get("difficultyLevel", "intermediate"))
+    quick = prescore_answer(question, response, hints["subtopics"], technical)
+    if quick is not None:
+        prescore_stats["skipped"] += 1
+        logger.info(f"Pre-scored trivial answer locally ({prescore_stats['skipped']} LLM calls skipped so far)")
+        return json.dumps(quick)
+    prescore_stats["llm"] += 1
     prompt = f"""
 Analyze the following candidate response.
 Question: "{question}"
@@ -197,91 +388,289 @@ Profile:
 - Interview type: {profile.get('interviewType')}
 
 Return JSON with keys: clarity, confidence, relevance, completeness{', technicalAccuracy' if str(profile.get('interviewType')).lower()=='technical' else ''}, strengths[], weaknesses[], suggestions
+Score each metric as an integer from 0 (absent) to {SCORE_MAX} (excellent).
 Only return raw JSON.
 """
     content = await send_asi(prompt, temperature=0.3, max_tokens=800, web_search=False)
     # Try to extract JSON block
-    m = re.search(r"```json\n([\s\S]*?)\n```", content)
-    json_text = m.group(1) if m else content
+    return llm_json_text(content)
+
+
+async def generate_followups(question: str, profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Candidate follow-ups to a question, two for each way the answer could go."""
+    prompt = f"""
+You are interviewing a candidate for {profile.get('targetRole')} ({profile.get('interviewType')} interview, {profile.get('difficultyLevel', 'intermediate')} level).
+The candidate is now answering: "{question}"
+Write follow-up questions to ask next, two for each case:
+- weak: the answer was wrong or shallow; probe the fundamentals behind the question
+- partial: the answer was on track but incomplete; ask about what it is likely to have missed
+- strong: the answer was solid; go one level deeper or add a harder constraint
+Return raw JSON: {{"followUps": [{{"band": "weak|partial|strong", "question": "...?", "keywords": ["..."]}}]}}
+"""
+    content = await send_asi(prompt, temperature=0.6, max_tokens=900, web_search=False)
+    data = extract_json(content, dict)
+    return [
+        c for c in data.get("followUps", [])
+        if isinstance(c, dict) and str(c.get("question") or "").strip()
+    ]
+
+
+def speculate_followups(session: InterviewSession, question: str) -> asyncio.Task:
+    """Start (or reuse) background follow-up generation for a question the candidate is answering."""
+    task = session.speculative.get(question)
+    if task is None:
+        task = asyncio.create_task(generate_followups(question, dict(session.profile)))
+        session.speculative[question] = task
+        while len(session.speculative) > Config.MAX_SPECULATIVE_PER_SESSION:
+            _, stale = session.speculative.popitem(last=False)
+            stale.cancel()
+    return task
+
+
+async def pick_followup(session: InterviewSession, question: str, response: str, analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Best pre-generated follow-up for this answer; also starts speculating on that follow-up."""
+    speculative = question in session.speculative
+    task = session.speculative.pop(question, None) or asyncio.create_task(generate_followups(question, dict(session.profile)))
+    try:
+        candidates = await task
+    except Exception as e:
+        logger.warning(f"Follow-up generation failed: {str(e)}")
+        return None
+    choice = choose_followup(candidates, analysis, response)
+    if choice is None:
+        return None
+    speculate_followups(session, choice["question"])
+    return {**choice, "speculative": speculative}
+
+
+def llm_json_text(content: str) -> str:
+    """The JSON object in an LLM reply as compact text; the reply itself when it has none."""
     try:
-        json.loads(json_text)
+        return json.dumps(extract_json(content, dict), ensure_ascii=False)
+    except ValueError:
+        return content.strip()
+
+
+def parse_analysis(analysis_text: str) -> Dict[str, Any]:
+    try:
+        parsed = json.loads(analysis_text)
+        return parsed if isinstance(parsed, dict) else {"raw": analysis_text}
     except Exception:
-        pass
-    return json_text.strip()
+        return {"raw": analysis_text}
 
 
-async def generate_feedback(profile: Dict[str, Any], questions: List[str], responses: List[str], analyses: List[Dict[str, Any]]) -> str:
-    summary = []
+def session_from_transcript(profile: Dict[str, Any], questions: List[str], responses: List[str], analyses: List[Dict[str, Any]]) -> InterviewSession:
+    """Fold a client-supplied transcript into a throwaway session (legacy /feedback and chat)."""
+    session = InterviewSession("transcript", profile)
     for i, q in enumerate(questions):
-        summary.append(f"Q{i+1}: {q}\nA{i+1}: {responses[i] if i < len(responses) else ''}\nAnalysis: {json.dumps(analyses[i] if i < len(analyses) else {}, ensure_ascii=False)}")
-    joined = "\n\n".join(summary)
+        session.record(q, responses[i] if i < len(responses) else "", analyses[i] if i < len(analyses) else {})
+    return session
+
+
+async def generate_session_feedback(session: InterviewSession) -> str:
+    profile = session.profile
     prompt = f"""
 Generate overall interview feedback for role {profile.get('targetRole')}.
 Candidate experience: {profile.get('yearsOfExperience')} years. Skills: {', '.join(profile.get('skills', []))}.
-Data:\n{joined}
+Interview summary (scores averaged over answers, repeated points marked xN):
+{json.dumps(session.summary(), ensure_ascii=False)}
 
 Return raw JSON with keys: overallScore, strengths[], areasForImprovement[], recommendations[], summary.
 """
     content = await send_asi(prompt, temperature=0.3, max_tokens=800, web_search=False)
-    m = re.search(r"```json\n([\s\S]*?)\n```", content)
-    json_text = m.group(1) if m else content
-    try:
-        json.loads(json_text)
-    except Exception:
-        pass
-    return json_text.strip()
+    return llm_json_text(content)
+
+
+async def generate_feedback(profile: Dict[str, Any], questions: List[str], responses: List[str], analyses: List[Dict[str, Any]]) -> str:
+    return await generate_session_feedback(session_from_transcript(profile, questions, responses, analyses))
 
 
 # REST models and endpoints for frontend integration
 class QuestionsRequest(Model):
     profile: Dict[str, Any]
     count: int
+    # Return as soon as the first question exists; fetch the rest via /questions/poll
+    stream: bool = False
 
 
 class QuestionsResponse(Model):
-    questions: List[str]
+    questions: List[str] = []
+    sessionId: Optional[str] = None
+    streamId: Optional[str] = None
+    done: bool = True
+    error: Optional[str] = None
+
+
+class StatsResponse(Model):
+    llmCallsSkipped: int
+    llmCalls: int
+    ragQueries: Dict[str, Any]
+
+
+class QuestionsPollRequest(Model):
+    streamId: str
+    offset: int = 0
 
 
 class AnalysisRequest(Model):
     profile: Dict[str, Any]
     question: str
     response: str
+    sessionId: Optional[str] = None
+    # Also return an adaptive follow-up question chosen for this answer
+    followUp: bool = False
 
 
 class AnalysisResponse(Model):
     analysis: Dict[str, Any]
+    sessionId: Optional[str] = None
+    followUp: Optional[Dict[str, Any]] = None
 
 
-class FeedbackRequest(Model):
+class FollowUpPrepareRequest(Model):
+    sessionId: str
+    question: str
+
+
+class FollowUpPrepareResponse(Model):
+    sessionId: str
+    preparing: bool = False
+    error: Optional[str] = None
+
+
+class AnswerItem(Model):
+    question: str
+    response: str
+
+
+class BatchAnalysisRequest(Model):
     profile: Dict[str, Any]
-    questions: List[str]
-    responses: List[str]
-    analyses: List[Dict[str, Any]]
+    items: List[AnswerItem]
+    sessionId: Optional[str] = None
+
+
+class BatchAnalysisResponse(Model):
+    # One AnalysisResponse-shaped {"analysis": {...}} per item, in request order
+    results: List[Dict[str, Any]]
+    sessionId: Optional[str] = None
+
+
+class FeedbackRequest(Model):
+    profile: Dict[str, Any] = {}
+    sessionId: Optional[str] = None
+    # Legacy: full transcript, used when no live session is given
+    questions: List[str] = []
+    responses: List[str] = []
+    analyses: List[Dict[str, Any]] = []
 
 
 class FeedbackResponse(Model):
-    feedback: Dict[str, Any]
+    feedback: Dict[str, Any] = {}
+    error: Optional[str] = None
 
 
 @interviewer_agent.on_rest_post("/questions", QuestionsRequest, QuestionsResponse)
 async def rest_questions(ctx: Context, req: QuestionsRequest) -> Dict[str, Any]:
+    session = sessions.create(req.profile)
+    if req.stream:
+        stream = question_streams.create(req.count)
+        stream.task = asyncio.create_task(pump_question_stream(stream, req.profile, req.count))
+        session.questions = stream.questions
+        await stream.wait(0, Config.QUESTION_POLL_WAIT)
+        return {**stream.to_dict(), "sessionId": session.id}
     qs_text = await generate_questions(req.profile, req.count)
+    if qs_text is None:
+        return {"questions": [], "sessionId": session.id, "error": "No questions could be generated"}
     questions = [l.strip() for l in qs_text.split("\n") if l.strip()]
-    return {"questions": questions}
+    session.questions = questions
+    return {"questions": questions, "sessionId": session.id}
+
+
+@interviewer_agent.on_rest_post("/questions/poll", QuestionsPollRequest, QuestionsResponse)
+async def rest_questions_poll(ctx: Context, req: QuestionsPollRequest) -> Dict[str, Any]:
+    """Questions of a streamed /questions call from ``offset`` on, long-polling until one is ready."""
+    stream = question_streams.get(req.streamId)
+    if stream is None:
+        # Expected once a stream expires: end the poll with the reason instead of a schema error
+        return {
+            "questions": [],
+            "streamId": req.streamId,
+            "done": True,
+            "error": f"Unknown or expired question stream: {req.streamId}",
+        }
+    await stream.wait(req.offset, Config.QUESTION_POLL_WAIT)
+    return stream.to_dict(req.offset)
 
 
 @interviewer_agent.on_rest_post("/analyze", AnalysisRequest, AnalysisResponse)
 async def rest_analyze(ctx: Context, req: AnalysisRequest) -> Dict[str, Any]:
-    analysis_text = await analyze_response(req.question, req.response, req.profile)
-    try:
-        return {"analysis": json.loads(analysis_text)}
-    except Exception:
-        return {"analysis": {"raw": analysis_text}}
+    session = sessions.get_or_create(req.sessionId, req.profile)
+    if req.followUp:
+        # Runs alongside the analysis if /followup/prepare was not called while the candidate answered
+        speculate_followups(session, req.question)
+    analysis_text = await analyze_response(req.question, req.response, session.profile)
+    analysis = parse_analysis(analysis_text)
+    session.record(req.question, req.response, analysis)
+    follow_up = await pick_followup(session, req.question, req.response, analysis) if req.followUp else None
+    return {"analysis": analysis, "sessionId": session.id, "followUp": follow_up}
+
+
+@interviewer_agent.on_rest_post("/followup/prepare", FollowUpPrepareRequest, FollowUpPrepareResponse)
+async def rest_prepare_followup(ctx: Context, req: FollowUpPrepareRequest) -> Dict[str, Any]:
+    """Call when a question is shown: follow-ups are generated while the candidate is answering."""
+    session = sessions.get(req.sessionId)
+    if session is None:
+        return {"sessionId": req.sessionId, "error": f"Unknown or expired interview session: {req.sessionId}"}
+    speculate_followups(session, req.question)
+    return {"sessionId": session.id, "preparing": True}
+
+
+async def analyze_batch(items: List[AnswerItem], profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Analyse answers concurrently (bounded); a failed item gets an error analysis instead of failing the batch."""
+    limit = asyncio.Semaphore(Config.ANALYZE_BATCH_CONCURRENCY)
+
+    async def one(item: AnswerItem) -> Dict[str, Any]:
+        async with limit:
+            try:
+                return parse_analysis(await analyze_response(item.question, item.response, profile))
+            except Exception as e:
+                logger.warning(f"Batch analysis failed for question '{item.question[:60]}': {str(e)}")
+                return {"error": f"Failed to analyze response: {str(e)}"}
+
+    return await asyncio.gather(*(one(item) for item in items))
+
+
+@interviewer_agent.on_rest_post("/analyze-batch", BatchAnalysisRequest, BatchAnalysisResponse)
+async def rest_analyze_batch(ctx: Context, req: BatchAnalysisRequest) -> Dict[str, Any]:
+    session = sessions.get_or_create(req.sessionId, req.profile)
+    analyses = await analyze_batch(req.items, session.profile)
+    for item, analysis in zip(req.items, analyses):
+        if "error" not in analysis:
+            session.record(item.question, item.response, analysis)
+    return {"results": [{"analysis": a} for a in analyses], "sessionId": session.id}
+
+
+@interviewer_agent.on_rest_get("/stats", StatsResponse)
+async def rest_stats(ctx: Context) -> Dict[str, Any]:
+    return {"llmCallsSkipped": prescore_stats["skipped"], "llmCalls": prescore_stats["llm"], "ragQueries": rag_worker.stats.snapshot()}
 
 
 @interviewer_agent.on_rest_post("/feedback", FeedbackRequest, FeedbackResponse)
 async def rest_feedback(ctx: Context, req: FeedbackRequest) -> Dict[str, Any]:
-    feedback_text = await generate_feedback(req.profile, req.questions, req.responses, req.analyses)
+    session = sessions.get(req.sessionId)
+    if session is not None and session.answered:
+        if req.profile:
+            session.profile.update(req.profile)
+    else:
+        if not req.questions:
+            # Nothing to score: never report feedback for an empty interview
+            if req.sessionId:
+                return {"error": f"Unknown or expired interview session: {req.sessionId}"}
+            return {"error": "No interview session or transcript supplied"}
+        if req.sessionId:
+            logger.info(f"Interview session {req.sessionId} unknown or empty; using the supplied transcript")
+        session = session_from_transcript(req.profile, req.questions, req.responses, req.analyses)
+    feedback_text = await generate_session_feedback(session)
     try:
         return {"feedback": json.loads(feedback_text)}
     except Exception:
@@ -303,25 +692,48 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
     try:
         if payload.startswith("QUESTIONS:"):
             data = extract_json_from_payload(payload[len("QUESTIONS:"):])
-            questions = await generate_questions(data.get("profile", {}), int(data.get("count", 5)))
-            await ctx.send(sender, create_text_chat(questions, end_session=False))
+            if data.get("stream"):
+                # One message per question, sent as soon as each is complete
+                index = 0
+                async for question in iter_questions(data.get("profile", {}), int(data.get("count", 5)), user=sender):
+                    index += 1
+                    await ctx.send(sender, create_text_chat(f"Q{index}: {question}", end_session=False))
+                if not index:
+                    await ctx.send(sender, create_text_chat("No questions could be generated.", end_session=False))
+                return
+            questions = await generate_questions(data.get("profile", {}), int(data.get("count", 5)), user=sender)
+            await ctx.send(sender, create_text_chat(questions or "No questions could be generated.", end_session=False))
             return
         if payload.startswith("ANALYZE:"):
             data = extract_json_from_payload(payload[len("ANALYZE:"):])
-            result = await analyze_response(data.get("question", ""), data.get("response", ""), data.get("profile", {}))
-            await ctx.send(sender, create_text_chat(result, end_session=False))
+            session = sessions.get_or_create(data.get("sessionId"), data.get("profile", {}))
+            question, response = data.get("question", ""), data.get("response", "")
+            if data.get("followUp"):
+                speculate_followups(session, question)
+            result = await analyze_response(question, response, session.profile)
+            analysis = parse_analysis(result)
+            session.record(question, response, analysis)
+            # One JSON object, as before sessions existed, so chat clients can still parse the reply
+            reply = {**analysis, "sessionId": session.id}
+            if data.get("followUp"):
+                reply["followUp"] = await pick_followup(session, question, response, analysis)
+            await ctx.send(sender, create_text_chat(json.dumps(reply), end_session=False))
             return
         if payload.startswith("FEEDBACK:"):
             data = extract_json_from_payload(payload[len("FEEDBACK:"):])
-            result = await generate_feedback(data.get("profile", {}), data.get("questions", []), data.get("responses", []), data.get("analyses", []))
+            session = sessions.get(data.get("sessionId"))
+            if session is not None and session.answered:
+                result = await generate_session_feedback(session)
+            else:
+                result = await generate_feedback(data.get("profile", {}), data.get("questions", []), data.get("responses", []), data.get("analyses", []))
             await ctx.send(sender, create_text_chat(result, end_session=True))
             return
         # Fallback: instruct usage
         help_text = (
             "Send one of the following commands as JSON:\n"
-            "QUESTIONS: {\"profile\": {...}, \"count\": 5}\n"
-            "ANALYZE: {\"profile\": {...}, \"question\": \"...\", \"response\": \"...\"}\n"
-            "FEEDBACK: {\"profile\": {...}, \"questions\": [...], \"responses\": [...], \"analyses\": [...]}"
+            "QUESTIONS: {\"profile\": {...}, \"count\": 5, \"stream\": false}\n"
+            "ANALYZE: {\"profile\": {...}, \"question\": \"...\", \"response\": \"...\", \"sessionId\": \"...\"}\n"
+            "FEEDBACK: {\"sessionId\": \"...\"} or {\"profile\": {...}, \"questions\": [...], \"responses\": [...], \"analyses\": [...]}"
         )
         await ctx.send(sender, create_text_chat(help_text, end_session=True))
     except Exception as e:
@@ -337,6 +749,14 @@ async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
 interviewer_agent.include(chat_proto, publish_manifest=True)
 
 
+@interviewer_agent.on_event("startup")
+async def warm_question_bank(ctx: Context):
+    for profile in Config.QUESTION_BANK_WARM:
+        bucket = QuestionBank.bucket(profile)
+        if await asyncio.to_thread(question_bank.size, bucket) < Config.QUESTION_BANK_LOW_WATER:
+            schedule_refill(bucket, profile)
+
+
 if __name__ == "__main__":
     interviewer_agent.run()
 
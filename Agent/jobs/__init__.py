@@ -0,0 +1,18 @@
+from .aggregator import JobSource, aggregate_jobs, dedupe_jobs, from_jsearch, from_web_search, job_key
+from .index import JobIndex, skill_pattern
+from .pagination import PagedJobCursors
+from .scoring import MatchScorer, rank_by_match
+
+__all__ = [
+    "JobSource",
+    "aggregate_jobs",
+    "dedupe_jobs",
+    "from_jsearch",
+    "from_web_search",
+    "job_key",
+    "JobIndex",
+    "skill_pattern",
+    "PagedJobCursors",
+    "MatchScorer",
+    "rank_by_match",
+]
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import re
+import urllib.parse
+from difflib import SequenceMatcher
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Title similarity above which two postings at the same company are one job
+TITLE_SIMILARITY = 0.88
+# Query parameters that only track where a click came from; utm_* is matched as a prefix
+_TRACKING_PARAMS = {"ref", "src", "source", "trk", "gclid", "fbclid"}
+
+
+class JobSource(NamedTuple):
+    """A job provider: fetch(query, location) returns raw items, normalize maps one to the shared schema."""
+
+    name: str
+    fetch: Callable[[str, str], Awaitable[List[Dict[str, Any]]]]
+    normalize: Callable[[Dict[str, Any]], Dict[str, Any]]
+    timeout: float
+
+
+def from_jsearch(job: Dict[str, Any]) -> Dict[str, Any]:
+    has_salary = job.get("job_min_salary") or job.get("job_max_salary")
+    return {
+        "title": job.get("job_title") or "Software Developer",
+        "company": job.get("employer_name") or "Tech Company",
+        "location": f"{job.get('job_city') or 'Remote'}{', ' + job.get('job_state') if job.get('job_state') else ''}",
+        "description": job.get("job_description") or "Software development position",
+        "link": job.get("job_apply_link") or "",
+        "sourceLink": job.get("job_posting_url") or "",
+        "salary": {
+            "min": job.get("job_min_salary") or 60000,
+            "median": job.get("job_median_salary") or 80000,
+            "max": job.get("job_max_salary") or 100000,
+        } if has_salary else None,
+        "country": job.get("job_country") or "",
+        "postedAt": job.get("job_posted_at_timestamp"),
+    }
+
+
+def from_web_search(job: Dict[str, Any]) -> Dict[str, Any]:
+    salary = job.get("salary")
+    return {
+        "title": job.get("title") or "Software Developer",
+        "company": job.get("company") or "Tech Company",
+        "location": job.get("location") or "Remote",
+        "description": job.get("description") or "",
+        "link": job.get("link") or job.get("url") or "",
+        "sourceLink": job.get("url") or "",
+        "salary": salary if isinstance(salary, dict) else None,
+        "country": "",
+        "postedAt": None,
+    }
+
+
+def canonical_link(link: str) -> str:
+    """Apply link without scheme, www, tracking parameters or trailing slash.
+
+    Only the host is lower-cased; paths and query values can be case-sensitive.
+    """
+    if not link:
+        return ""
+    parts = urllib.parse.urlsplit(link.strip())
+    query = [
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ]
+    host = parts.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    return f"{host}{parts.path.rstrip('/')}?{urllib.parse.urlencode(sorted(query))}"
+
+
+def _norm(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+
+def _company_key(company: str) -> str:
+    return re.sub(r"\b(inc|llc|ltd|limited|corp|corporation|co|pvt|private|gmbh)\b", "", _norm(company)).strip()
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Stable identity for a posting: its canonical apply link, else company + title."""
+    link = canonical_link(job.get("link", ""))
+    return link or f"{_company_key(job.get('company', ''))}|{_norm(job.get('title', ''))}"
+
+
+def _merge(into: Dict[str, Any], other: Dict[str, Any]):
+    for key, value in other.items():
+        if key == "sources":
+            into["sources"] += [s for s in value if s not in into["sources"]]
+        elif not into.get(key) and value:
+            into[key] = value
+        elif key == "description" and len(value or "") > len(into.get(key) or ""):
+            into[key] = value
+
+
+def dedupe_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge postings that share an apply link or a near-identical title at the same company."""
+    merged: List[Dict[str, Any]] = []
+    by_link: Dict[str, Dict[str, Any]] = {}
+    by_company: Dict[str, List[Dict[str, Any]]] = {}
+    for job in jobs:
+        link = canonical_link(job.get("link", ""))
+        company = _company_key(job.get("company", ""))
+        title = _norm(job.get("title", ""))
+        match = by_link.get(link) if link else None
+        if match is None:
+            for candidate in by_company.get(company, []):
+                if SequenceMatcher(None, title, _norm(candidate["title"])).ratio() >= TITLE_SIMILARITY:
+                    match = candidate
+                    break
+        if match is not None:
+            _merge(match, job)
+        else:
+            match = dict(job)
+            merged.append(match)
+            by_company.setdefault(company, []).append(match)
+        if link:
+            by_link.setdefault(link, match)
+    return merged
+
+
+def rank_jobs(jobs: List[Dict[str, Any]], source_order: List[str]) -> List[Dict[str, Any]]:
+    """Jobs confirmed by more sources first, then ones with salary data, then by source priority."""
+    priority = {name: i for i, name in enumerate(source_order)}
+
+    def key(job):
+        best_source = min(priority.get(s, len(priority)) for s in job["sources"])
+        return (-len(job["sources"]), job.get("salary") is None, best_source)
+
+    return sorted(jobs, key=key)
+
+
+async def _fetch_source(source: JobSource, query: str, location: str) -> List[Dict[str, Any]]:
+    try:
+        raw = await asyncio.wait_for(source.fetch(query, location), timeout=source.timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Job source {source.name} timed out after {source.timeout}s")
+        return []
+    except Exception as e:
+        logger.warning(f"Job source {source.name} failed: {str(e)}")
+        return []
+    jobs = []
+    for item in raw or []:
+        if not isinstance(item, dict):
+            continue
+        job = source.normalize(item)
+        job["sources"] = [source.name]
+        jobs.append(job)
+    return jobs
+
+
+async def aggregate_jobs(
+    sources: List[JobSource], query: str, location: str, limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Query every source concurrently, each under its own timeout, and return one merged, ranked list."""
+    results = await asyncio.gather(*(_fetch_source(s, query, location) for s in sources))
+    jobs = [job for batch in results for job in batch]
+    ranked = rank_jobs(dedupe_jobs(jobs), [s.name for s in sources])
+    logger.info(
+        f"Aggregated {len(ranked)} jobs from {len(jobs)} postings "
+        f"({', '.join(f'{s.name}={len(r)}' for s, r in zip(sources, results))})"
+    )
+    return ranked[:limit] if limit else ranked
@@ -0,0 +1,188 @@
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+
+from .aggregator import job_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    country TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL,
+    link TEXT NOT NULL DEFAULT '',
+    source_link TEXT NOT NULL DEFAULT '',
+    salary TEXT,
+    sources TEXT NOT NULL,
+    posted_at REAL,
+    ingested_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+CREATE TABLE IF NOT EXISTS query_regions (
+    region TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    result_count INTEGER NOT NULL
+);
+"""
+
+# How many full-text candidates to re-rank in Python
+CANDIDATES = 200
+# Days over which the recency boost halves
+RECENCY_HALF_LIFE_DAYS = 14
+
+
+def skill_pattern(skill: str) -> "re.Pattern[str]":
+    # Whole-token match that keeps "c++", "c#" and "node.js" intact and stops "go" matching "google"
+    return re.compile(rf"(?<![a-z0-9+#]){re.escape(skill.lower())}(?![a-z0-9+#])")
+
+
+def _fts_terms(terms: Iterable[str]) -> str:
+    quoted = ['"' + t.replace('"', '""') + '"' for t in terms if t and t.strip()]
+    return " OR ".join(quoted)
+
+
+class JobIndex:
+    """Local full-text index of every job listing the agent has seen.
+
+    Listings are upserted by apply link (or company + title) into SQLite with
+    an FTS5 table over title, company, location and description. Each live
+    fetch is recorded as a query region ("role|location") so callers only
+    hit the job APIs when a region is empty or older than its TTL.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def region(query: str, location: str) -> str:
+        return f"{query.strip().lower()}|{location.strip().lower()}"
+
+    def is_stale(self, region: str, ttl: float) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, result_count FROM query_regions WHERE region = ?", (region,)
+            ).fetchone()
+        return row is None or row["result_count"] == 0 or time.time() - row["fetched_at"] > ttl
+
+    def mark_fetched(self, region: str, count: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO query_regions(region, fetched_at, result_count) VALUES (?, ?, ?) "
+                "ON CONFLICT(region) DO UPDATE SET fetched_at = excluded.fetched_at, "
+                "result_count = excluded.result_count",
+                (region, time.time(), count),
+            )
+
+    def ingest(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        now = time.time()
+        count = 0
+        with self._lock, self._conn:
+            for job in jobs:
+                key = job_key(job)
+                existing = self._conn.execute("SELECT sources FROM jobs WHERE key = ?", (key,)).fetchone()
+                sources = list(job.get("sources") or [])
+                if existing:
+                    sources = list(dict.fromkeys(json.loads(existing["sources"]) + sources))
+                self._conn.execute(
+                    "INSERT INTO jobs(key, title, company, location, country, description, link, source_link, "
+                    "salary, sources, posted_at, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET title = excluded.title, company = excluded.company, "
+                    "location = excluded.location, country = excluded.country, "
+                    "description = excluded.description, link = excluded.link, "
+                    "source_link = excluded.source_link, salary = excluded.salary, "
+                    "sources = excluded.sources, posted_at = excluded.posted_at, "
+                    "ingested_at = excluded.ingested_at",
+                    (
+                        key,
+                        job.get("title") or "",
+                        job.get("company") or "",
+                        job.get("location") or "",
+                        job.get("country") or "",
+                        job.get("description") or "",
+                        job.get("link") or "",
+                        job.get("sourceLink") or "",
+                        json.dumps(job["salary"]) if job.get("salary") else None,
+                        json.dumps(sources),
+                        job.get("postedAt"),
+                        now,
+                    ),
+                )
+                count += 1
+        return count
+
+    def search(
+        self, skills: List[str], role: str = "", location: str = "", limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Jobs ranked by skill overlap, role and location match and recency."""
+        match = _fts_terms([role] + list(skills))
+        if not match:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT jobs.*, bm25(jobs_fts) AS relevance FROM jobs_fts "
+                "JOIN jobs ON jobs.id = jobs_fts.rowid WHERE jobs_fts MATCH ? "
+                "ORDER BY relevance LIMIT ?",
+                (match, CANDIDATES),
+            ).fetchall()
+
+        wanted = [skill_pattern(s) for s in skills if s and s.strip()]
+        role_l = role.lower()
+        location_l = location.lower()
+        now = time.time()
+        scored = []
+        for row in rows:
+            text = f"{row['title']} {row['description']}".lower()
+            overlap = sum(1 for s in wanted if s.search(text)) / len(wanted) if wanted else 0.0
+            role_hit = 1.0 if role_l and role_l in row["title"].lower() else 0.0
+            where = f"{row['location']} {row['country']}".lower()
+            location_hit = 1.0 if location_l and (location_l in where or "remote" in where) else 0.0
+            age_days = (now - (row["posted_at"] or row["ingested_at"])) / 86400
+            recency = math.pow(0.5, max(age_days, 0) / RECENCY_HALF_LIFE_DAYS)
+            score = 3 * overlap + role_hit + location_hit + recency
+            scored.append((score, row))
+        scored.sort(key=lambda item: -item[0])
+        return [self._to_job(row, score) for score, row in scored[:limit]]
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row, score: float) -> Dict[str, Any]:
+        return {
+            "key": row["key"],
+            "title": row["title"],
+            "company": row["company"],
+            "location": row["location"],
+            "country": row["country"],
+            "description": row["description"],
+            "link": row["link"],
+            "sourceLink": row["source_link"],
+            "salary": json.loads(row["salary"]) if row["salary"] else None,
+            "sources": json.loads(row["sources"]),
+            "postedAt": row["posted_at"],
+            "indexScore": round(score, 3),
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
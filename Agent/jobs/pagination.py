@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PageFetcher = Callable[[str, str, int], Awaitable[List[Dict[str, Any]]]]
+
+
+class _Cursor:
+    def __init__(self):
+        self.pages: Dict[int, List[Dict[str, Any]]] = {}
+        self.last_page: Optional[int] = None  # first page that came back empty
+        self.created = time.time()
+        self.inflight: Dict[int, asyncio.Task] = {}
+        self.prefetch: Optional[asyncio.Task] = None
+
+
+class PagedJobCursors:
+    """Per-query cursor cache over a paginated job API with background prefetch.
+
+    After a page is served, the next ``prefetch_pages`` pages of the same
+    query are fetched in the background so "show more" is answered from
+    memory. Prefetching spends at most ``hourly_budget`` API calls per hour;
+    pages the user explicitly asks for are always fetched.
+    """
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        prefetch_pages: int = 2,
+        hourly_budget: int = 50,
+        ttl: float = 3600,
+        max_cursors: int = 256,
+    ):
+        self.fetch_page = fetch_page
+        self.prefetch_pages = prefetch_pages
+        self.hourly_budget = hourly_budget
+        self.ttl = ttl
+        self.max_cursors = max_cursors
+        self._cursors: "OrderedDict[Tuple[str, str], _Cursor]" = OrderedDict()
+        self._spent: List[float] = []
+
+    def _cursor(self, query: str, location: str) -> _Cursor:
+        key = (query.strip().lower(), location.strip().lower())
+        cursor = self._cursors.get(key)
+        if cursor is None or time.time() - cursor.created > self.ttl:
+            if cursor and cursor.prefetch:
+                cursor.prefetch.cancel()
+            cursor = _Cursor()
+            self._cursors[key] = cursor
+        self._cursors.move_to_end(key)
+        while len(self._cursors) > self.max_cursors:
+            _, evicted = self._cursors.popitem(last=False)
+            if evicted.prefetch:
+                evicted.prefetch.cancel()
+        return cursor
+
+    def _take_budget(self) -> bool:
+        now = time.time()
+        self._spent = [t for t in self._spent if now - t < 3600]
+        if len(self._spent) >= self.hourly_budget:
+            return False
+        self._spent.append(now)
+        return True
+
+    def _load(self, cursor: _Cursor, query: str, location: str, page: int) -> "asyncio.Task":
+        """Task fetching a page into the cursor; concurrent requests for one page share it."""
+        task = cursor.inflight.get(page)
+        if task is None:
+            task = asyncio.create_task(self._fetch_into(cursor, query, location, page))
+            cursor.inflight[page] = task
+        return task
+
+    async def _fetch_into(self, cursor: _Cursor, query: str, location: str, page: int) -> List[Dict[str, Any]]:
+        try:
+            items = await self.fetch_page(query, location, page)
+        finally:
+            cursor.inflight.pop(page, None)
+        cursor.pages[page] = items
+        if not items and (cursor.last_page is None or page < cursor.last_page):
+            cursor.last_page = page
+        return items
+
+    async def _prefetch(self, cursor: _Cursor, query: str, location: str, after: int):
+        for page in range(after + 1, after + 1 + self.prefetch_pages):
+            if page in cursor.pages:
+                continue
+            if cursor.last_page is not None and page >= cursor.last_page:
+                return
+            if not self._take_budget():
+                logger.info("Job prefetch budget exhausted for this hour")
+                return
+            try:
+                await self._load(cursor, query, location, page)
+            except Exception as e:
+                logger.warning(f"Prefetch of page {page} for '{query}' failed: {str(e)}")
+                return
+
+    async def page(self, query: str, location: str, page: int = 1) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return (items, has_more) for a page, serving from the cursor cache when possible."""
+        cursor = self._cursor(query, location)
+        items = cursor.pages.get(page)
+        if items is None:
+            # Shielded so a cancelled request does not abort a fetch other callers share
+            items = await asyncio.shield(self._load(cursor, query, location, page))
+        if items and (cursor.prefetch is None or cursor.prefetch.done()):
+            cursor.prefetch = asyncio.create_task(self._prefetch(cursor, query, location, page))
+        has_more = bool(items) and (cursor.last_page is None or page + 1 < cursor.last_page)
+        return items, has_more
@@ -0,0 +1,118 @@
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+N_FEATURES = 2 ** 18
+# Share of the match percentage from résumé-skill coverage; the rest is text similarity
+SKILL_WEIGHT = 0.6
+# Vectorized jobs kept, least recently used evicted first (and taken out of the document frequencies)
+MAX_ROWS = 20000
+# Feature hashes memoized before the memo is cleared and rebuilt
+MAX_HASHED_FEATURES = 500000
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[./\-][a-z0-9+#]+)*")
+
+
+def _features(text: str) -> List[str]:
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+class MatchScorer:
+    """Scores a résumé against many jobs with sparse hashed TF-IDF vectors.
+
+    Each job description is hashed once into unigram + bigram features with
+    sublinear term frequency and cached by job key, so scoring thousands of
+    indexed jobs is a CSR assembly plus two sparse matrix-vector products:
+    cosine similarity of the TF-IDF vectors and coverage of the résumé's
+    skills (multi-word skills match as bigrams). At most ``max_rows`` jobs
+    are kept; ``max_rows`` must exceed the jobs scored in one call.
+    """
+
+    def __init__(self, n_features: int = N_FEATURES, max_rows: int = MAX_ROWS):
+        self.n_features = n_features
+        self.max_rows = max_rows
+        self._hash_cache: Dict[str, int] = {}
+        self._rows: "OrderedDict[str, Tuple[int, np.ndarray, np.ndarray]]" = OrderedDict()
+        self._df = np.zeros(n_features, dtype=np.float32)
+        # rank_by_match runs in worker threads; add and score must not interleave
+        self._lock = threading.Lock()
+
+    def _hash(self, feature: str) -> int:
+        h = self._hash_cache.get(feature)
+        if h is None:
+            if len(self._hash_cache) >= MAX_HASHED_FEATURES:
+                self._hash_cache.clear()
+            h = zlib.crc32(feature.encode()) % self.n_features
+            self._hash_cache[feature] = h
+        return h
+
+    def _tf(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        idx = np.fromiter((self._hash(f) for f in _features(text)), dtype=np.int32)
+        cols, counts = np.unique(idx, return_counts=True)
+        return cols, (1 + np.log(counts)).astype(np.float32)
+
+    def add(self, key: str, text: str):
+        """Vectorize a job once; a re-add with changed text replaces its row."""
+        digest = zlib.crc32(text.encode())
+        old = self._rows.get(key)
+        if old is not None:
+            self._rows.move_to_end(key)
+            if old[0] == digest:
+                return
+            self._df[old[1]] -= 1
+        cols, vals = self._tf(text)
+        self._rows[key] = (digest, cols, vals)
+        self._df[cols] += 1
+        while len(self._rows) > self.max_rows:
+            _, (_, evicted, _) = self._rows.popitem(last=False)
+            self._df[evicted] -= 1
+
+    def _matrix(self, keys: List[str]) -> sparse.csr_matrix:
+        rows = [self._rows[k][1:] for k in keys]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(c) for c, _ in rows])
+        indices = np.concatenate([c for c, _ in rows]) if rows else np.zeros(0, dtype=np.int32)
+        data = np.concatenate([v for _, v in rows]) if rows else np.zeros(0, dtype=np.float32)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), self.n_features))
+
+    def score(self, resume_text: str, skills: List[str], keys: List[str]) -> np.ndarray:
+        """Match percentage (0-100) of the résumé against each job key (jobs must be added first)."""
+        if not keys:
+            return np.zeros(0)
+        jobs = self._matrix(keys)
+        idf = np.log((1 + len(self._rows)) / (1 + self._df)) + 1
+
+        jobs_tfidf = jobs.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(jobs_tfidf.multiply(jobs_tfidf).sum(axis=1)).ravel())
+        cols, vals = self._tf(resume_text + " " + " ".join(skills))
+        resume = np.zeros(self.n_features, dtype=np.float32)
+        resume[cols] = vals * idf[cols]
+        resume /= np.linalg.norm(resume) or 1.0
+        cosine = (jobs_tfidf @ resume) / np.where(norms == 0, 1, norms)
+
+        skill_cols = np.unique([self._hash(" ".join(_TOKEN_RE.findall(s.lower()))) for s in skills if s.strip()])
+        if len(skill_cols):
+            present = (jobs[:, skill_cols] > 0).sum(axis=1)
+            coverage = np.asarray(present).ravel() / len(skill_cols)
+        else:
+            coverage = np.zeros(len(keys))
+        return np.round(100 * (SKILL_WEIGHT * coverage + (1 - SKILL_WEIGHT) * cosine), 1)
+
+
+def rank_by_match(
+    scorer: MatchScorer, resume_text: str, skills: List[str], jobs: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Attach matchPercentage to each job (by its "key") and return them best first."""
+    with scorer._lock:
+        for job in jobs:
+            scorer.add(job["key"], f"{job.get('title', '')} {job.get('description', '')}")
+        scores = scorer.score(resume_text, skills, [job["key"] for job in jobs])
+    for job, pct in zip(jobs, scores):
+        job["matchPercentage"] = float(pct)
+    return sorted(jobs, key=lambda j: -j["matchPercentage"])
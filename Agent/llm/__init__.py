@@ -0,0 +1,5 @@
+from .json_extract import extract_json
+
+__all__ = [
+    "extract_json",
+]
@@ -0,0 +1,91 @@
+import json
+import re
+from typing import Any, Iterator, Optional, Tuple, Type, Union
+
+_DECODER = json.JSONDecoder()
+_FENCE = "```"
+# Info string after an opening fence (```json, ``` JSON, ```jsonc ...), up to and including the line break
+_FENCE_INFO = re.compile(r"[ \t]*[A-Za-z0-9_+-]*[ \t]*\r?\n?")
+_VALUE_START = re.compile(r"[\[{]")
+# A JSON string (possibly unterminated) or a single bracket
+_BRACKET_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[\[\]{}]', re.DOTALL)
+
+Expect = Optional[Union[Type, Tuple[Type, ...]]]
+
+
+def _fenced_blocks(text: str) -> Iterator[str]:
+    """Bodies of ``` fenced blocks, tolerating \\r\\n, a missing newline and an unclosed last fence."""
+    pos = text.find(_FENCE)
+    while pos != -1:
+        body_start = _FENCE_INFO.match(text, pos + 3).end()
+        end = text.find(_FENCE, body_start)
+        yield text[body_start:] if end == -1 else text[body_start:end]
+        if end == -1:
+            return
+        pos = text.find(_FENCE, end + 3)
+
+
+def _value_end(text: str, start: int) -> int:
+    """Index just past the bracket that closes the one at ``start``, or -1 when it never closes.
+
+    Strings are skipped whole, so brackets inside them do not count.
+    """
+    depth = 0
+    for token in _BRACKET_TOKEN.finditer(text, start):
+        ch = token.group()
+        if ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    return -1
+
+
+def _first_value(text: str, expect: Expect) -> Tuple[bool, Any]:
+    """First top-level value of the wanted shape.
+
+    Values nested inside a candidate are never returned on their own: a
+    candidate of the wrong shape, or one that fails to parse, is skipped
+    to its closing bracket, and an unclosed (truncated) candidate ends the
+    search. Every character is scanned at most twice.
+    """
+    pos = 0
+    while True:
+        match = _VALUE_START.search(text, pos)
+        if match is None:
+            return False, None
+        try:
+            value, end = _DECODER.raw_decode(text, match.start())
+        except (ValueError, RecursionError):
+            end = _value_end(text, match.start())
+            if end == -1:
+                return False, None
+        else:
+            if expect is None or isinstance(value, expect):
+                return True, value
+        pos = end
+
+
+def extract_json(text: str, expect: Expect = None) -> Any:
+    """First valid JSON object or array in LLM output or a chat payload.
+
+    Fenced blocks are tried first, then the whole text. Candidates start at
+    each top-level '{' or '[' and are parsed with ``JSONDecoder.raw_decode``,
+    so the scan and the parse run in C and trailing prose is ignored.
+    ``expect`` (a type or tuple of types) skips values of the wrong shape,
+    e.g. a leading example array when a dict is wanted. A truncated value
+    yields nothing rather than one of its inner objects.
+
+    Raises ValueError when no such value exists.
+    """
+    if not text:
+        raise ValueError("No JSON value found in empty text")
+    for block in _fenced_blocks(text):
+        found, value = _first_value(block, expect)
+        if found:
+            return value
+    found, value = _first_value(text, expect)
+    if found:
+        return value
+    raise ValueError("No JSON value found")
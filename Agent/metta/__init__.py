@@ -2,11 +2,17 @@ from .resume_rag import ResumeRAG
 from .knowledge import initialize_resume_knowledge
 from .education_rag import EducationRAG
 from .education_knowledge import initialize_education_knowledge
+from .service import KnowledgeClient
+from .factory import create_resume_rag, create_education_rag
+from .async_rag import AsyncRAG
 
 __all__ = [
     "ResumeRAG",
     "initialize_resume_knowledge",
     "EducationRAG",
     "initialize_education_knowledge",
+    "KnowledgeClient",
+    "create_resume_rag",
+    "create_education_rag",
+    "AsyncRAG",
 ]
-
@@ -0,0 +1,96 @@
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.environ.get("RAG_SLOW_QUERY_MS", 50))
+
+
+class QueryStats:
+    """Count, total and worst latency per key (relation or RAG method)."""
+
+    def __init__(self, slow_ms: float = SLOW_QUERY_MS):
+        self.slow_ms = slow_ms
+        self._stats: Dict[str, List[float]] = {}
+
+    def record(self, key: str, seconds: float, detail: str = ""):
+        entry = self._stats.setdefault(key, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        if seconds * 1000 >= self.slow_ms:
+            logger.warning(f"Slow RAG query {key}{' ' + detail if detail else ''}: {seconds * 1000:.1f} ms")
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {
+            key: {"count": n, "avg_ms": total * 1000 / n, "max_ms": worst * 1000}
+            for key, (n, total, worst) in self._stats.items()
+        }
+
+
+class TimedKnowledge:
+    """Wraps a knowledge backend and times every lookup by relation."""
+
+    def __init__(self, kb, stats: QueryStats):
+        self.kb = kb
+        self.stats = stats
+
+    def _timed(self, op: str, relation: str, *args):
+        start = time.perf_counter()
+        try:
+            return getattr(self.kb, op)(relation, *args)
+        finally:
+            self.stats.record(relation, time.perf_counter() - start, f"({op})")
+
+    def add_fact(self, relation: str, subject: str, obj: str):
+        return self._timed("add_fact", relation, subject, obj)
+
+    def query(self, relation: str, subject: str) -> List[str]:
+        return self._timed("query", relation, subject)
+
+    def pairs(self, relation: str) -> List[Tuple[str, str]]:
+        return self._timed("pairs", relation)
+
+    def symbols(self, relation: str) -> List[str]:
+        return self._timed("symbols", relation)
+
+
+class AsyncRAG:
+    """Async facade that keeps RAG work off the uAgents event loop.
+
+    Every call runs on one dedicated worker thread: MeTTa spaces are not
+    thread-safe, and a single worker also serialises the lazy index builds.
+    RAG methods are exposed as coroutines (``await rag.normalize_country(text)``)
+    and ``run`` executes any helper that uses the wrapped RAG on the same thread.
+    Once wrapped, the RAG should only be used through this facade.
+    """
+
+    def __init__(self, rag, name: str, slow_ms: float = SLOW_QUERY_MS):
+        self.rag = rag
+        self.stats = QueryStats(slow_ms)
+        rag.kb = TimedKnowledge(rag.kb, self.stats)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-rag")
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+        finally:
+            # Includes time queued behind other calls, i.e. what the caller waited
+            self.stats.record(getattr(fn, "__name__", "call"), time.perf_counter() - start)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.rag, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        return call
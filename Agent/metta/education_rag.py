@@ -1,42 +1,74 @@
-from typing import List
-from hyperon import MeTTa, E, S, ValueAtom
+from typing import Dict, List, Optional, Tuple, Union
+from hyperon import MeTTa
+
+from .service import KnowledgeClient
+from .store import MeTTaKnowledge
+
+
+_RELATIONS = [
+    base + suffix
+    for base in ("subtopic", "resource")
+    for suffix in ("", "_beginner", "_intermediate", "_advanced")
+]
 
 
 class EducationRAG:
-    def __init__(self, metta: MeTTa):
+    def __init__(self, metta: Union[MeTTa, KnowledgeClient]):
+        # A KnowledgeClient talks to the shared knowledge service instead of a local space
         self.metta = metta
+        self.kb = MeTTaKnowledge(metta) if isinstance(metta, MeTTa) else metta
+        # topic -> relation -> values, built from a single match over the space
+        self._index: Optional[Dict[str, Dict[str, List[str]]]] = None
+        self._profiles: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
 
     def add_fact(self, relation: str, subject: str, obj: str):
-        self.metta.space().add_atom(E(S(relation), S(subject.lower()), ValueAtom(obj)))
+        self.kb.add_fact(relation, subject.lower(), obj)
+        self._index = None
+        self._profiles.clear()
 
     def _query(self, relation: str, subject: str) -> List[str]:
-        subject = subject.strip('"').lower()
-        q = f'!(match &self ({relation} {subject} $x) $x)'
-        result = self.metta.run(q)
-        return [r[0].get_object().value for r in result if r and len(r) > 0]
+        return self.kb.query(relation, subject.strip('"').lower())
+
+    def _build_index(self) -> Dict[str, Dict[str, List[str]]]:
+        if self._index is None:
+            index: Dict[str, Dict[str, List[str]]] = {}
+            # One match per relation head: the space is indexed by head symbol,
+            # whereas a ($rel $topic $x) pattern would walk the whole stdlib too.
+            for rel in _RELATIONS:
+                for topic, value in self.kb.pairs(rel):
+                    index.setdefault(topic, {}).setdefault(rel, []).append(value)
+            self._index = index
+        return self._index
+
+    def topic_profile(self, topic: str, level: str) -> Dict[str, List[str]]:
+        """Generic plus level-specific subtopics and resources in one lookup.
+
+        Results are memoized per (topic, level) until the next add_fact.
+        """
+        key = (topic.strip('"').lower(), level)
+        profile = self._profiles.get(key)
+        if profile is None:
+            facts = self._build_index().get(key[0], {})
+            profile = {
+                "subtopics": _unique(facts.get("subtopic", []) + facts.get("subtopic_" + level, [])),
+                "resources": _unique(facts.get("resource", []) + facts.get("resource_" + level, [])),
+            }
+            self._profiles[key] = profile
+        return profile
 
     def subtopics_for(self, topic: str, level: str) -> List[str]:
-        res = self._query("subtopic", topic)
-        # add level-specific
-        res += self._query("subtopic_" + level, topic)
-        # unique preserve order
-        seen = set()
-        out = []
-        for x in res:
-            if x not in seen:
-                seen.add(x)
-                out.append(x)
-        return out
+        return list(self.topic_profile(topic, level)["subtopics"])
 
     def resources_for(self, topic: str, level: str) -> List[str]:
-        res = self._query("resource", topic)
-        res += self._query("resource_" + level, topic)
-        seen = set()
-        out = []
-        for x in res:
-            if x not in seen:
-                seen.add(x)
-                out.append(x)
-        return out
+        return list(self.topic_profile(topic, level)["resources"])
 
 
+def _unique(values: List[str]) -> List[str]:
+    # unique preserve order
+    seen = set()
+    out = []
+    for x in values:
+        if x not in seen:
+            seen.add(x)
+            out.append(x)
+    return out
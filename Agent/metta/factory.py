@@ -0,0 +1,34 @@
+import os
+
+from hyperon import MeTTa
+
+from .education_knowledge import initialize_education_knowledge
+from .education_rag import EducationRAG
+from .knowledge import initialize_resume_knowledge
+from .resume_rag import ResumeRAG
+from .service import KnowledgeClient
+
+
+def _service_client():
+    url = os.environ.get("KNOWLEDGE_SERVICE_URL")
+    return KnowledgeClient(url) if url else None
+
+
+def create_resume_rag() -> ResumeRAG:
+    """ResumeRAG backed by the shared knowledge service if configured, else a local space."""
+    client = _service_client()
+    if client:
+        return ResumeRAG(client)
+    metta = MeTTa()
+    initialize_resume_knowledge(metta)
+    return ResumeRAG(metta)
+
+
+def create_education_rag() -> EducationRAG:
+    """EducationRAG backed by the shared knowledge service if configured, else a local space."""
+    client = _service_client()
+    if client:
+        return EducationRAG(client)
+    metta = MeTTa()
+    initialize_education_knowledge(metta)
+    return EducationRAG(metta)
@@ -0,0 +1,74 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+# Tokens keep inner dots, dashes and slashes so "node.js" or "ci/cd" stay whole,
+# while trailing punctuation ("india.", "pune,") is dropped.
+_TOKEN_RE = re.compile(r"[A-Za-z0-9+#]+(?:[./\-][A-Za-z0-9+#]+)*")
+
+
+class PhraseMatch(NamedTuple):
+    start: int
+    end: int
+    phrase: str
+    value: str
+    surface: str
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text or "")
+
+
+class PhraseMatcher:
+    """Word-boundary multi-pattern matcher built on a token trie.
+
+    Every phrase is split into tokens and inserted into the trie once, so a
+    text is scanned in a single left-to-right pass and multi-word phrases
+    ("new delhi", "rest api") match as a unit. Overlaps resolve leftmost-longest.
+    """
+
+    def __init__(self, phrases: Iterable[Tuple[str, str]]):
+        self._root: Dict = {}
+        self.size = 0
+        for phrase, value in phrases:
+            self.add(phrase, value)
+
+    def add(self, phrase: str, value: str):
+        tokens = [t.lower() for t in tokenize(phrase)]
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        values = node.setdefault(None, [])
+        if value not in values:
+            values.append(value)
+            self.size += 1
+
+    def find_all(self, text: str) -> List[PhraseMatch]:
+        surface = tokenize(text)
+        tokens = [t.lower() for t in surface]
+        matches: List[PhraseMatch] = []
+        i = 0
+        while i < len(tokens):
+            node = self._root
+            best_end = -1
+            best_values: List[str] = []
+            j = i
+            while j < len(tokens):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if None in node:
+                    best_end = j
+                    best_values = node[None]
+            if best_end == -1:
+                i += 1
+                continue
+            phrase = " ".join(tokens[i:best_end])
+            original = " ".join(surface[i:best_end])
+            for value in best_values:
+                matches.append(PhraseMatch(i, best_end, phrase, value, original))
+            i = best_end
+        return matches
@@ -1,34 +1,81 @@
-from typing import List, Optional
-from hyperon import MeTTa, E, S, ValueAtom
+from typing import List, Optional, Tuple, Union
+from hyperon import MeTTa
+
+from .matcher import PhraseMatcher, tokenize
+from .role_inference import RoleInferenceEngine, RoleScore
+from .service import KnowledgeClient
+from .store import MeTTaKnowledge
 
 
 class ResumeRAG:
-    def __init__(self, metta: MeTTa):
+    def __init__(self, metta: Union[MeTTa, KnowledgeClient]):
+        # A KnowledgeClient talks to the shared knowledge service instead of a local space
         self.metta = metta
+        self.kb = MeTTaKnowledge(metta) if isinstance(metta, MeTTa) else metta
+        self._alias_matcher: Optional[PhraseMatcher] = None
+        self._ambiguous_aliases: Optional[set] = None
+        self._role_engine: Optional[RoleInferenceEngine] = None
 
     def add_fact(self, relation: str, subject: str, obj: str):
-        self.metta.space().add_atom(E(S(relation), S(subject.lower()), ValueAtom(obj.lower())))
+        self.kb.add_fact(relation, subject.lower(), obj.lower())
+        if relation == "country_alias":
+            # Recompile lazily so new aliases are picked up by normalize_country
+            self._alias_matcher = None
+        elif relation == "skill_role":
+            self._role_engine = None
 
     def _query_single(self, relation: str, subject: str) -> List[str]:
-        subject = subject.strip('"').lower()
-        q = f'!(match &self ({relation} {subject} $x) $x)'
-        result = self.metta.run(q)
-        return [r[0].get_object().value for r in result if r and len(r) > 0]
+        return self.kb.query(relation, subject.strip('"').lower())
+
+    def _compile_aliases(self) -> PhraseMatcher:
+        if self._alias_matcher is None:
+            self._alias_matcher = PhraseMatcher(self.kb.pairs("country_alias"))
+            self._ambiguous_aliases = set(self.kb.symbols("ambiguous_alias"))
+        return self._alias_matcher
+
+    def _compile_roles(self) -> RoleInferenceEngine:
+        if self._role_engine is None:
+            self._role_engine = RoleInferenceEngine(self.kb.pairs("skill_role"), self.kb.symbols("ambiguous_skill"))
+        return self._role_engine
 
     def map_skill_to_role(self, skill: str) -> List[str]:
         return self._query_single("skill_role", skill)
 
+    def infer_roles(self, text: str) -> List[RoleScore]:
+        """Ranked roles with confidence from every skill mentioned in free text."""
+        return self._compile_roles().rank(text or "")
+
+    def infer_roles_from_skills(self, skills: List[str]) -> List[RoleScore]:
+        """Ranked roles for an explicit skill list (e.g. skills extracted by the LLM)."""
+        return self._compile_roles().rank(" , ".join(skills), explicit=True)
+
+    def detect_skills(self, text: str) -> List[str]:
+        """Known skills mentioned in text, most frequent first."""
+        mentions = self._compile_roles().detect_skills(text or "")
+        return sorted(mentions, key=lambda s: -mentions[s])
+
+    def find_locations(self, text: str) -> List[Tuple[str, int]]:
+        """Rank every country mentioned in text by frequency, then first position.
+
+        Aliases that double as common words ("in", "us") only count when written
+        as an upper-case code, or when they are the whole text.
+        """
+        matcher = self._compile_aliases()
+        matches = matcher.find_all(text or "")
+        whole_text = len(matches) == 1 and matches[0].end - matches[0].start == len(tokenize(text))
+        counts = {}
+        first_seen = {}
+        for m in matches:
+            if m.phrase in self._ambiguous_aliases and not whole_text and not m.surface.isupper():
+                continue
+            counts[m.value] = counts.get(m.value, 0) + 1
+            first_seen.setdefault(m.value, m.start)
+        ranked = sorted(counts, key=lambda c: (-counts[c], first_seen[c]))
+        return [(c, counts[c]) for c in ranked]
+
     def normalize_country(self, text: str) -> Optional[str]:
-        text = text.lower()
-        countries = self._query_single("country_alias", text)
-        if countries:
-            return countries[0]
-        # try token by token
-        for token in text.replace(",", " ").replace("\n", " ").split():
-            countries = self._query_single("country_alias", token)
-            if countries:
-                return countries[0]
-        return None
+        locations = self.find_locations(text)
+        return locations[0][0] if locations else None
 
     def experience_bucket(self, years: int) -> str:
         # map years to buckets like 0-1, 2-3, 3, 3-5, 5+
@@ -41,5 +88,3 @@ class ResumeRAG:
         if 4 <= years <= 5:
             return "4-5"
         return "6+"
-
-
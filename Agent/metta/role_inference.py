@@ -0,0 +1,78 @@
+import math
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from .matcher import PhraseMatcher
+
+
+TITLE_WEIGHT = 2.0
+
+
+class RoleScore(NamedTuple):
+    role: str
+    confidence: float
+    skills: List[str]
+
+
+class RoleInferenceEngine:
+    """Ranks roles for a text by weighted votes from every detected skill.
+
+    Compiled once from (skill, role) facts into a PhraseMatcher, so a job
+    description is scanned in a single pass with word boundaries ("java"
+    does not fire inside "javascript"). Each distinct skill votes
+    (1 + ln(mentions)) split evenly across the roles it maps to; a role
+    title spelled out in the text ("Backend Engineer") adds TITLE_WEIGHT
+    times that.
+    Ambiguous skills ("go", "swift") only count when written capitalised,
+    unless the caller passes an explicit skill list.
+    """
+
+    def __init__(self, skill_roles: Iterable[Tuple[str, str]], ambiguous: Iterable[str] = ()):
+        skill_roles = list(skill_roles)
+        self.roles = {role for _, role in skill_roles}
+        # Titles share the trie with skills so one pass finds both
+        self.matcher = PhraseMatcher(skill_roles + [(role, role) for role in sorted(self.roles)])
+        self.ambiguous = set(ambiguous)
+
+    def _scan(self, text: str, explicit: bool) -> Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]:
+        mentions: Dict[str, int] = {}
+        roles_by_skill: Dict[str, List[str]] = {}
+        titles: Dict[str, int] = {}
+        for m in self.matcher.find_all(text):
+            if m.phrase == m.value and m.phrase in self.roles:
+                titles[m.phrase] = titles.get(m.phrase, 0) + 1
+                continue
+            if not explicit and m.phrase in self.ambiguous and m.surface.islower():
+                continue
+            roles = roles_by_skill.setdefault(m.phrase, [])
+            # A skill with several roles yields one match per role at the same span
+            if m.value in roles:
+                if roles[0] == m.value:
+                    mentions[m.phrase] += 1
+                continue
+            if not roles:
+                mentions[m.phrase] = 1
+            roles.append(m.value)
+        return mentions, roles_by_skill, titles
+
+    def detect_skills(self, text: str, explicit: bool = False) -> Dict[str, int]:
+        """Mention count per detected skill, in order of first appearance."""
+        return self._scan(text, explicit)[0]
+
+    def rank(self, text: str, explicit: bool = False) -> List[RoleScore]:
+        mentions, roles_by_skill, titles = self._scan(text, explicit)
+        scores: Dict[str, float] = {}
+        voters: Dict[str, List[str]] = {}
+        for role, count in titles.items():
+            scores[role] = TITLE_WEIGHT * (1 + math.log(count))
+            voters[role] = []
+        for skill, count in mentions.items():
+            roles = roles_by_skill[skill]
+            vote = (1 + math.log(count)) / len(roles)
+            for role in roles:
+                scores[role] = scores.get(role, 0.0) + vote
+                voters.setdefault(role, []).append(skill)
+
+        total = sum(scores.values())
+        # Stable sort: ties keep the role whose first voting skill appeared earliest
+        ranked = sorted(scores, key=lambda r: -scores[r])
+        return [RoleScore(r, scores[r] / total, voters[r]) for r in ranked]
@@ -0,0 +1,99 @@
+"""Shared knowledge service: one MeTTa space served to every agent process.
+
+Run with ``python -m metta.service`` (or via ``run_all.py --shared-knowledge``)
+and point agents at it with ``KNOWLEDGE_SERVICE_URL=http://127.0.0.1:5060``.
+"""
+import json
+import logging
+import os
+import urllib.request
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+from hyperon import MeTTa
+
+from .education_knowledge import initialize_education_knowledge
+from .knowledge import initialize_resume_knowledge
+from .store import MeTTaKnowledge
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 5060
+
+
+class KnowledgeClient:
+    """Read-only client for a KnowledgeService with local memoization.
+
+    Exposes the same query/pairs/symbols interface as MeTTaKnowledge, so the
+    RAG classes work unchanged on either. Knowledge is static for the life of
+    the service, so every answer is cached for the life of the process.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._memo: Dict[Tuple[str, ...], Any] = {}
+
+    def _post(self, path: str, payload: Dict[str, str]) -> Any:
+        key = (path,) + tuple(payload.values())
+        if key not in self._memo:
+            request = urllib.request.Request(
+                self.url + path,
+                data=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                self._memo[key] = json.loads(response.read())["result"]
+        return self._memo[key]
+
+    def add_fact(self, relation: str, subject: str, obj: str):
+        raise RuntimeError("Shared knowledge service is read-only; add facts in the service process")
+
+    def query(self, relation: str, subject: str) -> List[str]:
+        return list(self._post("/query", {"relation": relation, "subject": subject}))
+
+    def pairs(self, relation: str) -> List[Tuple[str, str]]:
+        return [tuple(p) for p in self._post("/pairs", {"relation": relation})]
+
+    def symbols(self, relation: str) -> List[str]:
+        return list(self._post("/symbols", {"relation": relation}))
+
+
+def create_knowledge_app(metta: MeTTa) -> web.Application:
+    kb = MeTTaKnowledge(metta)
+
+    async def handle_query(request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({"result": kb.query(body["relation"], body["subject"])})
+
+    async def handle_pairs(request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({"result": kb.pairs(body["relation"])})
+
+    async def handle_symbols(request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({"result": kb.symbols(body["relation"])})
+
+    async def handle_health(request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_post("/query", handle_query)
+    app.router.add_post("/pairs", handle_pairs)
+    app.router.add_post("/symbols", handle_symbols)
+    app.router.add_get("/health", handle_health)
+    return app
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    port = int(os.environ.get("KNOWLEDGE_SERVICE_PORT", DEFAULT_PORT))
+    metta = MeTTa()
+    initialize_resume_knowledge(metta)
+    initialize_education_knowledge(metta)
+    logger.info(f"Serving shared knowledge on 127.0.0.1:{port}")
+    web.run_app(create_knowledge_app(metta), host="127.0.0.1", port=port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Compile versioned knowledge data files into fast-loading binary snapshots.
+
+Knowledge lives in ``metta/data/<name>.json``::
+
+    {"version": 1,
+     "facts": {relation: {subject: [value, ...]}},
+     "markers": {relation: [subject, ...]}}
+
+The first load compiles it into ``<name>.snapshot`` next to the source: a
+marshal blob holding a ready-to-run MeTTa program for plain-symbol facts and
+a flat list for facts whose subject needs a symbol with spaces. Later loads
+read the snapshot directly and recompile only when the source file changes.
+"""
+import hashlib
+import json
+import logging
+import marshal
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from hyperon import MeTTa, E, S, ValueAtom
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+SNAPSHOT_FORMAT = 1
+SUPPORTED_DATA_VERSIONS = (1,)
+
+# Subjects the MeTTa parser reads back as the same symbol
+_PLAIN_SYMBOL = re.compile(r"^[a-z0-9][a-z0-9.+#/_-]*$")
+
+
+def _metta_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def compile_knowledge(source: Path) -> Dict[str, Any]:
+    """Parse a knowledge data file into a snapshot payload."""
+    data = json.loads(source.read_text(encoding="utf-8"))
+    if data.get("version") not in SUPPORTED_DATA_VERSIONS:
+        raise ValueError(f"Unsupported knowledge data version in {source.name}: {data.get('version')!r}")
+
+    program: List[str] = []
+    atoms: List[Tuple[str, str, str]] = []
+    for relation, subjects in data.get("facts", {}).items():
+        for subject, values in subjects.items():
+            subject = subject.lower()
+            for value in values:
+                if _PLAIN_SYMBOL.match(subject):
+                    program.append(f"({relation} {subject} {_metta_string(value)})")
+                else:
+                    atoms.append((relation, subject, value))
+    markers = [
+        (relation, subject.lower())
+        for relation, subjects in data.get("markers", {}).items()
+        for subject in subjects
+    ]
+    return {"program": "\n".join(program), "atoms": atoms, "markers": markers}
+
+
+def _source_fingerprint(source: Path) -> Tuple[int, int]:
+    st = source.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_snapshot(name: str, data_dir: Path = DATA_DIR) -> Dict[str, Any]:
+    """Return the compiled payload for a data file, recompiling if it is stale."""
+    source = data_dir / f"{name}.json"
+    target = data_dir / f"{name}.snapshot"
+    fingerprint = _source_fingerprint(source)
+    digest = None
+
+    if target.exists():
+        try:
+            fmt, stored_fingerprint, stored_digest, payload = marshal.loads(target.read_bytes())
+            if fmt == SNAPSHOT_FORMAT:
+                if tuple(stored_fingerprint) == fingerprint:
+                    return payload
+                # Touched but possibly unchanged (e.g. after a checkout)
+                digest = hashlib.sha256(source.read_bytes()).hexdigest()
+                if stored_digest == digest:
+                    _write_snapshot(target, fingerprint, digest, payload)
+                    return payload
+        except (EOFError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable knowledge snapshot {target.name}: {str(e)}")
+
+    logger.info(f"Compiling knowledge snapshot {target.name}")
+    payload = compile_knowledge(source)
+    digest = digest or hashlib.sha256(source.read_bytes()).hexdigest()
+    _write_snapshot(target, fingerprint, digest, payload)
+    return payload
+
+
+def _write_snapshot(target: Path, fingerprint: Tuple[int, int], digest: str, payload: Dict[str, Any]):
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(marshal.dumps((SNAPSHOT_FORMAT, fingerprint, digest, payload)))
+        os.replace(tmp, target)
+    except OSError as e:
+        # Read-only checkout: keep serving the freshly compiled payload
+        logger.warning(f"Could not write knowledge snapshot {target.name}: {str(e)}")
+
+
+def bulk_load(metta: MeTTa, name: str, data_dir: Path = DATA_DIR):
+    """Load a compiled knowledge snapshot into a MeTTa space."""
+    payload = load_snapshot(name, data_dir)
+    if payload["program"]:
+        metta.run(payload["program"])
+    space = metta.space()
+    for relation, subject, value in payload["atoms"]:
+        space.add_atom(E(S(relation), S(subject), ValueAtom(value)))
+    for relation, subject in payload["markers"]:
+        space.add_atom(E(S(relation), S(subject)))
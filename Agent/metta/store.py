@@ -0,0 +1,30 @@
+from typing import List, Tuple
+from hyperon import MeTTa, E, S, V, ValueAtom
+
+
+class MeTTaKnowledge:
+    """Knowledge facts held in a local MeTTa space.
+
+    Facts are (relation subject value) atoms. Queries go through the space's
+    pattern matcher directly, so multi-word subjects such as "rest api" match
+    the symbol they were stored under.
+    """
+
+    def __init__(self, metta: MeTTa):
+        self.metta = metta
+
+    def add_fact(self, relation: str, subject: str, obj: str):
+        self.metta.space().add_atom(E(S(relation), S(subject), ValueAtom(obj)))
+
+    def query(self, relation: str, subject: str) -> List[str]:
+        result = self.metta.space().query(E(S(relation), S(subject), V("x")))
+        return [b["x"].get_object().value for b in result]
+
+    def pairs(self, relation: str) -> List[Tuple[str, str]]:
+        result = self.metta.space().query(E(S(relation), V("s"), V("x")))
+        return [(b["s"].get_name(), b["x"].get_object().value) for b in result]
+
+    def symbols(self, relation: str) -> List[str]:
+        """Subjects of unary marker atoms such as (ambiguous_alias in)."""
+        result = self.metta.space().query(E(S(relation), V("s")))
+        return [b["s"].get_name() for b in result]
@@ -0,0 +1,15 @@
+from .compression import accepted_encoding, cache_response, compress, dump_json, enable_compression, encode_body
+from .health import HealthResponse, add_health_endpoint
+from .memo import IdentityMemo
+
+__all__ = [
+    "HealthResponse",
+    "IdentityMemo",
+    "accepted_encoding",
+    "add_health_endpoint",
+    "cache_response",
+    "compress",
+    "dump_json",
+    "enable_compression",
+    "encode_body",
+]
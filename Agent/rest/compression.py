@@ -0,0 +1,133 @@
+import contextvars
+import gzip
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from .memo import IdentityMemo
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Bodies smaller than this go out uncompressed; the headers would eat the saving
+MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Pre-encoded bodies kept per agent for responses marked with cache_response()
+ENCODED_ENTRIES = 64
+
+# Per-request state: negotiated encoding, endpoint and the cached result behind the response.
+# REST handlers run in tasks that copy this context, so they share the same dict.
+_request: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("rest_request", default=None)
+
+
+def accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Best encoding we can produce for an Accept-Encoding header: br, then gzip, else None."""
+    offered = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            offered[name.strip()] = quality
+    wildcard = offered.get("*", 0.0)
+    for name in (("br", "gzip") if brotli is not None else ("gzip",)):
+        if offered.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+def dump_json(body: Any) -> bytes:
+    """JSON without padding after separators (ASCII output keeps json's fast C encoder)."""
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def encode_body(body: Any, encoding: Optional[str], min_size: int = MIN_SIZE) -> Tuple[bytes, Optional[str]]:
+    """Serialized and, when worth it, compressed body plus the encoding actually applied."""
+    data = dump_json(body)
+    if encoding is None or len(data) < min_size:
+        return data, None
+    return compress(data, encoding), encoding
+
+
+def cache_response(result: Any):
+    """Mark the current REST response as fully determined by ``result``, a cached object.
+
+    While the same object keeps coming back, its encoded bytes are sent as
+    they are instead of being serialized and compressed again.
+    """
+    state = _request.get()
+    if state is not None:
+        state["result"] = result
+
+
+def enable_compression(agent, min_size: int = MIN_SIZE, max_entries: int = ENCODED_ENTRIES):
+    """Content-negotiated gzip/brotli and compact JSON for an agent's REST responses.
+
+    uAgents has no middleware hook, so this wraps the instance methods its
+    ASGI server uses to run a REST handler and write the JSON reply. Other
+    traffic (envelopes, probes, CORS preflights) is left untouched. Brotli
+    is offered only when the optional ``brotli`` package is installed.
+
+    Raises RuntimeError when the installed uAgents no longer has those
+    private methods, rather than silently serving uncompressed responses.
+    """
+    server = getattr(agent, "_server", None)
+    missing = [name for name in ("_handle_rest", "_asgi_send") if not callable(getattr(server, name, None))]
+    if missing:
+        raise RuntimeError(
+            f"Cannot enable REST compression: this uagents version's ASGI server has no {', '.join(missing)}"
+        )
+    handle_rest = server._handle_rest
+    asgi_send = server._asgi_send
+    encoded = IdentityMemo(max_entries)
+
+    async def _handle_rest(headers, handlers, send, receive):
+        endpoint = next(iter(handlers.values())).endpoint if handlers else ""
+        token = _request.set({
+            "encoding": accepted_encoding((headers.get(b"accept-encoding") or b"").decode("latin-1")),
+            "endpoint": endpoint,
+            "result": None,
+        })
+        try:
+            await handle_rest(headers, handlers, send, receive)
+        finally:
+            _request.reset(token)
+
+    async def _asgi_send(send, status_code: int = 200, headers=None, body=None):
+        state = _request.get()
+        if state is None or headers is not None or not isinstance(body, dict):
+            await asgi_send(send=send, status_code=status_code, headers=headers, body=body)
+            return
+        result = state["result"] if status_code == 200 else None
+        key = (state["endpoint"], state["encoding"])
+        cached = encoded.get(result, *key) if result is not None else None
+        data, encoding = cached or encode_body(body, state["encoding"], min_size)
+        if result is not None and cached is None:
+            encoded.put(result, (data, encoding), *key)
+        response_headers = [
+            [b"content-type", b"application/json"],
+            [b"content-length", str(len(data)).encode()],
+            [b"vary", b"accept-encoding"],
+        ]
+        if encoding:
+            response_headers.append([b"content-encoding", encoding.encode()])
+        await send({"type": "http.response.start", "status": status_code, "headers": response_headers})
+        await send({"type": "http.response.body", "body": data})
+
+    server._handle_rest = _handle_rest
+    server._asgi_send = _asgi_send
+    return agent
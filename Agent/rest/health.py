@@ -0,0 +1,36 @@
+import time
+from typing import Callable, Optional
+
+from uagents import Context, Model
+
+
+class HealthResponse(Model):
+    status: str
+    agent: str
+    ready: bool
+    uptime: float
+
+
+def add_health_endpoint(agent, ready: Optional[Callable[[], bool]] = None):
+    """GET /health on an agent's REST port, for run_all.py's supervisor.
+
+    Answering at all is liveness; ``ready`` turns true once the agent's
+    startup handlers have run and the optional ``ready()`` check passes.
+    """
+    started = {"at": None}
+
+    @agent.on_event("startup")
+    async def _health_startup(ctx: Context):
+        started["at"] = time.time()
+
+    @agent.on_rest_get("/health", HealthResponse)
+    async def _health(ctx: Context) -> HealthResponse:
+        up = started["at"] is not None
+        return HealthResponse(
+            status="ok",
+            agent=agent.name,
+            ready=up and (ready is None or ready()),
+            uptime=round(time.time() - started["at"], 1) if up else 0.0,
+        )
+
+    return agent
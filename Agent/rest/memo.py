@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+class IdentityMemo:
+    """Values derived from an object, reused while that very object comes back.
+
+    The agents' caches hand out the same result object on every hit, so object
+    identity is an exact freshness check: once a cache replaces an entry the new
+    object simply misses. A strong reference is kept per entry (so ids cannot be
+    recycled), bounded to ``max_entries`` least recently used.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, obj: Any, *key: Any) -> Optional[Any]:
+        entry_key = (id(obj),) + key
+        entry = self._entries.get(entry_key)
+        if entry is None or entry[0] is not obj:
+            return None
+        self._entries.move_to_end(entry_key)
+        return entry[1]
+
+    def put(self, obj: Any, value: Any, *key: Any):
+        entry_key = (id(obj),) + key
+        self._entries[entry_key] = (obj, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def render(self, obj: Any, render: Callable[[Any], Any]) -> Any:
+        """``render(obj)``, computed once per object."""
+        value = self.get(obj)
+        if value is None:
+            value = render(obj)
+            self.put(obj, value)
+        return value
@@ -6,7 +6,7 @@ import json
 import asyncio
 import urllib.parse
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 import time
 import PyPDF2
@@ -23,8 +23,20 @@ from uagents_core.contrib.protocols.chat import (
     TextContent,
     chat_protocol_spec,
 )
-from hyperon import MeTTa
-from metta import ResumeRAG, initialize_resume_knowledge
+from metta import AsyncRAG, create_resume_rag
+from jobs import (
+    JobIndex,
+    JobSource,
+    MatchScorer,
+    PagedJobCursors,
+    aggregate_jobs,
+    from_jsearch,
+    from_web_search,
+    rank_by_match,
+    skill_pattern,
+)
+from llm import extract_json
+from rest import IdentityMemo, add_health_endpoint, cache_response, enable_compression
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -43,6 +55,18 @@ class Config:
     MAX_RETRIES = 3
     RETRY_DELAY = 1000  # milliseconds
     CACHE_TTL = 3600  # seconds
+    # Job sources queried concurrently for recommendations, each with its own timeout (seconds)
+    JOB_SOURCES = ["jsearch", "asi_web"]
+    JOB_SOURCE_TIMEOUTS = {"jsearch": 10, "asi_web": 25}
+    DEFAULT_JOB_LOCATION = "united states"
+    MAX_JOB_RESULTS = 5
+    # Local job index: recommendations are served from it; live fetches only refresh stale regions
+    JOB_INDEX_PATH = "job_index.sqlite3"
+    JOB_REGION_TTL = 6 * 3600  # seconds
+    JOB_SCORING_CANDIDATES = 200  # index hits scored against the resume per request
+    # JSearch pages fetched ahead of the user after each page is served, and the hourly call budget for them
+    JSEARCH_PREFETCH_PAGES = 2
+    JSEARCH_PREFETCH_BUDGET = 50
 
 # Validate configuration
 if not all([Config.ASI1_MINI_API_KEY, Config.ASI1_MINI_ENDPOINT, Config.ASI1_MINI_DEPLOYMENT]):
@@ -65,10 +89,13 @@ class Cache:
         self.timestamps[key] = time.time()
 
 analysis_cache = Cache()
+# Chat rendering per cached analysis object
+analysis_text = IdentityMemo()
+job_index = JobIndex(Config.JOB_INDEX_PATH)
+job_scorer = MatchScorer()
 # Initialize MeTTa RAG for resume intelligence
-metta = MeTTa()
-initialize_resume_knowledge(metta)
-resume_rag = ResumeRAG(metta)
+resume_rag = create_resume_rag()
+rag_worker = AsyncRAG(resume_rag, "resume")
 
 
 # Models
@@ -87,6 +114,17 @@ class ResumeAnalysisResponse(Model):
 class PdfUploadRequest(Model):
     pdfBase64: str
 
+class JobPageRequest(Model):
+    query: str
+    location: str = Config.DEFAULT_JOB_LOCATION
+    page: int = 1
+
+class JobPageResponse(Model):
+    jobs: List[Dict[str, Any]] = []
+    page: int
+    hasMore: bool = False
+    error: Optional[str] = None
+
 # Agent setup
 analyzer_agent = Agent(
     name="resume-analyzer-agent",
@@ -95,6 +133,8 @@ analyzer_agent = Agent(
     publish_agent_details=True,
     seed = "resume-analyzer-agent-seed-0001"
 )
+enable_compression(analyzer_agent)
+add_health_endpoint(analyzer_agent)
 
 # Initialize the chat protocol with the standard chat spec
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -161,18 +201,6 @@ def format_analysis(analysis: Dict[str, Any]) -> str:
                 link = j.get("link") or j.get("sourceLink")
                 if link:
                     lines.append("   Link: {}".format(link))
-        # Web search jobs
-        web_jobs = analysis.get("webJobSearch", []) or []
-        if web_jobs:
-            lines.append("\nWeb Search Jobs:")
-            for j in web_jobs:
-                title = j.get("title", "-")
-                company = j.get("company", "-")
-                location = j.get("location", "-")
-                link = j.get("link") or j.get("url")
-                lines.append(f" - {title} at {company} ({location})")
-                if link:
-                    lines.append(f"   Link: {link}")
         return "\n".join(lines).strip()
     except Exception:
         # Fallback to JSON pretty
@@ -252,26 +280,15 @@ async def search_jobs_via_asi_web(query: str, retries: int = Config.MAX_RETRIES)
                     .get("message", {})
                     .get("content", "")
                 )
-                # Try parse JSON array directly
+                # JSON array (or {"jobs": [...]}) directly or inside a fenced block
                 try:
-                    parsed = json.loads(content)
+                    parsed = extract_json(content)
                     if isinstance(parsed, list):
                         return parsed
-                    if isinstance(parsed, dict) and "jobs" in parsed and isinstance(parsed["jobs"], list):
+                    if isinstance(parsed, dict) and isinstance(parsed.get("jobs"), list):
                         return parsed["jobs"]
-                except Exception:
+                except ValueError:
                     pass
-                # Try extract from code block
-                m = re.search(r"```json\n([\s\S]*?)\n```", content)
-                if m:
-                    try:
-                        arr = json.loads(m.group(1))
-                        if isinstance(arr, list):
-                            return arr
-                        if isinstance(arr, dict) and "jobs" in arr and isinstance(arr["jobs"], list):
-                            return arr["jobs"]
-                    except Exception:
-                        pass
                 # Fallback empty
                 return []
     except Exception as e:
@@ -330,34 +347,7 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
     try:
         params = ResumeAnalysisParams(resumeText=resume_text)
         analysis = await analyze_resume(params)
-        # Optional: augment with live web search jobs if the resume implies a role
-        try:
-            primary_skill = (analysis.get("skills") or ["software engineer"])[0]
-            # Map skill to likely role using RAG
-            mapped_roles = resume_rag.map_skill_to_role(primary_skill)
-            role_query = mapped_roles[0] if mapped_roles else primary_skill
-            # Try to detect country or location words from resume text
-            location_hint = resume_rag.normalize_country(resume_text) or "india"
-            # Compose query with role and location
-            web_query = f"{role_query} in {location_hint}"
-            web_jobs = await search_jobs_via_asi_web(web_query)
-            if web_jobs:
-                # Filter jobs to match India if location_hint is India (user requested localized results)
-                if location_hint == "india":
-                    web_jobs = [j for j in web_jobs if (j.get("location") or "").lower().find("india") != -1]
-                # Light filter by years of experience bucket if possible
-                try:
-                    yoe = int(analysis.get("yearsOfExperience") or 0)
-                except Exception:
-                    yoe = 0
-                bucket = resume_rag.experience_bucket(yoe)
-                # Heuristic: filter out roles that mention senior/lead if bucket <= 3
-                if bucket in ("0-1", "2", "3"):
-                    web_jobs = [j for j in web_jobs if not re.search(r"senior|lead|principal", (j.get("title") or ""), re.I)]
-                analysis["webJobSearch"] = web_jobs
-        except Exception as _:
-            pass
-        formatted = format_analysis(analysis)
+        formatted = analysis_text.render(analysis, format_analysis)
         await ctx.send(sender, create_text_chat(formatted, end_session=True))
     except Exception as e:
         ctx.logger.error(f"Failed to analyze resume: {str(e)}", exc_info=True)
@@ -386,6 +376,7 @@ async def handle_rest_analysis_request(ctx: Context, req: ResumeAnalysisParams)
     logger.info(f"Received REST POST request with resume text length: {len(req.resumeText)}")
     try:
         analysis = await analyze_resume(req)
+        cache_response(analysis)
         return {"analysis": analysis}
     except Exception as e:
         logger.error(f"Error analyzing resume: {str(e)}", exc_info=True)
@@ -420,6 +411,24 @@ async def handle_pdf_analysis_request(ctx: Context, req: PdfUploadRequest) -> Di
         logger.error(f"Error processing PDF resume: {str(e)}", exc_info=True)
         return {"error": f"Failed to process PDF resume: {str(e)}"}
 
+@analyzer_agent.on_rest_post("/jobs", JobPageRequest, JobPageResponse)
+async def handle_job_page_request(ctx: Context, req: JobPageRequest) -> Dict[str, Any]:
+    """Paged JSearch results ("show more"); pages after the first are usually served from prefetch."""
+    logger.info(f"Received job page request: '{req.query}' in {req.location}, page {req.page}")
+    page = max(req.page, 1)
+    try:
+        items, has_more = await job_pages.page(req.query, req.location, page)
+        jobs = []
+        for item in items:
+            job = from_jsearch(item)
+            job["sources"] = ["jsearch"]
+            jobs.append(job)
+        await asyncio.to_thread(job_index.ingest, jobs)
+        return {"jobs": jobs, "page": page, "hasMore": has_more}
+    except Exception as e:
+        logger.error(f"Error fetching job page: {str(e)}", exc_info=True)
+        return {"jobs": [], "page": page, "hasMore": False, "error": f"Failed to fetch jobs: {str(e)}"}
+
 async def analyze_resume(params: ResumeAnalysisParams) -> Dict[str, Any]:
     """
     Analyzes a resume and returns structured analysis including ATS score and job recommendations.
@@ -515,33 +524,14 @@ async def analyze_resume(params: ResumeAnalysisParams) -> Dict[str, Any]:
             ```"""
         
         # Parse JSON
-        json_match = re.search(r'```json\n([\s\S]*?)\n```', response_text)
-        if not json_match:
+        try:
+            analysis_result = extract_json(response_text, dict)
+        except ValueError:
             raise ValueError("Failed to extract JSON from response")
-        analysis_result = json.loads(json_match.group(1))
 
-        # Fetch job recommendations
-        job_title = analysis_result.get("skills", ["software developer"])[0]
+        # Fetch job recommendations from every configured source
         try:
-            job_data = await get_job_recommendations(job_title)
-            analysis_result["jobRecommendations"] = [
-                {
-                    "id": index + 1,
-                    "title": job.get("job_title", "Software Developer"),
-                    "company": job.get("employer_name", "Tech Company"),
-                    "location": f"{job.get('job_city', 'Remote')}{', ' + job.get('job_state', '') if job.get('job_state') else ''}",
-                    "description": job.get("job_description", "Software development position")[:200] + "...",
-                    "matchPercentage": min(70 + (index * 5), 95),
-                    "skills": analysis_result.get("skills", [])[:5],
-                    "link": job.get("job_apply_link", ""),
-                    "salary": {
-                        "min": job.get("job_min_salary", 60000) or 60000,
-                        "median": job.get("job_median_salary", 80000) or 80000,
-                        "max": job.get("job_max_salary", 100000) or 100000
-                    } if job.get("job_min_salary") or job.get("job_max_salary") else None,
-                    "sourceLink": job.get("job_posting_url", "")
-                } for index, job in enumerate(job_data.get("data", [])[:3])
-            ]
+            analysis_result["jobRecommendations"] = await find_jobs(analysis_result, params.resumeText)
         except Exception as job_error:
             logger.warning(f"Job recommendation fetch failed: {str(job_error)}")
             analysis_result["jobRecommendations"] = []
@@ -601,14 +591,14 @@ async def send_asi1_request(prompt: str, retries: int = Config.MAX_RETRIES) -> s
                 return await send_asi1_request(prompt, retries - 1)
             raise
 
-async def get_job_recommendations(job_title: str, location: str = "united states") -> Dict[str, Any]:
+async def get_job_recommendations(job_title: str, location: str = "united states", page: int = 1) -> Dict[str, Any]:
     """
-    Fetches job recommendations from RapidAPI.
+    Fetches one page of job recommendations from RapidAPI.
     """
-    logger.info(f"Fetching job recommendations for job title: {job_title}")
+    logger.info(f"Fetching job recommendations for job title: {job_title} (page {page})")
     try:
         async with aiohttp.ClientSession() as session:
-            url = f"{Config.RAPIDAPI_URL}?query={urllib.parse.quote(job_title)}%20in%20{urllib.parse.quote(location)}&page=1&num_pages=1"
+            url = f"{Config.RAPIDAPI_URL}?query={urllib.parse.quote(job_title)}%20in%20{urllib.parse.quote(location)}&page={page}&num_pages=1"
             async with session.get(
                 url,
                 headers={
@@ -625,6 +615,96 @@ async def get_job_recommendations(job_title: str, location: str = "united states
         logger.error(f"Error fetching job recommendations: {str(e)}")
         raise
 
+async def fetch_jsearch_page(query: str, location: str, page: int) -> List[Dict[str, Any]]:
+    data = await get_job_recommendations(query, location, page)
+    return data.get("data", [])
+
+
+# Per-query JSearch cursors; later pages are prefetched in the background after each page is served
+job_pages = PagedJobCursors(
+    fetch_jsearch_page,
+    prefetch_pages=Config.JSEARCH_PREFETCH_PAGES,
+    hourly_budget=Config.JSEARCH_PREFETCH_BUDGET,
+    ttl=Config.CACHE_TTL,
+)
+
+
+async def fetch_jsearch_jobs(query: str, location: str) -> List[Dict[str, Any]]:
+    items, _ = await job_pages.page(query, location, 1)
+    return items
+
+
+async def fetch_web_jobs(query: str, location: str) -> List[Dict[str, Any]]:
+    return await search_jobs_via_asi_web(f"{query} in {location}")
+
+
+def configured_job_sources() -> List[JobSource]:
+    available = {
+        "jsearch": JobSource("jsearch", fetch_jsearch_jobs, from_jsearch, Config.JOB_SOURCE_TIMEOUTS["jsearch"]),
+        "asi_web": JobSource("asi_web", fetch_web_jobs, from_web_search, Config.JOB_SOURCE_TIMEOUTS["asi_web"]),
+    }
+    return [available[name] for name in Config.JOB_SOURCES if name in available]
+
+
+def filter_jobs_for_candidate(jobs: List[Dict[str, Any]], country: str, years: int) -> List[Dict[str, Any]]:
+    """Drop jobs placed in another country and, for juniors, senior/lead roles. Runs on the RAG worker."""
+    kept = []
+    bucket = resume_rag.experience_bucket(years)
+    for job in jobs:
+        if country and country != "remote":
+            job_country = resume_rag.normalize_country(f"{job.get('location', '')} {job.get('country') or ''}")
+            if job_country and job_country not in (country, "remote"):
+                continue
+        # Heuristic: filter out roles that mention senior/lead if bucket <= 3
+        if bucket in ("0-1", "2", "3") and re.search(r"senior|lead|principal", job.get("title") or "", re.I):
+            continue
+        kept.append(job)
+    return kept
+
+
+async def find_jobs(analysis: Dict[str, Any], resume_text: str) -> List[Dict[str, Any]]:
+    """Merged, ranked job recommendations for an analysed resume (REST and chat paths)."""
+    skills = analysis.get("skills") or ["software engineer"]
+    # Weighted role votes across all detected skills using RAG
+    ranked_roles = await rag_worker.infer_roles_from_skills(skills)
+    role_query = ranked_roles[0].role if ranked_roles else skills[0]
+    country = await rag_worker.normalize_country(resume_text) or ""
+    location = country or Config.DEFAULT_JOB_LOCATION
+    region = JobIndex.region(role_query, location)
+    # SQLite calls go to a thread so a large ingest or search does not block the loop
+    if await asyncio.to_thread(job_index.is_stale, region, Config.JOB_REGION_TTL):
+        fetched = await aggregate_jobs(configured_job_sources(), role_query, location)
+        await asyncio.to_thread(job_index.ingest, fetched)
+        await asyncio.to_thread(job_index.mark_fetched, region, len(fetched))
+    else:
+        logger.info(f"Serving job recommendations for '{region}' from the local index")
+    candidates = await asyncio.to_thread(
+        job_index.search, skills, role_query, location, limit=Config.JOB_SCORING_CANDIDATES
+    )
+    # NumPy/SciPy scoring of up to JOB_SCORING_CANDIDATES jobs is CPU work, kept off the loop like the index
+    jobs = await asyncio.to_thread(rank_by_match, job_scorer, resume_text, skills, candidates)
+    try:
+        years = int(analysis.get("yearsOfExperience") or 0)
+    except Exception:
+        years = 0
+    jobs = await rag_worker.run(filter_jobs_for_candidate, jobs, country, years)
+    patterns = [(sk, skill_pattern(sk)) for sk in skills if sk and sk.strip()]
+    return [
+        {
+            "id": index + 1,
+            "title": job["title"],
+            "company": job["company"],
+            "location": job["location"],
+            "description": job["description"][:200] + "...",
+            "matchPercentage": job["matchPercentage"],
+            "skills": [sk for sk, pattern in patterns if pattern.search(job["description"].lower())][:5] or skills[:5],
+            "link": job["link"],
+            "salary": job["salary"],
+            "sourceLink": job["sourceLink"],
+            "sources": job["sources"],
+        } for index, job in enumerate(jobs[:Config.MAX_JOB_RESULTS])
+    ]
+
 async def process_analysis_request(ctx: Context, sender: str, params: ResumeAnalysisParams):
     """
     Processes analysis request and sends response.
@@ -0,0 +1,14 @@
+from .export import MEDIA_TYPES, ExportPool, parse_resume, render_docx, render_pdf
+from .tailoring import mentions, plan_delta, reorder_skills, swap_bullets
+
+__all__ = [
+    "ExportPool",
+    "MEDIA_TYPES",
+    "mentions",
+    "parse_resume",
+    "plan_delta",
+    "render_docx",
+    "render_pdf",
+    "reorder_skills",
+    "swap_bullets",
+]
@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import html
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from docx import Document
+from docx.shared import Pt
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+# Rendered files kept in memory, least recently used evicted first
+CACHE_BYTES = 64 * 1024 * 1024
+
+_BULLET_RE = re.compile(r"^\s*[-*•]\s+")
+_MARKDOWN_RE = re.compile(r"^#+\s*|\*\*|__")
+# All-caps lines with these names are headings even when they contain short words
+SECTION_NAMES = {
+    "summary", "professional summary", "objective", "experience", "work experience", "professional experience",
+    "skills", "technical skills", "education", "certifications", "contact", "contact information", "projects",
+    "awards", "awards and honors", "publications", "languages", "volunteer experience", "interests", "references",
+}
+
+
+def _caps_heading(plain: str) -> bool:
+    """An all-caps line that names a section, not a skill list like "SQL" or "AWS, GCP"."""
+    if not plain.isupper() or len(plain) > 60:
+        return False
+    if " ".join(re.findall(r"[a-z]+", plain.lower())) in SECTION_NAMES:
+        return True
+    return "," not in plain and all(len(word) >= 4 for word in plain.split())
+
+
+def parse_resume(text: str) -> List[Tuple[str, str]]:
+    """Plain-text resume as ("heading" | "bullet" | "text", line) blocks.
+
+    Headings are markdown headings, bold lines, short lines ending in a
+    colon and all-caps lines that name a known section or have no commas
+    and no words under four letters; bullets start with -, * or •.
+    Markdown emphasis is dropped.
+    """
+    blocks = []
+    for raw in (text or "").split("\n"):
+        line = raw.strip()
+        if not line:
+            continue
+        if _BULLET_RE.match(line):
+            blocks.append(("bullet", _MARKDOWN_RE.sub("", _BULLET_RE.sub("", line)).strip()))
+            continue
+        plain = _MARKDOWN_RE.sub("", line).strip()
+        if not plain:
+            continue
+        heading = (
+            line.startswith("#")
+            or (line.startswith("**") and line.endswith("**"))
+            or _caps_heading(plain)
+            or (plain.endswith(":") and len(plain) <= 40)
+        )
+        blocks.append(("heading", plain.rstrip(":")) if heading else ("text", plain))
+    return blocks
+
+
+def render_pdf(text: str) -> bytes:
+    styles = getSampleStyleSheet()
+    heading, body = styles["Heading3"], styles["BodyText"]
+    story = []
+    for kind, line in parse_resume(text):
+        if kind == "heading":
+            story.append(Spacer(1, 4))
+            story.append(Paragraph(html.escape(line.upper()), heading))
+        elif kind == "bullet":
+            story.append(Paragraph(html.escape(line), body, bulletText="•"))
+        else:
+            story.append(Paragraph(html.escape(line), body))
+    out = BytesIO()
+    margin = 0.7 * inch
+    doc = SimpleDocTemplate(
+        out, pagesize=LETTER, leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin,
+        title="Resume", invariant=True,
+    )
+    doc.build(story)
+    return out.getvalue()
+
+
+def render_docx(text: str) -> bytes:
+    doc = Document()
+    doc.styles["Normal"].font.size = Pt(10.5)
+    for kind, line in parse_resume(text):
+        if kind == "heading":
+            doc.add_heading(line.upper(), level=2)
+        elif kind == "bullet":
+            doc.add_paragraph(line, style="List Bullet")
+        else:
+            doc.add_paragraph(line)
+    out = BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+RENDERERS = {"pdf": render_pdf, "docx": render_docx}
+
+
+class ExportPool:
+    """Renders resume text to PDF / DOCX in worker processes, cached by content hash.
+
+    Layout and zipping are CPU-bound, so they run in a process pool instead
+    of on the event loop. Each (format, text) pair is rendered once:
+    concurrent requests share the in-flight render and finished files are
+    kept up to ``max_bytes``.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_bytes: int = CACHE_BYTES):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_bytes = max_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._files: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"rendered": 0, "hits": 0}
+
+    @staticmethod
+    def digest(text: str, fmt: str) -> str:
+        return hashlib.sha256(f"{fmt}\0{text}".encode("utf-8")).hexdigest()
+
+    def _keep(self, key: str, data: bytes):
+        self._files[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes and len(self._files) > 1:
+            _, evicted = self._files.popitem(last=False)
+            self._size -= len(evicted)
+
+    async def _run(self, fmt: str, text: str) -> bytes:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, RENDERERS[fmt], text)
+        except BrokenProcessPool:
+            # A worker died (killed, out of memory); later submits would fail the same way
+            if self._executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            raise
+
+    async def _render_into(self, key: str, text: str, fmt: str) -> bytes:
+        try:
+            try:
+                data = await self._run(fmt, text)
+            except BrokenProcessPool:
+                # Once, on a fresh pool: a file that kills its worker every time still fails
+                data = await self._run(fmt, text)
+            self.stats["rendered"] += 1
+            self._keep(key, data)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def render(self, text: str, fmt: str) -> Tuple[bytes, str]:
+        """Rendered file and its content hash."""
+        if fmt not in RENDERERS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        key = self.digest(text, fmt)
+        data = self._files.get(key)
+        if data is not None:
+            self._files.move_to_end(key)
+            self.stats["hits"] += 1
+            return data, key
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._render_into(key, text, fmt))
+            self._inflight[key] = task
+        return await asyncio.shield(task), key
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,80 @@
+import re
+from typing import Any, Dict, List, Optional
+
+# Most new-skill bullets written into the experience section per tailoring
+MAX_NEW_BULLETS = 4
+# A skill new to the JD's top skills changes what the summary should lead with
+SUMMARY_TOP_SKILLS = 5
+
+_BULLET_RE = re.compile(r"^\s*[-*•]\s+")
+
+
+def mentions(text: str, skill: str) -> bool:
+    return re.search(rf"(?<![a-z0-9+#]){re.escape(skill.lower())}(?![a-z0-9+#])", text.lower()) is not None
+
+
+def _rank(text: str, skills: List[str]) -> int:
+    """Index of the first JD skill the text mentions (JD order), len(skills) when none."""
+    return next((i for i, skill in enumerate(skills) if mentions(text, skill)), len(skills))
+
+
+def plan_delta(base: Dict[str, Any], role: str, years: Optional[int], skills: List[str]) -> Dict[str, Any]:
+    """What of a base resume a new JD invalidates.
+
+    ``base`` holds the role, years and skills the base resume was written
+    for. The summary is rewritten when the role or years differ (a JD that
+    states no years changes nothing) or a top JD skill is new; the skills
+    section is rewritten when any JD skill is new and only reordered
+    otherwise; certifications follow the role; new skills get experience
+    bullets written for them. Everything else is kept.
+    """
+    known = {s.lower() for s in base["skills"]}
+    added = [s for s in skills if s.lower() not in known]
+    role_changed = role != base["role"]
+    years_changed = years is not None and years != base["years"]
+    return {
+        "added": added,
+        "summary": role_changed or years_changed or any(s in added for s in skills[:SUMMARY_TOP_SKILLS]),
+        "skills": bool(added),
+        "certifications": role_changed,
+        "bullets": added[:MAX_NEW_BULLETS],
+    }
+
+
+def reorder_skills(section: str, skills: List[str]) -> str:
+    """Skills section with the JD's skills first: lines by best match, items within "Label: a, b" lines too."""
+    lines = []
+    for line in section.split("\n"):
+        label, sep, items = line.partition(":")
+        if sep and "," in items:
+            parts = [p.strip() for p in items.split(",") if p.strip()]
+            parts.sort(key=lambda p: _rank(p, skills))
+            line = f"{label}: {', '.join(parts)}"
+        lines.append(line)
+    if all(":" in line or not line.strip() for line in lines):
+        lines.sort(key=lambda line: _rank(line, skills) if line.strip() else len(skills) + 1)
+    return "\n".join(line for line in lines if line.strip())
+
+
+def swap_bullets(section: str, new_bullets: List[str], skills: List[str]) -> str:
+    """Experience section with new bullets in place of the least relevant ones.
+
+    Bullets mentioning no JD skill go first (oldest roles first), then the
+    least relevant of the rest; within each role, bullets are then ordered
+    by the JD skills they mention.
+    """
+    lines = section.split("\n")
+    bullets = [i for i, line in enumerate(lines) if _BULLET_RE.match(line)]
+    replace = sorted(bullets, key=lambda i: (-_rank(lines[i], skills), -i))[:len(new_bullets)]
+    for i, text in zip(sorted(replace), new_bullets):
+        lines[i] = f"- {_BULLET_RE.sub('', text).strip()}"
+    # Sort each contiguous bullet block by relevance; headings and dates stay put
+    out, block = [], []
+    for line in lines + [""]:
+        if _BULLET_RE.match(line):
+            block.append(line)
+            continue
+        out.extend(sorted(block, key=lambda b: _rank(b, skills)))
+        block = []
+        out.append(line)
+    return "\n".join(out[:-1])
@@ -4,13 +4,16 @@ from uagents import Agent, Context, Model, Protocol
 import aiohttp
 import json
 import asyncio
-from typing import Literal, List, Union, Dict, Any
+import hashlib
+from typing import Literal, List, Optional, Tuple, Union, Dict, Any
 import logging
 from datetime import datetime, timezone
 from uuid import uuid4
 from uagents.setup import fund_agent_if_low
-from hyperon import MeTTa
-from metta import EducationRAG, initialize_education_knowledge
+from metta import AsyncRAG, create_education_rag
+from llm import extract_json
+from rest import IdentityMemo, add_health_endpoint, cache_response, enable_compression
+from roadmaps import TIMEFRAME_LABELS, WEEKS, assign_subtopics, build_skeleton, reuse_milestones, reuse_resources
 from uagents_core.contrib.protocols.chat import (
     ChatAcknowledgement,
     ChatMessage,
@@ -31,13 +34,24 @@ API_URL = "https://api.asi1.ai/v1/chat/completions"
 MAX_RETRIES = 3
 RETRY_DELAY = 2000  # 2 seconds for server errors
 
+# Skeleton details are written by the LLM in chunks of weeks, concurrently
+PHASE_WEEKS = 13  # a quarter
+MAX_PARALLEL_PHASES = 3
+PHASE_RETRIES = 2  # extra attempts for a chunk that fails or returns invalid output (the only retry layer)
+PHASE_MAX_TOKENS = 3000
+# Longest wait for LLM details before the skeleton placeholders are returned (seconds)
+FILL_TIMEOUT = 90
+
 # In-memory cache
 roadmap_cache = {}
+# Roadmap id -> params, roadmap and week focus it was laid out with, for /roadmap/revise
+roadmap_store: Dict[str, Dict[str, Any]] = {}
+# Chat markdown per cached roadmap object
+roadmap_markdown = IdentityMemo()
 
 # Initialize MeTTa education RAG
-metta = MeTTa()
-initialize_education_knowledge(metta)
-edu_rag = EducationRAG(metta)
+edu_rag = create_education_rag()
+rag_worker = AsyncRAG(edu_rag, "education")
 
 # uAgents models
 class Milestone(Model):
@@ -83,6 +97,13 @@ class RoadmapRequest(Model):
 
 class RoadmapResponse(Model):
     roadmap: dict
+    roadmapId: Optional[str] = None
+
+class RoadmapReviseRequest(Model):
+    roadmapId: str
+    currentLevel: Optional[Literal["beginner", "intermediate", "advanced"]] = None
+    goals: Optional[str] = None
+    timeframe: Optional[Literal["1month", "3months", "6months", "1year"]] = None
 
 roadmap_agent = Agent(
     name="roadmap-agent",
@@ -92,6 +113,8 @@ roadmap_agent = Agent(
     seed = "roadmap-agent-seed-0001"
 
 )
+enable_compression(roadmap_agent)
+add_health_endpoint(roadmap_agent)
 
 # Initialize the chat protocol with the standard chat spec
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -222,7 +245,7 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
                 timeframe=inferred["timeframe"],
             )
             roadmap = await generate_roadmap(params)
-            md = format_roadmap_markdown(roadmap)
+            md = roadmap_markdown.render(roadmap, format_roadmap_markdown)
             response_message = create_text_chat(md, end_session=True)
             await ctx.send(sender, response_message)
         except Exception as e:
@@ -254,11 +277,220 @@ async def handle_rest_roadmap_request(ctx: Context, req: RoadmapParams) -> Roadm
     logger.info(f"Received REST POST request with params: {req}")
     try:
         roadmap = await generate_roadmap(req)
-        return RoadmapResponse(roadmap=roadmap)
+        if roadmap_cache.get(json.dumps(req.to_dict())) is roadmap:
+            cache_response(roadmap)
+        return RoadmapResponse(roadmap=roadmap, roadmapId=roadmap_id(req))
     except Exception as e:
         logger.error(f"Error generating roadmap: {str(e)}", exc_info=True)
         raise Exception(f"Failed to generate roadmap: {str(e)}")
 
+@roadmap_agent.on_rest_post("/roadmap/revise", RoadmapReviseRequest, RoadmapResponse)
+async def handle_rest_roadmap_revise(ctx: Context, req: RoadmapReviseRequest) -> RoadmapResponse:
+    logger.info(f"Received REST revise request: {req}")
+    try:
+        params, roadmap = await revise_roadmap(req)
+        if roadmap_cache.get(json.dumps(params.to_dict())) is roadmap:
+            cache_response(roadmap)
+        return RoadmapResponse(roadmap=roadmap, roadmapId=roadmap_id(params))
+    except Exception as e:
+        logger.error(f"Error revising roadmap: {str(e)}", exc_info=True)
+        raise Exception(f"Failed to revise roadmap: {str(e)}")
+
+async def send_asi1_request(prompt: str, retries: int = MAX_RETRIES, max_tokens: int = 8000, web_search: bool = True) -> str:
+    logger.info(f"Sending ASI1 Mini request (retries left: {retries})")
+    async with aiohttp.ClientSession() as session:
+        request = {
+            "model": "asi1-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Be precise and concise. Return ONLY raw JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.5,
+            "top_p": 0.9,
+            "presence_penalty": 0,
+            "frequency_penalty": 0,
+            "max_tokens": max_tokens,
+            "stream": False,
+            "extra_body": {"web_search": web_search}
+        }
+        try:
+            logger.debug(f"Sending request payload: {json.dumps(request, indent=2)}")
+            async with session.post(
+                API_URL,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {ASI1_MINI_API_KEY}"
+                },
+                json=request,
+            ) as response:
+                error_text = await response.text()
+                logger.debug(f"ASI1 API response status: {response.status}, headers: {response.headers}, body: {error_text}")
+                if not response.ok:
+                    logger.error(f"ASI1 API error: {response.status} - {error_text}")
+                    if response.status in (429, 500, 503) and retries > 0:
+                        await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
+                        return await send_asi1_request(prompt, retries - 1, max_tokens, web_search)
+                    raise Exception(f"ASI1 API error: {response.status} - {error_text}")
+                data = await response.json()
+                if not data.get("choices") or not data["choices"][0].get("message") or not data["choices"][0]["message"].get("content"):
+                    raise Exception(f"Invalid response format from ASI1 API: {json.dumps(data)}")
+                raw_content = data["choices"][0]["message"]["content"]
+                # Accept ```json fenced blocks or raw JSON wrapped in prose
+                try:
+                    content = json.dumps(extract_json(raw_content, dict))
+                except ValueError as e:
+                    logger.error(f"Response content not valid JSON. Raw: {raw_content}")
+                    raise Exception(f"Response is not valid JSON: {str(e)}")
+                return content
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error during ASI1 request: {str(e)}")
+            if retries > 0:
+                await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
+                return await send_asi1_request(prompt, retries - 1, max_tokens, web_search)
+            raise Exception(f"Network error: {str(e)}")
+
+def plan_phases(weeks: List[int]) -> List[List[int]]:
+    """Split weeks into even chunks of at most PHASE_WEEKS, e.g. quarters for a full year."""
+    count = -(-len(weeks) // PHASE_WEEKS)
+    return [weeks[i * len(weeks) // count:(i + 1) * len(weeks) // count] for i in range(count)]
+
+
+def apply_details(milestone: Dict[str, Any], details: Dict[str, Any]) -> bool:
+    """Overlay LLM-written title/description/tasks on a skeleton milestone; the structure stays as laid out."""
+    tasks = details.get("tasks")
+    if not isinstance(tasks, list) or not 3 <= len(tasks) <= 8 or not all(isinstance(t, str) and t.strip() for t in tasks):
+        return False
+    milestone["tasks"] = [t.strip() for t in tasks]
+    if isinstance(details.get("title"), str) and details["title"].strip():
+        milestone["title"] = details["title"].strip()
+    if isinstance(details.get("description"), str) and details["description"].strip():
+        milestone["description"] = details["description"].strip()
+    return True
+
+
+async def fill_phase(params: RoadmapParams, skeleton: Dict[str, Any], focus: List[str], weeks: List[int], limit: asyncio.Semaphore) -> Dict[int, Dict[str, Any]]:
+    """LLM-written details for one chunk of skeleton weeks, keyed by week; retried on its own."""
+    first, last = weeks[0], weeks[-1]
+    layout = [
+        {"week": w, "type": skeleton["milestones"][w - 1]["type"], "focus": focus[w - 1]}
+        for w in weeks
+    ]
+    prompt = f"""
+Write the weekly details of a {TIMEFRAME_LABELS[params.timeframe]} roadmap for learning the educational topic {params.topic}.
+Level: {params.currentLevel}. Goals: {params.goals}.
+The weeks, their milestone types and focus are fixed: {json.dumps(layout)}
+For every week give a title (< 8 words), a one-sentence description and 4-6 focused tasks (< 18 words each).
+Projects must be practical and build on earlier weeks; assessments need timed practice or self-evaluation with clear criteria.
+Output format (raw JSON only): {{"milestones":[{{"week":n,"title":"string","description":"string","tasks":["string"]}}]}}
+"""
+    last_error = None
+    for attempt in range(PHASE_RETRIES + 1):
+        if attempt:
+            # Back off outside the semaphore so other chunks can use the slot meanwhile
+            await asyncio.sleep(RETRY_DELAY * attempt / 1000)
+        try:
+            async with limit:
+                data = json.loads(await send_asi1_request(prompt, retries=0, max_tokens=PHASE_MAX_TOKENS, web_search=False))
+            details = {}
+            for item in data.get("milestones") or []:
+                if isinstance(item, dict) and str(item.get("week", "")).isdigit() and int(item["week"]) in weeks:
+                    details[int(item["week"])] = item
+            if len(details) * 2 < len(layout):
+                raise Exception(f"Only {len(details)} of {len(layout)} weeks returned")
+            return details
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Roadmap weeks {first}-{last} attempt {attempt + 1} failed: {str(e)}")
+    raise Exception(f"Roadmap weeks {first}-{last} failed after {PHASE_RETRIES + 1} attempts: {str(last_error)}")
+
+
+async def fill_resources(params: RoadmapParams, resources: List[Dict[str, Any]], limit: asyncio.Semaphore) -> Dict[str, Dict[str, Any]]:
+    """URLs and one-line descriptions for the RAG's resources, keyed by lower-cased title."""
+    prompt = f"""
+For learning {params.topic} at {params.currentLevel} level, give the official URL and a one-line description of each resource: {json.dumps([r["title"] for r in resources])}
+Output format (raw JSON only): {{"resources":[{{"title":"string","url":"string","description":"string","cost":"free|paid"}}]}}
+"""
+    last_error = None
+    for attempt in range(PHASE_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_DELAY * attempt / 1000)
+        try:
+            async with limit:
+                data = json.loads(await send_asi1_request(prompt, retries=0, max_tokens=1500))
+            return {
+                str(r.get("title", "")).strip().lower(): r
+                for r in data.get("resources") or [] if isinstance(r, dict)
+            }
+        except Exception as e:
+            last_error = e
+            logger.warning(f"Roadmap resources attempt {attempt + 1} failed: {str(e)}")
+    raise Exception(f"Roadmap resources failed after {PHASE_RETRIES + 1} attempts: {str(last_error)}")
+
+
+async def fill_skeleton(
+    params: RoadmapParams,
+    skeleton: Dict[str, Any],
+    focus: List[str],
+    weeks: Optional[List[int]] = None,
+    resources: Optional[List[int]] = None,
+) -> Tuple[bool, List[int]]:
+    """Fill skeleton details in place with concurrent LLM calls.
+
+    ``weeks`` (1-based) and ``resources`` (indexes) limit the fill to those parts;
+    None fills everything. Whatever is not back within FILL_TIMEOUT (or failed)
+    keeps its skeleton placeholder. Returns whether every part was filled and
+    the weeks that were.
+    """
+    weeks = list(range(1, len(focus) + 1)) if weeks is None else sorted(weeks)
+    to_describe = skeleton["resources"] if resources is None else [skeleton["resources"][i] for i in resources]
+    limit = asyncio.Semaphore(MAX_PARALLEL_PHASES)
+    phases = {asyncio.create_task(fill_phase(params, skeleton, focus, chunk, limit)): chunk for chunk in plan_phases(weeks)} if weeks else {}
+    resource_task = asyncio.create_task(fill_resources(params, to_describe, limit)) if to_describe else None
+    tasks = list(phases) + ([resource_task] if resource_task else [])
+    if not tasks:
+        return True, []
+    done, pending = await asyncio.wait(tasks, timeout=FILL_TIMEOUT)
+    for task in pending:
+        task.cancel()
+    complete = not pending
+    filled = []
+    for task, chunk in phases.items():
+        if task not in done or task.exception():
+            complete = False
+            continue
+        details = task.result()
+        for week in chunk:
+            if week in details and apply_details(skeleton["milestones"][week - 1], details[week]):
+                filled.append(week)
+            else:
+                complete = False
+    if resource_task is not None:
+        if resource_task in done and not resource_task.exception():
+            found = resource_task.result()
+            for resource in to_describe:
+                extra = found.get(resource["title"].lower())
+                if extra is None:
+                    # Left out of (or an empty) response: keep trying on the next request
+                    complete = False
+                    continue
+                if isinstance(extra.get("url"), str) and extra["url"].startswith("http"):
+                    resource["url"] = extra["url"]
+                if isinstance(extra.get("description"), str):
+                    resource["description"] = extra["description"]
+                if extra.get("cost") in ("free", "paid"):
+                    resource["cost"] = extra["cost"]
+        else:
+            complete = False
+    return complete, sorted(filled)
+
+
 async def generate_roadmap(params: RoadmapParams) -> dict:
     logger.info(f"Generating roadmap for params: {params}")
     try:
@@ -272,143 +504,94 @@ async def generate_roadmap(params: RoadmapParams) -> dict:
         if params.category != "education":
             raise Exception("This agent only supports education-related roadmaps")  # pyright: ignore[reportUnreachable]
 
-        # Prepare minimal prompt
-        timeframe_map = {
-            "1month": "1 month",
-            "3months": "3 months",
-            "6months": "6 months",
-            "1year": "1 year",
-        }
-        # Use RAG to enrich topic with subtopics/resources
-        subtopics = edu_rag.subtopics_for(params.topic, params.currentLevel)
-        resources = edu_rag.resources_for(params.topic, params.currentLevel)
-        rag_hints = {
-            "subtopics": subtopics[:8],
-            "recommendedResources": resources[:8],
-        }
-
-        weeks_map = {
-            "1month": 4,
-            "3months": 12,
-            "6months": 24,
-            "1year": 52,
-        }
-        total_weeks = weeks_map.get(params.timeframe, 12)
-
-        prompt = f"""
-Create a JSON roadmap for learning the educational topic {params.topic}.
-Level: {params.currentLevel}. Timeframe: {timeframe_map[params.timeframe]}.
-Focus exclusively on educational content, such as academic subjects, teaching methodologies, or educational technologies.
-Incorporate where appropriate these RAG hints (subtopics/resources): {json.dumps(rag_hints)}
-Requirements for depth and quality:
-- Provide exactly {total_weeks} weekly milestones. Include a mix of types: learning, project, assessment. At least 3 project milestones and 2 assessment milestones.
-- Use duration values like "Week 1", "Week 2", ... "Week 12".
-- Each milestone must include 4-6 focused tasks (concise, < 18 words each).
-- Projects must be practical and cumulative (e.g., build features, optimize performance, add tests).
-- Assessments should include self-evaluation or timed practice with clear criteria.
-- Resources should be high-quality and current. Prefer free where possible and include accurate URLs.
-
-Output format (raw JSON only): {{"title":"string","description":"string","milestones":[{{"title":"string","type":"learning|project|assessment","description":"string","duration":"Week n","tasks":["string"]}}],"resources":[{{"title":"string","type":"website|course|video|repository","description":"string","url":"string","level":"beginner|intermediate|advanced","tags":["string"],"cost":"free|paid"}}]}}
-Return ONLY raw JSON (no markdown, no code fences). Ensure valid JSON.
-"""
-
-        async def send_asi1_request(prompt: str, retries: int = MAX_RETRIES) -> str:
-            logger.info(f"Sending ASI1 Mini request (retries left: {retries})")
-            async with aiohttp.ClientSession() as session:
-                request = {
-                    "model": "asi1-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "Be precise and concise. Return ONLY raw JSON."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.5,
-                    "top_p": 0.9,
-                    "presence_penalty": 0,
-                    "frequency_penalty": 0,
-                    "max_tokens": 8000,
-                    "stream": False,
-                    "extra_body": {"web_search": True}
-                }
-                try:
-                    logger.debug(f"Sending request payload: {json.dumps(request, indent=2)}")
-                    async with session.post(
-                        API_URL,
-                        headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "Authorization": f"Bearer {ASI1_MINI_API_KEY}"
-                        },
-                        json=request,
-                    ) as response:
-                        error_text = await response.text()
-                        logger.debug(f"ASI1 API response status: {response.status}, headers: {response.headers}, body: {error_text}")
-                        if not response.ok:
-                            logger.error(f"ASI1 API error: {response.status} - {error_text}")
-                            if response.status in (429, 500, 503) and retries > 0:
-                                await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
-                                return await send_asi1_request(prompt, retries - 1)
-                            raise Exception(f"ASI1 API error: {response.status} - {error_text}")
-                        data = await response.json()
-                        if not data.get("choices") or not data["choices"][0].get("message") or not data["choices"][0]["message"].get("content"):
-                            raise Exception(f"Invalid response format from ASI1 API: {json.dumps(data)}")
-                        raw_content = data["choices"][0]["message"]["content"]
-                        content = raw_content
-                        # Accept ```json fenced blocks or raw JSON. Try to extract fenced JSON first.
-                        try:
-                            import re as _re
-                            m = _re.search(r"```json\n([\s\S]*?)\n```", content)
-                            if m:
-                                content = m.group(1)
-                            else:
-                                # Fallback: trim any stray backticks and extract braces range
-                                s = content.find("{")
-                                e = content.rfind("}")
-                                if s != -1 and e != -1 and e > s:
-                                    content = content[s:e+1]
-                        except Exception:
-                            pass
-                        # Validate JSON
-                        try:
-                            json.loads(content)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Response content not valid JSON. Raw: {raw_content}")
-                            raise Exception(f"Response is not valid JSON: {str(e)}")
-                        return content
-                except aiohttp.ClientError as e:
-                    logger.error(f"Network error during ASI1 request: {str(e)}")
-                    if retries > 0:
-                        await asyncio.sleep(RETRY_DELAY * (MAX_RETRIES - retries + 1) / 1000)
-                        return await send_asi1_request(prompt, retries - 1)
-                    raise Exception(f"Network error: {str(e)}")
-
-        # Call ASI1 Mini API
-        logger.info("Calling ASI1 Mini API")
-        text = await send_asi1_request(prompt)
-
-        try:
-            roadmap_data = json.loads(text)
-            # Validate roadmap structure
-            required_keys = ["title", "description", "milestones", "resources"]
-            if not all(key in roadmap_data for key in required_keys):
-                raise Exception(f"Invalid roadmap structure: missing required keys {required_keys}")
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse ASI1 response as JSON: {text}, error: {str(e)}")
-
-        # Cache the result
-        roadmap_cache[cache_key] = roadmap_data
-        logger.info("Roadmap generated and cached")
-        return roadmap_data
+        # Structure comes from the RAG and the timeframe; the LLM only writes the details
+        profile = await rag_worker.topic_profile(params.topic, params.currentLevel)
+        skeleton = build_skeleton(
+            params.topic, params.currentLevel, params.goals, params.timeframe,
+            profile["subtopics"], profile["resources"][:8],
+        )
+        focus = assign_subtopics(WEEKS[params.timeframe], profile["subtopics"], params.topic)
+        logger.info(f"Filling {len(focus)}-week roadmap skeleton via ASI1 Mini")
+        complete, filled = await fill_skeleton(params, skeleton, focus)
+        keep_roadmap(params, skeleton, focus, profile["subtopics"], filled, complete)
+        return skeleton
 
     except Exception as e:
         logger.error(f"Error generating roadmap: {str(e)}", exc_info=True)
         raise
 
+
+def roadmap_id(params: RoadmapParams) -> str:
+    """Stable id of the roadmap generated for these params."""
+    return hashlib.sha256(json.dumps(params.to_dict()).encode("utf-8")).hexdigest()[:16]
+
+
+def keep_roadmap(
+    params: RoadmapParams, roadmap: Dict[str, Any], focus: List[str], subtopics: List[str], filled: List[int], complete: bool
+):
+    """Store a roadmap for revision, and cache it when the LLM filled every part.
+
+    ``filled`` lists the weeks holding LLM-written details; only those are
+    carried over by a revision, the rest are still skeleton placeholders.
+    """
+    roadmap_store[roadmap_id(params)] = {
+        "params": params.to_dict(),
+        "roadmap": roadmap,
+        "focus": focus,
+        "subtopics": subtopics,
+        "filled": filled,
+    }
+    if complete:
+        roadmap_cache[json.dumps(params.to_dict())] = roadmap
+        logger.info("Roadmap generated and cached")
+    else:
+        # Not cached, so the next request tries the LLM again
+        logger.warning("Returning roadmap with skeleton placeholders for parts the LLM did not fill")
+
+
+async def revise_roadmap(req: RoadmapReviseRequest):
+    """Re-lay a stored roadmap for changed params, asking the LLM only for weeks that changed.
+
+    The new skeleton is built exactly as a full generation would build it; old
+    weeks with the same type and focus subtopic are carried over (for a level
+    change only subtopics both levels share), and so are resources already
+    described. Returns the new params and roadmap.
+    """
+    stored = roadmap_store.get(req.roadmapId)
+    if stored is None:
+        raise Exception(f"Unknown roadmap id {req.roadmapId}; generate it with /roadmap first")
+    old = RoadmapParams(**stored["params"])
+    params = RoadmapParams(**{
+        **stored["params"],
+        **{k: v for k, v in (("currentLevel", req.currentLevel), ("goals", req.goals), ("timeframe", req.timeframe)) if v is not None},
+    })
+    cache_key = json.dumps(params.to_dict())
+    if cache_key in roadmap_cache:
+        logger.info("Returning cached roadmap for revised params")
+        return params, roadmap_cache[cache_key]
+
+    subtopics = stored["subtopics"]
+    reusable = None
+    resource_names = [r["title"] for r in stored["roadmap"]["resources"]]
+    if params.currentLevel != old.currentLevel:
+        profile = await rag_worker.topic_profile(params.topic, params.currentLevel)
+        reusable = set(subtopics) & set(profile["subtopics"])
+        subtopics, resource_names = profile["subtopics"], profile["resources"][:8]
+    skeleton = build_skeleton(params.topic, params.currentLevel, params.goals, params.timeframe, subtopics, resource_names)
+    focus = assign_subtopics(WEEKS[params.timeframe], subtopics, params.topic)
+    weeks = reuse_milestones(
+        stored["roadmap"]["milestones"], stored["focus"], skeleton, focus, reusable, set(stored["filled"])
+    )
+    resources = reuse_resources(stored["roadmap"]["resources"], skeleton, params.currentLevel)
+    logger.info(
+        f"Revising roadmap {req.roadmapId}: reused {len(focus) - len(weeks)} of {len(focus)} weeks, "
+        f"filling {len(weeks)} weeks and {len(resources)} resources via ASI1 Mini"
+    )
+    complete, filled = await fill_skeleton(params, skeleton, focus, weeks, resources)
+    reused = set(range(1, len(focus) + 1)) - set(weeks)
+    keep_roadmap(params, skeleton, focus, subtopics, sorted(reused | set(filled)), complete)
+    return params, skeleton
+
 async def process_roadmap_request(ctx: Context, sender: str, params: RoadmapParams):
     logger.info(f"Processing roadmap request from {sender} with params: {params}")
     try:
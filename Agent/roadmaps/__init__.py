@@ -0,0 +1,11 @@
+from .revise import reuse_milestones, reuse_resources
+from .skeleton import TIMEFRAME_LABELS, WEEKS, assign_subtopics, build_skeleton
+
+__all__ = [
+    "TIMEFRAME_LABELS",
+    "WEEKS",
+    "assign_subtopics",
+    "build_skeleton",
+    "reuse_milestones",
+    "reuse_resources",
+]
@@ -0,0 +1,51 @@
+import copy
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+
+
+def reuse_milestones(
+    old_milestones: List[Dict[str, Any]],
+    old_focus: List[str],
+    skeleton: Dict[str, Any],
+    new_focus: List[str],
+    reusable: Optional[Set[str]] = None,
+    filled: Optional[Set[int]] = None,
+) -> List[int]:
+    """Copy already written weeks into a new skeleton; returns the weeks still to be written.
+
+    A new week takes the next unused old milestone with the same type and
+    focus subtopic, in order, so a subtopic that gains weeks keeps its old
+    ones and only the inserted weeks are new, and one that loses weeks drops
+    its last ones. ``reusable`` limits reuse to those subtopics (e.g. the
+    ones shared by the old and new level); None allows all. ``filled`` holds
+    the old weeks (1-based) the LLM actually wrote; the others are skeleton
+    placeholders and are never reused. None treats every old week as written.
+    """
+    pool: Dict[tuple, deque] = {}
+    for week, (milestone, focus) in enumerate(zip(old_milestones, old_focus), start=1):
+        if filled is not None and week not in filled:
+            continue
+        pool.setdefault((milestone.get("type"), focus), deque()).append(milestone)
+    missing = []
+    for week, (milestone, focus) in enumerate(zip(skeleton["milestones"], new_focus), start=1):
+        candidates = pool.get((milestone["type"], focus))
+        if candidates and (reusable is None or focus in reusable):
+            reused = copy.deepcopy(candidates.popleft())
+            reused["duration"] = milestone["duration"]
+            skeleton["milestones"][week - 1] = reused
+        else:
+            missing.append(week)
+    return missing
+
+
+def reuse_resources(old_resources: List[Dict[str, Any]], skeleton: Dict[str, Any], level: str) -> List[int]:
+    """Copy already described resources into a new skeleton; returns indexes of ones still to describe."""
+    known = {str(r.get("title", "")).lower(): r for r in old_resources}
+    missing = []
+    for i, resource in enumerate(skeleton["resources"]):
+        old = known.get(resource["title"].lower())
+        if old is not None and old.get("url"):
+            skeleton["resources"][i] = {**copy.deepcopy(old), "level": level}
+        else:
+            missing.append(i)
+    return missing
@@ -0,0 +1,120 @@
+from typing import Any, Dict, List
+
+WEEKS = {"1month": 4, "3months": 12, "6months": 24, "1year": 52}
+TIMEFRAME_LABELS = {"1month": "1 month", "3months": "3 months", "6months": "6 months", "1year": "1 year"}
+# Every PROJECT_EVERY-th week and the final week are projects; every ASSESSMENT_EVERY-th and the
+# second-to-last week are assessments (projects win a tie)
+PROJECT_EVERY = 4
+ASSESSMENT_EVERY = 6
+
+_RESOURCE_TYPES = (
+    ("youtube", "youtube"),
+    ("podcast", "podcast"),
+    ("video", "video"),
+    ("github", "repository"),
+    ("repo", "repository"),
+    ("course", "course"),
+    ("coursera", "course"),
+    ("udemy", "course"),
+    ("book", "book"),
+    ("tutorial", "tutorial"),
+)
+
+
+def milestone_type(week: int, total: int) -> str:
+    if week == total or week % PROJECT_EVERY == 0:
+        return "project"
+    if week == total - 1 or week % ASSESSMENT_EVERY == 0:
+        return "assessment"
+    return "learning"
+
+
+def assign_subtopics(total: int, subtopics: List[str], topic: str) -> List[str]:
+    """Subtopic per week, in the RAG's order, as contiguous blocks of roughly equal length."""
+    if not subtopics:
+        return [topic] * total
+    return [subtopics[(week * len(subtopics)) // total] for week in range(total)]
+
+
+def _tasks(kind: str, subtopic: str, covered: str) -> List[str]:
+    if kind == "project":
+        return [
+            f"Plan a small project that applies {subtopic}",
+            "Implement the core features in small, tested steps",
+            "Write tests and fix the issues they reveal",
+            "Document the project and share it for feedback",
+        ]
+    if kind == "assessment":
+        return [
+            f"Review your notes on {covered}",
+            "Complete a timed practice set without references",
+            "Score yourself against a checklist of the key concepts",
+            "List weak areas to revisit next week",
+        ]
+    return [
+        f"Study the core concepts of {subtopic}",
+        f"Work through a tutorial or course section on {subtopic}",
+        f"Summarise the key ideas of {subtopic} in your own words",
+        f"Practice {subtopic} with short exercises",
+    ]
+
+
+def _resource(name: str, topic: str, level: str) -> Dict[str, Any]:
+    lowered = name.lower()
+    kind = next((t for needle, t in _RESOURCE_TYPES if needle in lowered), "website")
+    return {
+        "title": name,
+        "type": kind,
+        "description": "",
+        "url": None,
+        "level": level,
+        "tags": [topic],
+        "cost": "free",
+    }
+
+
+def build_skeleton(
+    topic: str, level: str, goals: str, timeframe: str, subtopics: List[str], resources: List[str]
+) -> Dict[str, Any]:
+    """A complete, schema-valid roadmap laid out without the LLM.
+
+    Week count comes from the timeframe, milestone types from fixed project /
+    assessment placement and each week's focus from the RAG subtopics. Titles,
+    descriptions and tasks are generic placeholders the LLM later rewrites.
+    """
+    total = WEEKS.get(timeframe, 12)
+    focus = assign_subtopics(total, subtopics, topic)
+    kinds = [milestone_type(week, total) for week in range(1, total + 1)]
+    learning_weeks = {}
+    for subtopic, kind in zip(focus, kinds):
+        if kind == "learning":
+            learning_weeks[subtopic] = learning_weeks.get(subtopic, 0) + 1
+    seen = {}
+    milestones = []
+    for week in range(1, total + 1):
+        kind = kinds[week - 1]
+        # Projects apply what the previous week covered
+        subtopic = focus[week - 2] if kind == "project" and week > 1 else focus[week - 1]
+        covered = ", ".join(dict.fromkeys(focus[max(0, week - ASSESSMENT_EVERY):week]))
+        if kind == "project":
+            title = f"Project: {subtopic}" if week < total else f"Capstone project: {topic}"
+        elif kind == "assessment":
+            title = f"Assessment: {covered}"
+        else:
+            seen[subtopic] = seen.get(subtopic, 0) + 1
+            title = subtopic[:1].upper() + subtopic[1:]
+            if learning_weeks[subtopic] > 1:
+                title += f" (part {seen[subtopic]})"
+        milestones.append({
+            "title": title,
+            "type": kind,
+            "description": f"{kind.capitalize()} week focused on {subtopic}.",
+            "duration": f"Week {week}",
+            "tasks": _tasks(kind, subtopic, covered),
+        })
+    return {
+        "title": f"{topic.title()} Roadmap ({TIMEFRAME_LABELS.get(timeframe, timeframe)})",
+        "description": f"A {TIMEFRAME_LABELS.get(timeframe, timeframe)} {level} roadmap for {topic}. Goals: {goals}",
+        "milestones": milestones,
+        "resources": [_resource(name, topic, level) for name in resources],
+    }
@@ -1,16 +1,42 @@
+import argparse
 import asyncio
+import contextlib
+import json
+import os
 import signal
 import sys
+import time
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence
 
+import aiohttp
+from aiohttp import web
 
-AGENT_FILES = [
-    "genrator.py",                 # Resume generator
-    "resume-analyzer-agent.py",    # Resume analyzer
-    "roadmap.py",                  # Roadmap generator
-    "interviewer-agent.py",        # AI interviewer
+
+# name, script, REST port (must match the script's Agent(port=...)), agents it waits for
+AGENTS = [
+    ("genrator", "genrator.py", 5052, ()),                               # Resume generator
+    ("resume-analyzer-agent", "resume-analyzer-agent.py", 5053, ()),     # Resume analyzer
+    ("roadmap", "roadmap.py", 5051, ()),                                 # Roadmap generator
+    ("interviewer-agent", "interviewer-agent.py", 5054, ()),             # AI interviewer
 ]
 
+# Must match metta.service; not imported so the launcher stays free of hyperon
+KNOWLEDGE_SERVICE_PORT = int(os.environ.get("KNOWLEDGE_SERVICE_PORT", 5060))
+# GET /status here reports every process's state, uptime and restart count
+SUPERVISOR_PORT = int(os.environ.get("SUPERVISOR_PORT", 5050))
+
+PROBE_INTERVAL = 5  # seconds between liveness probes of a ready process
+PROBE_TIMEOUT = 3
+LIVENESS_FAILURES = 3  # consecutive failed probes before a hung process is restarted
+# Longest wait for a (re)started process to report ready. /health reports ready only once
+# uagents has run the startup handlers, which come after its Agentverse registration and
+# ledger calls; those take about 35 s to time out when offline, so keep this well above that.
+READY_TIMEOUT = 180
+BACKOFF_INITIAL = 1
+BACKOFF_MAX = 60
+BACKOFF_RESET = 60  # a process up this long has its backoff reset
+
 
 async def stream_output(prefix: str, stream: asyncio.StreamReader):
     while True:
@@ -24,72 +50,233 @@ async def stream_output(prefix: str, stream: asyncio.StreamReader):
         print(f"[{prefix}] {text}")
 
 
-async def start_agent(script_path: Path):
-    proc = await asyncio.create_subprocess_exec(
-        sys.executable,
-        str(script_path),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-    )
-    prefix = script_path.stem
-    stream_task = asyncio.create_task(stream_output(prefix, proc.stdout))  # type: ignore[arg-type]
-    return proc, stream_task
+class Supervised:
+    """One child process kept alive: started after its dependencies are ready,
+    probed on ``/health``, restarted with exponential backoff when it exits,
+    hangs or never becomes ready.
 
+    Every (re)start waits for the dependencies again. A running process is not
+    restarted when a dependency restarts; it is expected to retry its calls.
+    """
 
-async def main():
-    agent_dir = Path(__file__).parent
-    scripts = [agent_dir / name for name in AGENT_FILES]
+    def __init__(self, name: str, args: Sequence[str], port: int, cwd: Path, after: Sequence[str] = ()):
+        self.name = name
+        self.args = list(args)
+        self.port = port
+        self.cwd = cwd
+        self.after = list(after)
+        self.env: Optional[Dict[str, str]] = None
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.state = "pending"
+        self.restarts = 0
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.last_exit: Optional[int] = None
+        self.ready = asyncio.Event()
 
-    print("Starting agents:")
-    for s in scripts:
-        print(f" - {s.name}")
+    @property
+    def health_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/health"
 
-    processes = []
-    stream_tasks = []
-    try:
-        for script in scripts:
-            proc, stask = await start_agent(script)
-            processes.append(proc)
-            stream_tasks.append(stask)
-
-        # Handle Ctrl+C for graceful shutdown
-        stop_event = asyncio.Event()
-
-        def _handle_sigint():
-            stop_event.set()
-
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            try:
-                loop.add_signal_handler(sig, _handle_sigint)
-            except NotImplementedError:
-                # Windows
-                pass
-
-        await stop_event.wait()
-    finally:
-        print("\nStopping agents...")
-        for p in processes:
-            if p.returncode is None:
-                p.terminate()
-        # Give them a moment to exit
+    def status(self) -> dict:
+        now = time.time()
+        return {
+            "state": self.state,
+            "pid": self.proc.pid if self.proc and self.proc.returncode is None else None,
+            "port": self.port,
+            "uptime": round(now - self.started_at, 1) if self.started_at and self.state != "backoff" else 0.0,
+            "readySince": self.ready_at,
+            "restarts": self.restarts,
+            "lastExit": self.last_exit,
+        }
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            print(f"[supervisor] {self.name}: {self.state} -> {state}")
+            self.state = state
+
+    async def probe(self, session: aiohttp.ClientSession) -> Optional[bool]:
+        """None when /health does not answer (not live), else whether the process reports ready."""
         try:
-            await asyncio.wait_for(asyncio.gather(*(p.wait() for p in processes)), timeout=5)
+            async with session.get(self.health_url, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)) as resp:
+                if resp.status != 200:
+                    return None
+                body = await resp.json(content_type=None)
+                return bool(body.get("ready", True)) if isinstance(body, dict) else True
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError, ValueError):
+            return None
+
+    async def _spawn(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            *self.args,
+            cwd=str(self.cwd),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=self.env,
+        )
+        self.started_at = time.time()
+        self.ready_at = None
+        asyncio.create_task(stream_output(self.name, self.proc.stdout))  # type: ignore[arg-type]
+
+    async def _wait_ready(self, session: aiohttp.ClientSession) -> bool:
+        deadline = time.time() + READY_TIMEOUT
+        while time.time() < deadline and self.proc.returncode is None:
+            if await self.probe(session):
+                return True
+            await asyncio.sleep(0.5)
+        return False
+
+    async def _watch(self, session: aiohttp.ClientSession):
+        """Return once the process exits or stops answering its liveness probe."""
+        failures = 0
+        while self.proc.returncode is None:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.proc.wait(), timeout=PROBE_INTERVAL)
+                return
+            live = await self.probe(session)
+            failures = 0 if live is not None else failures + 1
+            if failures >= LIVENESS_FAILURES:
+                print(f"[supervisor] {self.name}: no answer on {self.health_url} {failures} times, restarting")
+                return
+
+    async def _wait_for(self, deps: List["Supervised"]):
+        # Re-checked until all are ready at once, in case one restarts while waiting on another
+        while not all(dep.ready.is_set() for dep in deps):
+            for dep in deps:
+                if not dep.ready.is_set():
+                    self._set_state(f"waiting for {dep.name}")
+                    await dep.ready.wait()
+
+    async def run(self, deps: List["Supervised"], session: aiohttp.ClientSession):
+        backoff = BACKOFF_INITIAL
+        while True:
+            await self._wait_for(deps)
+            self._set_state("starting")
+            await self._spawn()
+            if await self._wait_ready(session):
+                self.ready_at = time.time()
+                self._set_state("ready")
+                self.ready.set()
+                await self._watch(session)
+            elif self.proc.returncode is None:
+                print(f"[supervisor] {self.name}: not ready after {READY_TIMEOUT}s, restarting")
+            self.ready.clear()
+            await self.stop()
+            self.last_exit = self.proc.returncode
+            if time.time() - self.started_at >= BACKOFF_RESET:
+                backoff = BACKOFF_INITIAL
+            self.restarts += 1
+            self._set_state("backoff")
+            print(f"[supervisor] {self.name}: exited with {self.last_exit}; restart #{self.restarts} in {backoff}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, BACKOFF_MAX)
+
+    async def stop(self, timeout: float = 5):
+        if self.proc is None or self.proc.returncode is not None:
+            return
+        self.proc.terminate()
+        try:
+            await asyncio.wait_for(self.proc.wait(), timeout=timeout)
         except asyncio.TimeoutError:
-            for p in processes:
-                if p.returncode is None:
-                    p.kill()
-        for t in stream_tasks:
-            t.cancel()
-        # Drain cancellations
-        with contextlib.suppress(Exception):
-            await asyncio.gather(*stream_tasks)
+            self.proc.kill()
+            await self.proc.wait()
+
+
+def dependency_order(services: Dict[str, Supervised]) -> List[Supervised]:
+    """Services with every dependency before its dependents; rejects unknown names and cycles."""
+    ordered, visiting, done = [], set(), set()
+
+    def visit(name: str):
+        if name in done:
+            return
+        if name in visiting:
+            raise RuntimeError(f"Dependency cycle through {name}")
+        if name not in services:
+            raise RuntimeError(f"Unknown dependency {name}")
+        visiting.add(name)
+        for dep in services[name].after:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        ordered.append(services[name])
+
+    for name in services:
+        visit(name)
+    return ordered
+
+
+async def serve_status(services: List[Supervised]) -> web.AppRunner:
+    started = time.time()
+
+    async def handle_status(request: web.Request) -> web.Response:
+        return web.json_response({
+            "uptime": round(time.time() - started, 1),
+            "services": {s.name: s.status() for s in services},
+        })
+
+    app = web.Application()
+    app.router.add_get("/status", handle_status)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", SUPERVISOR_PORT).start()
+    return runner
+
+
+async def main(shared_knowledge: bool = False):
+    agent_dir = Path(__file__).parent
+    services: Dict[str, Supervised] = {}
+    if shared_knowledge:
+        services["knowledge"] = Supervised("knowledge", ["-m", "metta.service"], KNOWLEDGE_SERVICE_PORT, agent_dir)
+    for name, script, port, after in AGENTS:
+        services[name] = Supervised(name, [str(agent_dir / script)], port, agent_dir, after)
+    if shared_knowledge:
+        env = {**os.environ, "KNOWLEDGE_SERVICE_URL": f"http://127.0.0.1:{KNOWLEDGE_SERVICE_PORT}"}
+        for name, *_ in AGENTS:
+            services[name].env = env
+            services[name].after.append("knowledge")
+    ordered = dependency_order(services)
+
+    print("Supervising:")
+    for s in ordered:
+        print(f" - {s.name} (port {s.port}{', after ' + ', '.join(s.after) if s.after else ''})")
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows
+            pass
+
+    runner = await serve_status(ordered)
+    print(f"Supervisor status at http://127.0.0.1:{SUPERVISOR_PORT}/status")
+    async with aiohttp.ClientSession() as session:
+        tasks = [asyncio.create_task(s.run([services[d] for d in s.after], session)) for s in ordered]
+        try:
+            await stop_event.wait()
+        finally:
+            print("\nStopping agents...")
+            for t in tasks:
+                t.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.gather(*tasks, return_exceptions=True)
+            # Dependents first
+            for s in reversed(ordered):
+                await s.stop()
+            await runner.cleanup()
 
 
 if __name__ == "__main__":
-    import contextlib
+    parser = argparse.ArgumentParser(description="Run and supervise all CareerPilot agents")
+    parser.add_argument(
+        "--shared-knowledge",
+        action="store_true",
+        help="host the MeTTa knowledge base once and let every agent query it",
+    )
+    args = parser.parse_args()
     try:
-        asyncio.run(main())
+        asyncio.run(main(shared_knowledge=args.shared_knowledge))
     except KeyboardInterrupt:
         pass
-
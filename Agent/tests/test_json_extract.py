@@ -0,0 +1,121 @@
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from llm import extract_json  # noqa: E402
+
+PROPERTY_SEEDS = range(20)
+PROPERTY_CASES = 100
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1}', {"a": 1}),
+        ('Here you go: {"a": [1, 2]} thanks', {"a": [1, 2]}),
+        ('Sure!\n```json\n{"a": "x"}\n```\nDone.', {"a": "x"}),
+        ('```JSON\r\n{"a": 1}\r\n```', {"a": 1}),
+        ('```\n{"a": 1}', {"a": 1}),
+        ('```json{"a": 1}```', {"a": 1}),
+        ('Braces } and ] in prose, then {"a": "}{"}', {"a": "}{"}),
+        ('{"s": "quote \\" and brace { inside"}', {"s": 'quote " and brace { inside'}),
+        ('See [the notes] and {"a": 1}', {"a": 1}),
+        ('{"a": 1,} broken, then {"b": 2}', {"b": 2}),
+    ],
+)
+def test_extracts_embedded_value(text, expected):
+    assert extract_json(text, dict) == expected
+
+
+def test_expect_skips_values_of_the_wrong_shape():
+    assert extract_json('Example: [1, 2]. Answer: {"a": 1}', dict) == {"a": 1}
+    assert extract_json('{"a": 1} and [3]', list) == [3]
+    assert extract_json('[1, 2] {"a": 1}') == [1, 2]
+
+
+def test_inner_values_of_a_skipped_value_are_not_returned():
+    assert extract_json('[{"inner": 1}] then {"outer": 2}', dict) == {"outer": 2}
+    with pytest.raises(ValueError):
+        extract_json('[{"inner": 1}]', dict)
+
+
+def test_broken_value_is_skipped_whole():
+    assert extract_json('{"a": [1, 2,], "b": {"inner": 1}} tail {"c": 3}', dict) == {"c": 3}
+
+
+def test_truncated_value_does_not_yield_an_inner_object():
+    text = '{"questions": [{"q": "one"}, {"q": "two"}, {"q": "thr'
+    with pytest.raises(ValueError):
+        extract_json(text, dict)
+    with pytest.raises(ValueError):
+        extract_json("```json\n" + text + "\n```", dict)
+
+
+def test_fenced_block_falls_back_to_the_whole_text():
+    assert extract_json('```\nnot json\n```\n{"a": 1}', dict) == {"a": 1}
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "{", "[1, 2", '{"a": }'])
+def test_raises_when_nothing_parses(text):
+    with pytest.raises(ValueError):
+        extract_json(text, dict)
+
+
+def test_deep_nesting_raises_value_error():
+    with pytest.raises(ValueError):
+        extract_json("[" * 100000 + "]" * 100000, list)
+    with pytest.raises(ValueError):
+        extract_json("{" * 100000, dict)
+
+
+def test_many_unclosed_candidates_scan_in_linear_time():
+    # Each candidate used to be re-parsed up to the end of the text
+    text = '{"a": ' * 20000
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        extract_json(text, dict)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_large_payload_round_trips():
+    value = {"questions": [{"q": f"Explain {{topic}} #{i}?", "tags": ["a", "b"]} for i in range(5000)]}
+    assert extract_json("lorem ipsum " * 1000 + json.dumps(value, indent=2), dict) == value
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(7 if depth < 4 else 4)
+    if kind == 0:
+        return rng.randint(-10 ** 6, 10 ** 6)
+    if kind == 1:
+        return "".join(rng.choice('ab{}[]"\\ \n\r`é') for _ in range(rng.randrange(12)))
+    if kind == 2:
+        return rng.choice([True, False, None])
+    if kind == 3:
+        return rng.random()
+    if kind == 4:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return {f"k{i}{rng.choice('{}[]')}": random_value(rng, depth + 1) for i in range(rng.randrange(5))}
+
+
+def wrap(rng: random.Random, text: str) -> str:
+    prose = rng.choice(["", "Here you go:", "Sure! The result is", "Note: braces } and ] in prose.", "See [1] and [2]:"])
+    newline = rng.choice(["\n", "\r\n", ""])
+    if rng.random() < 0.5:
+        return f"{prose}{newline}```{rng.choice(['json', 'JSON', ''])}{newline}{text}{newline}```{newline}Thanks."
+    return f"{prose} {text} trailing words"
+
+
+@pytest.mark.parametrize("seed", PROPERTY_SEEDS)
+def test_round_trips_random_values_embedded_in_prose_and_fences(seed):
+    # Property: any JSON object, however serialized and wrapped, comes back unchanged
+    rng = random.Random(seed)
+    for _ in range(PROPERTY_CASES):
+        value = {"payload": random_value(rng)}
+        text = wrap(rng, json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2])))
+        assert extract_json(text, dict) == value, text
@@ -0,0 +1,35 @@
+import { NextResponse } from 'next/server';
+
+export async function POST(request: Request) {
+  try {
+    const { resume, format = 'pdf' } = await request.json();
+
+    if (!resume || resume.trim().length === 0) {
+      return NextResponse.json({ error: 'Resume text is required' }, { status: 400 });
+    }
+
+    const uAgentUrl = `${process.env.UAGENT_RESUME_BASE_URL}/resume/export`;
+
+    const response = await fetch(uAgentUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ resume, format }),
+    });
+
+    const data = await response.json();
+    if (response.ok && data.file) {
+      return new NextResponse(Buffer.from(data.file, 'base64'), {
+        headers: {
+          'Content-Type': data.mediaType,
+          'Content-Disposition': `attachment; filename="${data.filename}"`,
+          ETag: `"${data.digest}"`,
+        },
+      });
+    } else {
+      return NextResponse.json({ error: data.error || 'Error communicating with uAgent' }, { status: response.ok ? 502 : response.status });
+    }
+  } catch (error) {
+    console.error('Error exporting resume:', error);
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
+  }
+}
@@ -2,7 +2,8 @@ import { NextResponse } from 'next/server';
 
 export async function POST(request: Request) {
   try {
-    const { jobDescription } = await request.json();
+    // A profileId switches to tailoring that profile's base resume (API clients only; the resume builder sends none)
+    const { jobDescription, profileId, mode = profileId ? 'tailored' : 'sections' } = await request.json();
 
     if (!jobDescription || jobDescription.trim().length === 0) {
       return NextResponse.json({ error: 'Job description is required' }, { status: 400 });
@@ -13,7 +14,7 @@ export async function POST(request: Request) {
     const response = await fetch(uAgentUrl, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ jobDescription }),
+      body: JSON.stringify({ jobDescription, mode, profileId }),
     });
 
     const data = await response.json();
@@ -71,6 +71,7 @@ export default function InterviewPage() {
           });
           if (!qRes.ok) throw new Error("Failed to fetch interview questions");
           const qData = await qRes.json();
+          if (qData.error) throw new Error(qData.error);
           const questionTexts: string[] = qData.questions || [];
 
           const formattedQuestions: InterviewQuestion[] = questionTexts.map(
@@ -92,6 +93,7 @@ export default function InterviewPage() {
             questions: formattedQuestions,
             responses: [],
             status: "in-progress",
+            agentSessionId: qData.sessionId,
             settings: {
               duration: 15, // Default to 15 minutes
               difficultyLevel: "intermediate",
@@ -202,6 +204,7 @@ export default function InterviewPage() {
           profile: userProfile,
           question: currentQuestion.text,
           response: transcript,
+          sessionId: currentSession.agentSessionId,
         }),
       });
       if (!aRes.ok) throw new Error("Failed to analyze response");
@@ -48,15 +48,19 @@ export default function ResultsPage() {
         const res = await fetch('/api/interviewer/feedback', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
+          // The agent uses its live session when it still has it; the transcript
+          // covers a session lost to a restart or expiry
           body: JSON.stringify({
             profile: userProfile,
+            sessionId: currentSession.agentSessionId,
             questions,
             responses,
-            analyses
+            analyses,
           })
         });
         if (!res.ok) throw new Error('Failed to generate feedback');
         const data = await res.json();
+        if (data.error) throw new Error(data.error);
         const feedbackData = data.feedback;
         
         const newFeedback: InterviewFeedback = {
@@ -11,6 +11,7 @@ export default function ResumePage() {
   const [resumeText, setResumeText] = useState<string>('');
   const [loading, setLoading] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
+  const [exporting, setExporting] = useState<'pdf' | 'docx' | null>(null);
 
   const generateResume = async () => {
     setLoading(true);
@@ -37,14 +38,33 @@ export default function ResumePage() {
     }
   };
 
-  const downloadAsDoc = () => {
-    const blob = new Blob([resumeText], { type: 'application/msword' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = 'custom_resume.doc';
-    a.click();
-    URL.revokeObjectURL(url);
+  const downloadAs = async (format: 'pdf' | 'docx') => {
+    setExporting(format);
+    setError(null);
+    try {
+      const res = await fetch('/api/export-resume', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ resume: resumeText, format }),
+      });
+      if (!res.ok) {
+        const data = await res.json();
+        throw new Error(data.error || 'Failed to export resume');
+      }
+      const blob = await res.blob();
+      const url = URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `custom_resume.${format}`;
+      a.click();
+      URL.revokeObjectURL(url);
+    } catch (err) {
+      const errorMessage = err instanceof Error ? err.message : 'Failed to export resume. Please try again.';
+      setError(errorMessage);
+      console.error('Resume export failed:', err);
+    } finally {
+      setExporting(null);
+    }
   };
 
   return (
@@ -87,7 +107,12 @@ export default function ResumePage() {
                 onChange={(e) => setResumeText(e.target.value)}
               />
               <div className="flex gap-4 mt-4">
-                <Button onClick={downloadAsDoc}>Download as .doc</Button>
+                <Button onClick={() => downloadAs('pdf')} disabled={exporting !== null}>
+                  {exporting === 'pdf' ? 'Exporting...' : 'Download as PDF'}
+                </Button>
+                <Button onClick={() => downloadAs('docx')} disabled={exporting !== null}>
+                  {exporting === 'docx' ? 'Exporting...' : 'Download as .docx'}
+                </Button>
                 <Button variant="ghost" onClick={() => window.location.href = '/dashboard'}>
                   Cancel
                 </Button>
@@ -1,7 +1,6 @@
 "use client";
 
 import { useState } from "react";
-import { jsPDF } from "jspdf";
 import { Download, Printer, Share2 } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import {
@@ -23,100 +22,68 @@ export function ResumeExport({ results, fileName }: ResumeExportProps) {
   const [isExporting, setIsExporting] = useState(false);
   const { toast } = useToast();
   
-  const exportToPDF = async () => {
+  // Plain-text report in the layout the server export understands: "## " headings and "- " bullets
+  const reportText = () => {
+    const lines = [
+      "## Resume Analysis Report",
+      `Generated on ${new Date().toLocaleDateString()}`,
+      ...(fileName ? [`Resume: ${fileName}`] : []),
+      "",
+      "## ATS Score",
+      `${results.atsScore}% - ${results.atsScore >= 70 ? "Good" : "Needs Improvement"}`,
+      "",
+      "## Score Breakdown",
+      ...results.scoreBreakdown.map(item => `- ${item.category}: ${item.score}%`),
+      "",
+      "## Key Improvement Suggestions",
+    ];
+    results.improvementSuggestions
+      .filter(item => item.priority === "high")
+      .slice(0, 3)
+      .forEach(suggestion => {
+        lines.push(`- ${suggestion.title}`, suggestion.description);
+      });
+    if (results.jobRecommendations.length > 0) {
+      lines.push("", "## Top Job Matches");
+      results.jobRecommendations.slice(0, 3).forEach(job => {
+        lines.push(`- ${job.title} (${job.matchPercentage}% match)`, `${job.company} - ${job.location}`);
+      });
+    }
+    return lines.join("\n");
+  };
+
+  // Rendered by the resume agent's /resume/export, the same path as the resume builder's downloads
+  const exportAs = async (format: "pdf" | "docx") => {
     setIsExporting(true);
     try {
-      const doc = new jsPDF();
-      
-      // Title
-      doc.setFontSize(22);
-      doc.text("Resume Analysis Report", 20, 20);
-      
-      // Subtitle with date
-      doc.setFontSize(12);
-      doc.text(`Generated on ${new Date().toLocaleDateString()}`, 20, 30);
-      if (fileName) {
-        doc.text(`Resume: ${fileName}`, 20, 38);
-      }
-      
-      // Score
-      doc.setFontSize(16);
-      doc.text("ATS Score", 20, 50);
-      doc.setFontSize(14);
-      doc.text(`${results.atsScore}% - ${results.atsScore >= 70 ? "Good" : "Needs Improvement"}`, 20, 58);
-      
-      // Score breakdown
-      doc.setFontSize(16);
-      doc.text("Score Breakdown", 20, 70);
-      let yPos = 78;
-      results.scoreBreakdown.forEach(item => {
-        doc.setFontSize(12);
-        doc.text(`${item.category}: ${item.score}%`, 25, yPos);
-        yPos += 8;
+      const res = await fetch("/api/export-resume", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ resume: reportText(), format }),
       });
-      
-      // Top suggestions
-      doc.setFontSize(16);
-      doc.text("Key Improvement Suggestions", 20, yPos + 10);
-      yPos += 18;
-      
-      const highPrioritySuggestions = results.improvementSuggestions
-        .filter(item => item.priority === "high")
-        .slice(0, 3);
-      
-      highPrioritySuggestions.forEach(suggestion => {
-        doc.setFontSize(12);
-        doc.text(suggestion.title, 25, yPos);
-        yPos += 6;
-        doc.setFontSize(10);
-        
-        // Split long descriptions into multiple lines
-        const description = suggestion.description;
-        const splitText = doc.splitTextToSize(description, 170);
-        doc.text(splitText, 25, yPos);
-        yPos += 6 * splitText.length + 8;
-      });
-      
-      // Top job matches
-      if (results.jobRecommendations.length > 0) {
-        doc.setFontSize(16);
-        doc.text("Top Job Matches", 20, yPos);
-        yPos += 8;
-        
-        results.jobRecommendations.slice(0, 3).forEach(job => {
-          doc.setFontSize(12);
-          doc.text(`${job.title} (${job.matchPercentage}% match)`, 25, yPos);
-          yPos += 6;
-          doc.setFontSize(10);
-          doc.text(`${job.company} - ${job.location}`, 25, yPos);
-          yPos += 10;
-        });
-      }
-      
-      // Footer
-      const pageCount = doc.getNumberOfPages();
-      for (let i = 1; i <= pageCount; i++) {
-        doc.setPage(i);
-        doc.setFontSize(10);
-        doc.text('Resume Analyzer - ATS Score Report', 20, doc.internal.pageSize.height - 10);
-        doc.text(`Page ${i} of ${pageCount}`, doc.internal.pageSize.width - 40, doc.internal.pageSize.height - 10);
+      if (!res.ok) {
+        const data = await res.json();
+        throw new Error(data.error || "Failed to export analysis");
       }
-      
-      const outputFileName = fileName 
-        ? `${fileName.split('.')[0]}_ATS_Analysis.pdf`
-        : 'Resume_ATS_Analysis.pdf';
-        
-      doc.save(outputFileName);
-      
+      const blob = await res.blob();
+      const url = URL.createObjectURL(blob);
+      const a = document.createElement("a");
+      a.href = url;
+      a.download = fileName
+        ? `${fileName.split('.')[0]}_ATS_Analysis.${format}`
+        : `Resume_ATS_Analysis.${format}`;
+      a.click();
+      URL.revokeObjectURL(url);
+
       toast({
         title: "Export Complete",
-        description: "Your analysis has been exported to PDF",
+        description: `Your analysis has been exported to ${format.toUpperCase()}`,
       });
     } catch (error) {
-      console.error('PDF export error:', error);
+      console.error('Analysis export error:', error);
       toast({
         title: "Export Failed",
-        description: "There was an error exporting to PDF. Please try again.",
+        description: `There was an error exporting to ${format.toUpperCase()}. Please try again.`,
         variant: "destructive",
       });
     } finally {
@@ -160,10 +127,14 @@ export function ResumeExport({ results, fileName }: ResumeExportProps) {
         </Button>
       </DropdownMenuTrigger>
       <DropdownMenuContent align="end">
-        <DropdownMenuItem onClick={exportToPDF} disabled={isExporting}>
+        <DropdownMenuItem onClick={() => exportAs("pdf")} disabled={isExporting}>
           <Download className="h-4 w-4 mr-2" />
           <span>Export as PDF</span>
         </DropdownMenuItem>
+        <DropdownMenuItem onClick={() => exportAs("docx")} disabled={isExporting}>
+          <Download className="h-4 w-4 mr-2" />
+          <span>Export as Word</span>
+        </DropdownMenuItem>
         <DropdownMenuItem onClick={handlePrint}>
           <Printer className="h-4 w-4 mr-2" />
           <span>Print</span>
@@ -67,6 +67,7 @@ export interface InterviewSession {
   responses: InterviewResponse[];
   status: 'scheduled' | 'in-progress' | 'completed';
   settings: InterviewSettings;
+  agentSessionId?: string; // interviewer agent's server-side session
 }
 
 export interface InterviewSettings {
@@ -184,6 +185,7 @@ export interface InterviewSession {
   responses: InterviewResponse[];
   status: 'scheduled' | 'in-progress' | 'completed';
   settings: InterviewSettings;
+  agentSessionId?: string; // interviewer agent's server-side session
 }
 
 export interface InterviewSettings {